@@ -67,12 +67,28 @@ Replacement Variables:
 Help text and Type hints:
 -------------------------
 
+
+Snapshots:
+----------
+
+Looking up an entry in a Configuration goes through the profiles, master
+section and fallback configuration, and converting it (e.g. with `.float` or
+`.path`) parses the string value each time. For code reading the same entries
+many times, a read-only snapshot can be used instead. In the snapshot
+{$}-variables are replaced by the configuration variables, and each conversion
+is only done once. The snapshot is rebuilt when the configuration, profiles or
+variables change:
+
+    >>> cfg.snapshot().midgard.foo_pi.float
+    3.14
+
 """
 
 # Standard library imports
 import builtins
 from configparser import ConfigParser, BasicInterpolation, ExtendedInterpolation
 from contextlib import contextmanager
+import copy
 import datetime as stdlib_datetime
 import os.path
 import pathlib
@@ -123,6 +139,8 @@ class Configuration:
             name:  Name of configuration.
         """
         self.name = name
+        self._generation: int = 0  # Incremented whenever sections, fallback or master section are changed
+        self._snapshot: Optional["ConfigurationSnapshot"] = None
         self.fallback_config = None
         self.master_section = None
 
@@ -225,6 +243,7 @@ class Configuration:
 
     def _set_sections_for_profiles(self) -> None:
         """Update sections according to profiles"""
+        self._generation += 1
         self._sections.clear()
 
         # Add values in reverse order so that the first profile is prioritized
@@ -246,6 +265,7 @@ class Configuration:
     @fallback_config.setter
     def fallback_config(self, cfg: Optional["Configuration"]) -> None:
         """Set the fallback configuration"""
+        self._generation += 1
         self._fallback_config = cfg
 
     @property
@@ -263,6 +283,7 @@ class Configuration:
     @master_section.setter
     def master_section(self, section: Optional[str]) -> None:
         """Set the master section"""
+        self._generation += 1
         self._master_section = section
 
     def get(
@@ -542,6 +563,7 @@ class Configuration:
 
     def clear(self) -> None:
         """Clear the configuration"""
+        self._generation += 1
         self._sections.clear()
         self.clear_vars()
 
@@ -597,6 +619,22 @@ class Configuration:
         getters = dict() if getters is None else getters
         return {k: v.as_dict(getters=getters.get(k), default_getter=default_getter) for k, v in self._sections.items()}
 
+    def snapshot(self) -> "ConfigurationSnapshot":
+        """Read-only snapshot of the configuration
+
+        In the snapshot all entries have their {$}-variables replaced by the configuration variables, and conversions
+        of entries (like `.float`, `.list` or `.path`) are only done the first time they are used. The same snapshot
+        is returned until the configuration is changed, either by updating entries, changing profiles, fallback
+        configuration or master section, or by changing the configuration variables.
+
+        Returns:
+            Snapshot of the configuration.
+        """
+        snapshot = self._snapshot
+        if snapshot is None or snapshot._generation != self._generation or snapshot.vars != self._vars_dict:
+            snapshot = self._snapshot = ConfigurationSnapshot(self)
+        return snapshot
+
     def __getitem__(self, key: str) -> Union["ConfigurationSection", "ConfigurationEntry"]:
         """Get a section or entry from the master section from the configuration"""
         if key in self.section_names:
@@ -616,10 +654,12 @@ class Configuration:
 
     def __delitem__(self, key: str) -> None:
         """Delete a section from the configuration"""
+        self._generation += 1
         del self._sections[key]
 
     def __delattr__(self, key: str) -> None:
         """Delete a section from the configuration"""
+        self._generation += 1
         del self._sections[key]
 
     def __dir__(self) -> List[str]:
@@ -1082,6 +1122,217 @@ class ConfigurationEntry:
         return f"{self.__class__.__name__}(key='{self._key}', value='{self._value}')"
 
 
+class ConfigurationSnapshot:
+    """Read-only snapshot of a Configuration, see `Configuration.snapshot`"""
+
+    def __init__(self, cfg: Configuration) -> None:
+        """Create a snapshot of a Configuration
+
+        Args:
+            cfg:  Configuration to create snapshot of.
+        """
+        self.name = cfg.name
+        self.vars: ConfigVars = dict(cfg.vars)
+        self._generation = cfg._generation
+        self._fallback_config = cfg._fallback_config
+        self._master_section = cfg._master_section
+        self._sections: Dict[str, "FrozenConfigurationSection"] = {
+            name: FrozenConfigurationSection(section, self.vars) for name, section in cfg._sections.items()
+        }
+
+    @property
+    def section_names(self) -> List[str]:
+        """Names of sections in snapshot"""
+        return list(self._sections.keys())
+
+    @property
+    def sections(self) -> List["FrozenConfigurationSection"]:
+        """Sections in snapshot"""
+        return list(self._sections.values())
+
+    @property
+    def master_section(self) -> "FrozenConfigurationSection":
+        """The master section"""
+        if self._master_section is None:
+            raise exceptions.MissingSectionError(f"Configuration {self.name!r} has not defined a master section")
+        try:
+            return self._sections[self._master_section]
+        except KeyError:
+            raise exceptions.MissingSectionError(
+                f"Master section {self._master_section!r} does not exist in configuration {self.name!r}"
+            ) from None
+
+    @property
+    def fallback_config(self) -> "ConfigurationSnapshot":
+        """Snapshot of the fallback configuration"""
+        if self._fallback_config is None:
+            raise exceptions.MissingConfigurationError(
+                f"Configuration '{self.name}' has not defined a fallback configuration"
+            )
+        return self._fallback_config.snapshot()
+
+    def get(
+        self, key: str, value: Optional[str] = None, section: Optional[str] = None, default: Optional[str] = None
+    ) -> "ConfigurationEntry":
+        """Get an entry from the snapshot with possibility for override and default value
+
+        See `Configuration.get` for details.
+
+        Args:
+            key:      Name of option (key in the configuration entry).
+            value:    Value of entry. Used for overriding the configuration.
+            section:  Section in the configuration in which to look up the key.
+            default:  Default value that is returned if value is not found any other way.
+
+        Returns:
+            Entry representing the value.
+        """
+        if value is not None:
+            return ConfigurationEntry(key, value=value, source="method call", vars_dict=self.vars)
+
+        try:
+            section_value = self.master_section if section is None else self[section]
+            if isinstance(section_value, ConfigurationEntry):
+                return section_value
+            else:
+                return section_value[key]
+        except (exceptions.MissingSectionError, exceptions.MissingEntryError) as err:
+            try:
+                return self.fallback_config.get(key=key, section=section)
+            except (exceptions.MissingConfigurationError, exceptions.MissingEntryError):
+                if default is None:
+                    # Raise original error
+                    raise err
+                else:
+                    return ConfigurationEntry(key, value=default, source="default value", vars_dict=self.vars)
+
+    def exists(self, key: str, section: Optional[str] = None) -> bool:
+        """Check if a configuration entry exists
+
+        Args:
+            key:      Name of option (key in the configuration entry).
+            section:  Section in the configuration in which to look up the key.
+
+        Returns:
+            True if the configuration entry exists, otherwise False.
+        """
+        if section is None:
+            return self.master_section.exists(key)
+
+        try:
+            cfg_section = self[section]
+        except (exceptions.MissingSectionError, exceptions.MissingEntryError):
+            return False
+
+        return not isinstance(cfg_section, ConfigurationEntry) and cfg_section.exists(key)
+
+    def __getitem__(self, key: str) -> Union["FrozenConfigurationSection", "ConfigurationEntry"]:
+        """Get a section or entry from the master section from the snapshot"""
+        try:
+            return self._sections[key]
+        except KeyError:
+            pass
+
+        try:
+            return self.master_section[key]
+        except exceptions.MissingSectionError:
+            try:
+                return self.fallback_config[key]
+            except exceptions.MidgardException:
+                raise exceptions.MissingSectionError(f"Configuration {self.name!r} has no section {key!r}") from None
+
+    def __getattr__(self, key: str) -> Union["FrozenConfigurationSection", "ConfigurationEntry"]:
+        """Get a section or entry from the master section from the snapshot"""
+        if key.startswith("_"):
+            raise AttributeError(key)
+        return self[key]
+
+    def __repr__(self) -> str:
+        """A simple string representation of the snapshot"""
+        return f"{self.__class__.__name__}(name='{self.name}')"
+
+
+class FrozenConfigurationSection(ConfigurationSection):
+    """Read-only configuration section with frozen entries"""
+
+    def __init__(self, section: ConfigurationSection, vars_dict: ConfigVars) -> None:
+        super().__init__(section.name)
+        self.data = {key: FrozenConfigurationEntry(entry, vars_dict) for key, entry in section.data.items()}
+
+    def __setitem__(self, key: str, value: "ConfigurationEntry") -> None:
+        raise TypeError(f"Configuration section '{self.name}' in snapshot can not be changed")
+
+    def __delitem__(self, key: str) -> None:
+        raise TypeError(f"Configuration section '{self.name}' in snapshot can not be changed")
+
+
+def _frozen_property(name: str) -> property:
+    """Property remembering the converted value of a ConfigurationEntry property
+
+    Mutable values (lists and dictionaries) are copied, so that the remembered value can not be changed.
+
+    Args:
+        name:  Name of ConfigurationEntry property.
+
+    Returns:
+        Property of FrozenConfigurationEntry.
+    """
+    convert = getattr(ConfigurationEntry, name).fget
+
+    def getter(self: "FrozenConfigurationEntry") -> Any:
+        try:
+            return self._converted[name]
+        except KeyError:
+            value = self._converted[name] = convert(self)
+            return value
+
+    def copying_getter(self: "FrozenConfigurationEntry") -> Any:
+        try:
+            return self._converted[name].copy()
+        except KeyError:
+            value = self._converted[name] = convert(self)
+            return value.copy()
+
+    if name in ("list", "dict"):
+        getter = copying_getter
+    getter.__doc__ = convert.__doc__
+    return property(getter)
+
+
+class FrozenConfigurationEntry(ConfigurationEntry):
+    """ConfigurationEntry with {$}-variables replaced where conversions are only done once
+
+    The entry shares the record of how it is used with the original entry.
+    """
+
+    def __init__(self, entry: ConfigurationEntry, vars_dict: ConfigVars) -> None:
+        super().__init__(
+            entry._key,
+            value=_replace(entry._value, vars_dict) if "{" in entry._value else entry._value,
+            source=entry.source,
+            meta=entry.meta,
+            vars_dict=vars_dict,
+            _used_as=entry._used_as,
+        )
+        self._original_value = entry._value
+        self._converted: Dict[builtins.str, Any] = dict()
+
+    int = _frozen_property("int")
+    float = _frozen_property("float")
+    bool = _frozen_property("bool")
+    date = _frozen_property("date")
+    datetime = _frozen_property("datetime")
+    path = _frozen_property("path")
+    list = _frozen_property("list")
+    tuple = _frozen_property("tuple")
+    dict = _frozen_property("dict")
+
+    def replace(self, default: Optional[builtins.str] = None, **replace_vars: builtins.str) -> "ConfigurationEntry":
+        """Replace {$}-variables in the original value of the entry"""
+        value = _replace(self._original_value, builtins.dict(self._vars_dict, **replace_vars), default)
+        return ConfigurationEntry(key=self._key, value=value, source=self.source, _used_as=self._used_as)
+
+
 def _replace(string: str, replace_vars: Dict[str, str], default: Optional[str] = None) -> str:
     """Replace format style variables in a string
 
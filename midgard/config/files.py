@@ -25,17 +25,15 @@ import builtins
 from contextlib import contextmanager
 import gzip
 import itertools
+import os
 import pathlib
 import re
-from typing import Any, Dict, Iterator, List, Optional, Set, TypeVar
-
-# Third party imports
-import pycurl
+from typing import Any, Dict, Hashable, Iterable, Iterator, List, Optional, Set, Tuple, TypeVar
 
 # Midgard imports
-from midgard.config.config import Configuration
-from midgard.dev import console
+from midgard.config.config import Configuration, ConfigurationSnapshot
 from midgard.dev import log
+from midgard.files import download
 from midgard.files import files
 from midgard.files import url
 
@@ -47,6 +45,18 @@ class FileConfiguration(Configuration):
     """Configuration for handling files"""
 
     download_missing = True
+    download_max_host_connections = 4
+    download_max_connections = 16
+
+    def __init__(self, name: str) -> None:
+        """Initialize a FileConfiguration
+
+        Args:
+            name:  Name of configuration.
+        """
+        super().__init__(name)
+        self._path_cache: Dict[Hashable, Any] = dict()
+        self._path_cache_snapshot: Optional[ConfigurationSnapshot] = None
 
     @contextmanager
     def open(
@@ -182,7 +192,11 @@ class FileConfiguration(Configuration):
             aliases = <filename1>, <filename2>, ...
             directory_aliases = <directory1>, <directory2>, ...
         
-        Note, aliases are checked as ordered in the configuration file.
+        Note, aliases are checked as ordered in the configuration file. All candidate paths in the same directory are
+        checked with one scan of the directory.
+
+        Resolved paths are cached until the configuration is updated. Only paths that do not depend on the file
+        system, or that are found to exist, are cached. Use `clear_path_cache` if files are deleted while running.
 
         Args:
             file_key (String):        Key that is looked up in the configuration.
@@ -196,35 +210,141 @@ class FileConfiguration(Configuration):
             Path: Full path with replaced variables in file name and path.
         """
         file_vars = dict() if file_vars is None else file_vars
-        directory = self[file_key].directory.replace(default=default, **file_vars).path
-        file_name = self[file_key].filename.replace(default=default, **file_vars).path
-        file_path = self._replace_gz(directory / file_name, is_zipped)
-
-        # Check for aliases
-        if use_aliases and not self._path_exists(file_path):
-            aliases = self.get("aliases", section=file_key, default="").replace(default=default, **file_vars).list
-            aliases_dirs = self.get("directory_aliases", section=file_key, default="").replace(default=default, **file_vars).list
-            if aliases_dirs:
-                aliases.insert(0, str(file_name))
-                aliases_dirs.insert(0,str(directory))
-                for alias_dir in aliases_dirs:
-                    for alias in aliases:
-                        aliased_path = self._replace_gz(pathlib.Path(alias_dir) / pathlib.Path(alias), is_zipped)
-                        if self._path_exists(aliased_path):
-                            return aliased_path     
-            else:
-                for alias in aliases:
-                    aliased_path = self._replace_gz(file_path.with_name(alias), is_zipped)
-                    if self._path_exists(aliased_path):
-                        return aliased_path
+        cache = self._get_path_cache()
+        try:
+            cache_key: Optional[Hashable] = (file_key, frozenset(file_vars.items()), default, is_zipped, use_aliases)
+            file_path, exists = cache[cache_key]
+        except TypeError:  # Unhashable file variables, do not use cache
+            cache_key = None
+            file_path, exists = self._resolve_path(file_key, file_vars, default, is_zipped, use_aliases)
+        except KeyError:
+            file_path, exists = self._resolve_path(file_key, file_vars, default, is_zipped, use_aliases)
+            if exists is not False:
+                cache[cache_key] = (file_path, exists)
 
         # Try to download the file if it is missing
-        if download_missing and not self._path_exists(file_path):
+        if download_missing and not exists and not self._path_exists(file_path):
             downloaded_file_path = self.download_file(file_key, file_vars, file_path, is_zipped=is_zipped)
             if downloaded_file_path is not None:
                 file_path = downloaded_file_path
         return file_path
 
+    def _resolve_path(
+        self,
+        file_key: str,
+        file_vars: Dict[str, str],
+        default: Optional[str],
+        is_zipped: Optional[bool],
+        use_aliases: bool,
+    ) -> Tuple[pathlib.Path, Optional[bool]]:
+        """Construct a filepath for a given file with variables, see `path`
+
+        Returns:
+            Tuple with file path and whether the path exists. Existence is None if the file system was not checked.
+        """
+        cfg = self._path_cache_snapshot
+        directory = cfg[file_key].directory.replace(default=default, **file_vars).path
+        file_name = cfg[file_key].filename.replace(default=default, **file_vars).path
+        file_path = directory / file_name
+        if not use_aliases:
+            if "{gz}" not in file_name.name:
+                return file_path, None
+            return self._replace_gz(file_path, is_zipped), False
+
+        # Check path and aliases in the order given in the configuration
+        aliases = cfg.get("aliases", section=file_key, default="").replace(default=default, **file_vars).list
+        aliases_dirs = cfg.get("directory_aliases", section=file_key, default="")
+        aliases_dirs = aliases_dirs.replace(default=default, **file_vars).list
+        candidates = [file_path]
+        if aliases_dirs:
+            aliases.insert(0, str(file_name))
+            aliases_dirs.insert(0, str(directory))
+            candidates += [
+                pathlib.Path(alias_dir) / pathlib.Path(alias) for alias_dir in aliases_dirs for alias in aliases
+            ]
+        else:
+            candidates += [file_path.with_name(alias) for alias in aliases]
+
+        existing_path = self._first_existing_path(candidates, is_zipped)
+        if existing_path is None:
+            return self._replace_gz(file_path, is_zipped), False
+        return existing_path, True
+
+    def _first_existing_path(
+        self, candidates: List[pathlib.Path], is_zipped: Optional[bool] = None
+    ) -> Optional[pathlib.Path]:
+        """Find the first candidate path that exists
+
+        The {gz} pattern in the candidates is replaced as in `_replace_gz`. Directories with more than one candidate
+        are scanned once, and only candidates found in the directory listing are checked separately. Names are
+        compared with `os.path.normcase`, so that the check is case-insensitive where the file system is, and a
+        listed name is confirmed with `_path_exists` so that for instance broken symbolic links are not used.
+
+        Args:
+            candidates:  Paths to check, in prioritized order.
+            is_zipped:   True, False or None. If None automatically decide.
+
+        Returns:
+            First existing path with {gz} replaced, or None if none of the paths exist.
+        """
+        num_names: Dict[pathlib.Path, int] = dict()
+        for candidate in candidates:
+            num_names[candidate.parent] = num_names.get(candidate.parent, 0) + 1 + ("{gz}" in candidate.name)
+
+        listings: Dict[pathlib.Path, Set[str]] = dict()
+        for candidate in candidates:
+            directory = candidate.parent
+            if num_names[directory] < 2:
+                candidate = self._replace_gz(candidate, is_zipped)
+                if self._path_exists(candidate):
+                    return candidate
+                continue
+
+            if directory not in listings:
+                try:
+                    listings[directory] = {os.path.normcase(name) for name in os.listdir(directory)}
+                except (OSError, ValueError):  # Directory does not exist or the path contains invalid characters
+                    listings[directory] = set()
+            names = listings[directory]
+
+            file_name = candidate.name
+            if "{gz}" in file_name:
+                zipped_path = candidate.with_name(file_name.replace("{gz}", ".gz"))
+                zipped = self._is_listed(zipped_path, names) if is_zipped is None else is_zipped
+                file_name = file_name.replace("{gz}", ".gz" if zipped else "")
+            if self._is_listed(candidate.with_name(file_name), names):
+                return candidate.with_name(file_name)
+
+        return None
+
+    def _is_listed(self, file_path: pathlib.Path, names: Set[str]) -> bool:
+        """Check if a path exists, using the normcased names listed in its directory to avoid most file system calls
+
+        Args:
+            file_path:  Path to a file.
+            names:      Names in the directory of file_path, normalized with `os.path.normcase`.
+
+        Returns:
+            Whether path exists or not.
+        """
+        return os.path.normcase(file_path.name) in names and self._path_exists(file_path)
+
+    def _get_path_cache(self) -> Dict[Hashable, Any]:
+        """Get cache of resolved paths, cleared if the configuration has changed since last use"""
+        snapshot = self.snapshot()
+        if snapshot is not self._path_cache_snapshot:
+            self._path_cache.clear()
+            self._path_cache_snapshot = snapshot
+        return self._path_cache
+
+    def clear_path_cache(self) -> None:
+        """Clear cache of resolved paths
+
+        The cache is automatically cleared when the configuration is updated. Clearing it explicitly is only
+        necessary if files have been deleted or renamed since the paths were resolved.
+        """
+        self._path_cache.clear()
+
     def aliased_path(
         self,
         file_key: str,
@@ -393,7 +513,7 @@ class FileConfiguration(Configuration):
         Use pycurl (libcurl) to do the actual downloading. Requests might be
         nicer for this, but turned out to be much slower (and in practice
         unusable for bigger files) and also not really supporting
-        ftp-downloads.
+        ftp-downloads. See `download_files` for downloading many files at once.
 
         Args:
             file_key:     File key that should be downloaded.
@@ -405,6 +525,68 @@ class FileConfiguration(Configuration):
         Returns:
             Path to downloaded file, None if no file was downloaded.
         """
+        manager = self._download_manager(create_dirs=create_dirs)
+        file_path = self._add_download(manager, file_key, file_vars, file_path, **path_args)
+        if file_path is not None:
+            manager.download()
+        return file_path
+
+    def download_files(
+        self,
+        file_keys_vars: Iterable[Tuple[str, Optional[Dict[str, str]]]],
+        create_dirs: bool = True,
+        **path_args: Any,
+    ) -> List[Optional[pathlib.Path]]:
+        """Download many files from the web concurrently
+
+        The files are downloaded by a `midgard.files.download.DownloadManager`, which limits the number of
+        connections to each host (see the `download_max_host_connections` and `download_max_connections` class
+        variables) and reuses connections for files on the same host. Files are written atomically, and partial
+        downloads are resumed.
+
+        Args:
+            file_keys_vars:  File keys and file variables of the files that should be downloaded.
+            create_dirs:     Create directories as necessary before downloading files.
+            path_args:       Arguments passed on to .path() to find the file paths.
+
+        Returns:
+            Paths to downloaded files, None for files that were not downloaded. Same order as file_keys_vars.
+        """
+        manager = self._download_manager(create_dirs=create_dirs)
+        file_paths = [
+            self._add_download(manager, file_key, file_vars, **path_args) for file_key, file_vars in file_keys_vars
+        ]
+        results = manager.download()
+        return [None if file_path is None or not results.get(file_path) else file_path for file_path in file_paths]
+
+    def _download_manager(self, create_dirs: bool = True) -> download.DownloadManager:
+        """Create a download manager with the download settings of the configuration"""
+        return download.DownloadManager(
+            max_host_connections=self.download_max_host_connections,
+            max_connections=self.download_max_connections,
+            create_dirs=create_dirs,
+        )
+
+    def _add_download(
+        self,
+        manager: download.DownloadManager,
+        file_key: str,
+        file_vars: Optional[Dict[str, str]] = None,
+        file_path: Optional[pathlib.Path] = None,
+        **path_args: Any,
+    ) -> Optional[pathlib.Path]:
+        """Add a file to the queue of a download manager
+
+        Args:
+            manager:      Download manager.
+            file_key:     File key that should be downloaded.
+            file_vars:    File variables used to find path from file_key.
+            file_path:    Path where file will be saved, default is to read from configuration.
+            path_args:    Arguments passed on to .path() to find file_path.
+
+        Returns:
+            Path where the file will be saved, None if the file will not be downloaded.
+        """
         # Do not download anything if download_missing class variable is False
         if not self.download_missing:
             return None
@@ -422,40 +604,33 @@ class FileConfiguration(Configuration):
             file_path = self.path(file_key, file_vars=file_vars, download_missing=False, **path_args)
         file_path = file_path.with_name(file_url.name)
 
-        if create_dirs:
-            file_path.parent.mkdir(parents=True, exist_ok=True)
-
-        log.info(f"Download {file_key} from '{file_url}' to '{file_path}'")
-        with builtins.open(file_path, mode="wb") as fid:
-            c = pycurl.Curl()
-            c.setopt(c.URL, file_url)
-            c.setopt(c.WRITEDATA, fid)
-            try:
-                c.perform()
-                if not (200 <= c.getinfo(c.HTTP_CODE) <= 299):
-                    raise pycurl.error()
-            except pycurl.error:
-                log.error(f"Problem downloading file: {c.getinfo(c.EFFECTIVE_URL)} ({c.getinfo(c.HTTP_CODE)})")
-                if file_path.exists():  # Print first 10 lines to console
-                    head_of_file = f"Contents of '{file_path}':\n" + "\n".join(file_path.read_text().split("\n")[:10])
-                    log.info(console.indent(head_of_file, num_spaces=8))
-                    file_path.unlink()
-                log.warn(f"Try to download '{file_url}' manually and save it at '{file_path}'")
-            else:
-                log.info(f"Done downloading {file_key}")
-            finally:
-                c.close()
+        manager.add(file_url, file_path, description=file_key)
         return file_path
 
     def glob_paths(
         self, file_key: str, file_vars: Optional[Dict[str, str]] = None, is_zipped: Optional[bool] = None
     ) -> List[pathlib.Path]:
-        """Find all file paths for the given file_key matching a filename pattern"""
-        path_string = str(self.path(file_key, file_vars, default="*", is_zipped=is_zipped))
-        path_aliases = self.aliased_path(file_key, file_vars, default="*", is_zipped=is_zipped)
-        paths = self._glob_paths(path_string)
-        for alias in path_aliases:
-            paths += self._glob_paths(str(alias))
+        """Find all file paths for the given file_key matching a filename pattern
+
+        The filename patterns are cached together with the resolved paths (see `path`), while the file system is
+        searched each time.
+        """
+        cache = self._get_path_cache()
+        try:
+            cache_key: Optional[Hashable] = ("glob", file_key, frozenset((file_vars or {}).items()), is_zipped)
+            path_strings = cache[cache_key]
+        except (KeyError, TypeError):
+            path = self.path(
+                file_key, file_vars, default="*", is_zipped=is_zipped, download_missing=False, use_aliases=False
+            )
+            path_aliases = self.aliased_path(file_key, file_vars, default="*", is_zipped=is_zipped)
+            path_strings = list(dict.fromkeys(str(p) for p in [path] + path_aliases))  # Unique, keep order
+            if cache_key is not None:
+                cache[cache_key] = path_strings
+
+        paths = list()
+        for path_string in path_strings:
+            paths += self._glob_paths(path_string)
         return paths
 
     def _glob_paths(self, path_string):
@@ -35,6 +35,10 @@ np_float = TypeVar("np_float", float, np.ndarray)
 
 
 def read_tai_utc():
+    """Read table of TAI-UTC offsets (leap seconds)
+
+    Use `_tai_utc` to get the table, it is only read once.
+    """
     package, _, _ = __name__.rpartition(".")
     source = importlib_resources.files(package).joinpath("_taiutc.txt")
     with importlib_resources.as_file(source) as path:
@@ -47,6 +51,12 @@ def read_tai_utc():
         )
 
 
+@lru_cache()
+def _tai_utc() -> np.ndarray:
+    """Table of TAI-UTC offsets, read the first time it is needed"""
+    return read_tai_utc()
+
+
 def register_scale(
     convert_to: Dict[str, Callable] = None, convert_from: Dict[str, Callable] = None
 ) -> Callable[[Callable], Callable]:
@@ -878,12 +888,13 @@ class TimeDeltaArray(TimeBase):
 
 
 def delta_tai_utc(time: "TimeArray") -> "np_float":
+    tai_utc = _tai_utc()
     try:
-        idx = [np.argmax(np.logical_and(t.jd >= _TAIUTC["start"], t.jd < _TAIUTC["end"])) for t in time]
+        idx = [np.argmax(np.logical_and(t.jd >= tai_utc["start"], t.jd < tai_utc["end"])) for t in time]
     except TypeError:
-        idx = np.argmax(np.logical_and(time.jd >= _TAIUTC["start"], time.jd < _TAIUTC["end"]))
+        idx = np.argmax(np.logical_and(time.jd >= tai_utc["start"], time.jd < tai_utc["end"]))
 
-    delta = _TAIUTC["offset"][idx] + (time.mjd - _TAIUTC["ref_epoch"][idx]) * _TAIUTC["factor"][idx]
+    delta = tai_utc["offset"][idx] + (time.mjd - tai_utc["ref_epoch"][idx]) * tai_utc["factor"][idx]
 
     if time.scale == "utc":
         return delta * Unit.seconds2day
@@ -893,11 +904,11 @@ def delta_tai_utc(time: "TimeArray") -> "np_float":
         tmp_utc_mjd = time.tai.mjd - delta * Unit.seconds2day
 
         try:
-            idx = [np.argmax(np.logical_and(t >= _TAIUTC["start"], t < _TAIUTC["end"])) for t in tmp_utc_jd]
+            idx = [np.argmax(np.logical_and(t >= tai_utc["start"], t < tai_utc["end"])) for t in tmp_utc_jd]
         except TypeError:
-            idx = np.argmax(np.logical_and(tmp_utc_jd >= _TAIUTC["start"], tmp_utc_jd < _TAIUTC["end"]))
+            idx = np.argmax(np.logical_and(tmp_utc_jd >= tai_utc["start"], tmp_utc_jd < tai_utc["end"]))
 
-        delta = _TAIUTC["offset"][idx] + (tmp_utc_mjd - _TAIUTC["ref_epoch"][idx]) * _TAIUTC["factor"][idx]
+        delta = tai_utc["offset"][idx] + (tmp_utc_mjd - tai_utc["ref_epoch"][idx]) * tai_utc["factor"][idx]
         return -delta * Unit.seconds2day
 
 
@@ -1045,6 +1056,16 @@ class TtTimeDelta(TimeDeltaArray):
 #
 # Time formats
 #
+class _UnitScale:
+    """Conversion scale from Unit, looked up the first time it is used"""
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def __get__(self, instance: Any, owner: Any) -> float:
+        return getattr(Unit, self.name)
+
+
 class TimeFormat:
 
     cls_name = "TimeFormat"
@@ -1053,8 +1074,8 @@ class TimeFormat:
     fmt = None
     unit = None
     ndim = 1
-    day2seconds = Unit.day2seconds
-    week2days = Unit.week2days
+    day2seconds = _UnitScale("day2seconds")
+    week2days = _UnitScale("week2days")
 
     def __init__(self, val, val2=None, scale=None):
         """Convert val and val2 to Julian days"""
@@ -1691,9 +1712,3 @@ class TimeDeltaDateTime(TimeDeltaFormat):
             return timedelta(days=jd1 + jd2)
         except TypeError:
             return np.array([timedelta(days=j1 + j2) for j1, j2 in zip(jd1, jd2)])
-
-
-#######################################################################################################################
-# Execute on import
-#######################################################################################################################
-_TAIUTC = read_tai_utc()
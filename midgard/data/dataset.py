@@ -9,12 +9,10 @@ from collections import UserDict
 import copy
 import numbers
 import pathlib
-from typing import Any, Callable, Dict, List, Optional, Union, Hashable, Collection
+from typing import Any, BinaryIO, Callable, Dict, List, Optional, Union, Hashable, Collection
 
 # Third party imports
-import h5py
 import numpy as np
-import pandas as pd
 
 # Midgard imports
 import midgard
@@ -45,8 +43,12 @@ class Dataset(collection.Collection):
         self._num_obs = num_obs
 
     @classmethod
-    def read(cls, file_path: Union[str, pathlib.Path]) -> "Dataset":
-        """Read a dataset from file"""
+    def read(cls, file_path: Union[str, pathlib.Path, BinaryIO]) -> "Dataset":
+        """Read a dataset from file
+
+        The file can be given as a path or as a binary file object, e.g. an `io.BytesIO` with HDF5 data.
+        """
+        import h5py  # Importing h5py is slow, so it is only done when needed
 
         log.debug(f"Read dataset from {file_path}")
 
@@ -97,16 +99,24 @@ class Dataset(collection.Collection):
             field.fill_memo(memo)
         return memo
 
-    def write(self, file_path: Union[str, pathlib.Path], write_level: Optional[enums.WriteLevel] = None) -> None:
-        """Write a dataset to file"""
+    def write(
+        self, file_path: Union[str, pathlib.Path, BinaryIO], write_level: Optional[enums.WriteLevel] = None
+    ) -> None:
+        """Write a dataset to file
+
+        The file can be given as a path or as a binary file object, e.g. an `io.BytesIO` for in-memory HDF5 data.
+        """
         write_level = (
             min(enums.get_enum("write_level")) if write_level is None else enums.get_value("write_level", write_level)
         )
         log.debug(f"Write dataset to {file_path} with {write_level}")
 
         # Make sure directory exists
-        file_path = pathlib.Path(file_path).resolve()
-        file_path.parent.mkdir(parents=True, exist_ok=True)
+        if isinstance(file_path, (str, pathlib.Path)):
+            file_path = pathlib.Path(file_path).resolve()
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+
+        import h5py
 
         memo = self._construct_memo()
         with h5py.File(file_path, mode="w") as h5_file:
@@ -340,8 +350,10 @@ class Dataset(collection.Collection):
 
         return fields_dict
 
-    def as_dataframe(self, fields=None, index=None) -> pd.DataFrame:
+    def as_dataframe(self, fields=None, index=None) -> "pd.DataFrame":
         """Return a representation of the dataset as a Pandas DataFrame"""
+        import pandas as pd  # Importing pandas is slow, so it is only done when needed
+
         df = pd.DataFrame.from_dict(self.as_dict(fields=fields))
         if index is not None:
             df.set_index(index, drop=True, inplace=True)
@@ -433,7 +445,7 @@ class Dataset(collection.Collection):
 
 
 class Meta(UserDict):
-    def read(self, h5_group: h5py.Group) -> None:
+    def read(self, h5_group: "h5py.Group") -> None:
         """Read meta data from hdf5-file
         
         Args:
@@ -442,7 +454,7 @@ class Meta(UserDict):
         for k, v in h5_group.attrs.items():
             self.data[k] = _h5utils.decode_h5attr(v)
 
-    def write(self, h5_group: h5py.Group) -> None:
+    def write(self, h5_group: "h5py.Group") -> None:
         """Write meta data to hdf5-file
 
         Args:
@@ -9,7 +9,6 @@ from typing import Any, Dict, List
 
 # Third party imports
 import numpy as np
-import pandas as pd
 
 # Midgard imports
 from midgard.collections import enums
@@ -198,8 +197,10 @@ class FieldType(abc.ABC):
 
         return field_dict
 
-    def as_dataframe(self, fields=None, index=None) -> pd.DataFrame:
+    def as_dataframe(self, fields=None, index=None) -> "pd.DataFrame":
         """Return a representation of the field as a Pandas DataFrame"""
+        import pandas as pd  # Importing pandas is slow, so it is only done when needed
+
         df = pd.DataFrame.from_dict(self.as_dict(fields=fields))
         if index is not None:
             df.set_index(index, drop=True, inplace=True)
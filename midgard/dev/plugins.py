@@ -65,11 +65,24 @@ using the `part` optional parameter to `call_one`:
     > for part in plugins.list_parts('midgard.techniques', plugin_name='vlbi'):
     ...   plugins.call_one('midgard.techniques', plugin_name='vlbi', part=part, ...)
 
+Listing and documenting plug-ins with `names`, `parts`, `exists`, `doc` and
+`doc_all` does not import the plug-in modules. Instead, the source code of the
+modules is scanned for `register`-decorators, and the result is stored in a
+manifest for each plug-in directory. The manifests are cached in
+`MANIFEST_DIRECTORY`, and a module is only scanned again when its modification
+time or size changes. Modules that register plug-ins in ways that can not be
+found by scanning the source code are imported as before.
+
 """
 # Standard library imports
+import ast
 import functools
+import hashlib
 import importlib
+import importlib.util
 import inspect
+import json
+import os
 import pathlib
 import re
 import sys
@@ -85,6 +98,18 @@ from midgard.files import dependencies
 # The _PLUGINS-dict is populated by the `register` decorator in each module.
 _PLUGINS: Dict[str, Dict[str, Any]] = dict(__aliases__=dict(), __packages__=dict())
 
+# Manifests of plug-in directories, populated by `_directory_manifest`
+_MANIFESTS: Dict[pathlib.Path, Dict[str, Any]] = dict()
+
+# Directory where manifests are cached between runs, manifests are only kept in memory if None
+MANIFEST_DIRECTORY: Optional[pathlib.Path] = (
+    pathlib.Path(os.environ.get("XDG_CACHE_HOME") or pathlib.Path.home() / ".cache") / "midgard" / "plugins"
+)
+_MANIFEST_VERSION = f"1-py{sys.version_info.major}.{sys.version_info.minor}"
+
+# Names of the decorators used to register plug-ins
+_REGISTER_FUNCTIONS = ("register", "register_named", "register_ordered")
+
 
 # Simple structure containing information about a plug-in
 class Plugin(NamedTuple):
@@ -312,12 +337,23 @@ def doc(
     Returns:
         Documentation of the plug-in.
     """
-    # Get Plugin-object and pick out doc-string
-    plugin = get(package_name, plugin_name, part, prefix)
-    if use_module:
-        doc = sys.modules[plugin.function.__module__].__doc__ or ""
+    # Get doc-string from manifest if the plug-in is not imported, otherwise from the Plugin-object
+    plugin_name = _resolve_name(package_name, plugin_name, prefix=prefix)
+    plugin_info = _manifest_plugin(package_name, plugin_name)
+    if plugin_info is not None:
+        if use_module:
+            doc = plugin_info["module_doc"] or ""
+        else:
+            part = plugin_info["unnamed"][0] if part is None and plugin_info["unnamed"] else part
+            if part not in plugin_info["parts"]:
+                raise UnknownPluginError(f"Plugin {part!r} not found for {plugin_name!r} in {package_name!r}")
+            doc = plugin_info["parts"][part]["doc"] or ""
     else:
-        doc = plugin.function.__doc__ or ""
+        plugin = get(package_name, plugin_name, part, prefix)
+        if use_module:
+            doc = sys.modules[plugin.function.__module__].__doc__ or ""
+        else:
+            doc = plugin.function.__doc__ or ""
 
     if long_doc:
         # Strip short description and indentation
@@ -353,8 +389,7 @@ def doc_all(
     plug-in listed in the `plugins`-list does not exist, an UnknownPluginError
     is raised.
 
-    If `plugins` is not given, all available plugins will be called. Do note,
-    however, that this will import all python files in the package.
+    If `plugins` is not given, all available plugins will be documented.
 
     Args:
         package_name:     Name of package containing plug-ins.
@@ -409,8 +444,8 @@ def names(package_name: str, plugins: Optional[Iterable[str]] = None, prefix: Op
     plug-in listed in the `plugins`-list does not exist, an UnknownPluginError
     is raised.
 
-    If `plugins` is not given, all available plugins will be listed. Do note,
-    however, that this will import all python files in the package.
+    If `plugins` is not given, all available plugins will be listed. The
+    plug-ins are found using the manifest of the package, see `exists`.
 
     Args:
         package_name:  Name of package containing plug-ins.
@@ -422,15 +457,26 @@ def names(package_name: str, plugins: Optional[Iterable[str]] = None, prefix: Op
     """
     # Figure out names of plug-ins
     if plugins is None:
-        _import_all(package_name)
-        plugins = _PLUGINS.get(package_name, dict()).keys()
+        manifest = _manifest(package_name)
+        for plugin_name, plugin_info in manifest.items():
+            if not plugin_info["static"]:
+                try:
+                    _import_one(package_name, plugin_name)
+                except UnknownPluginError:
+                    pass  # OK if .py file does not contain a plugin
+        static_plugins = {p for p, i in manifest.items() if i["static"] and i["parts"]}
+        plugins = set(_PLUGINS.get(package_name, dict())) | static_plugins
 
-    # Load each plug-in and return them in sort order
+    # Find each plug-in and return them in sort order
     def _sort_value(plugin: str) -> Tuple[int, str]:
         """Pick out sort_value of plugin"""
+        plugin_info = _manifest_plugin(package_name, plugin)
+        if plugin_info is not None:
+            sort_value = plugin_info["parts"][plugin_info["unnamed"][0]]["sort_value"] if plugin_info["unnamed"] else 0
+            return (sort_value, plugin)
         return (getattr(_PLUGINS[package_name][plugin].get("__default__"), "sort_value", 0), plugin)
 
-    return sorted((load(package_name, p, prefix=prefix) for p in plugins), key=_sort_value)
+    return sorted((_resolve_name(package_name, p, prefix=prefix) for p in plugins), key=_sort_value)
 
 
 def parts(package_name: str, plugin_name: str, prefix: Optional[str] = None) -> List[str]:
@@ -444,14 +490,18 @@ def parts(package_name: str, plugin_name: str, prefix: Optional[str] = None) ->
     Returns:
         List: Strings with names of parts.
     """
-    plugin_name = load(package_name, plugin_name, prefix=prefix)
+    plugin_name = _resolve_name(package_name, plugin_name, prefix=prefix)
+    plugin_info = _manifest_plugin(package_name, plugin_name)
+    if plugin_info is not None:
+        return list(plugin_info["unnamed"])
     return _PLUGINS[package_name][plugin_name].get("__parts__", list())
 
 
 def exists(package_name: str, plugin_name: str) -> bool:
     """Check whether or not a plug-in exists in a package
 
-    Tries to import the given plug-in.
+    Looks up the plug-in in the manifest of the package. Modules that can not
+    be understood from their source code are imported.
 
     Args:
         package_name:  Name of package containing plug-ins.
@@ -460,13 +510,11 @@ def exists(package_name: str, plugin_name: str) -> bool:
     Returns:
         True if plug-in exists, False otherwise.
     """
-    if plugin_name not in _PLUGINS.get(package_name, dict()):
-        try:
-            _import_one(package_name, plugin_name)
-        except UnknownPluginError:
-            return False
-
-    return plugin_name in _PLUGINS.get(package_name, dict())
+    try:
+        _resolve_name(package_name, plugin_name)
+    except UnknownPluginError:
+        return False
+    return True
 
 
 #
@@ -514,6 +562,242 @@ def load(package_name: str, plugin_name: str, prefix: Optional[str] = None) -> s
     return plugin_name
 
 
+def _resolve_name(package_name: str, plugin_name: str, prefix: Optional[str] = None) -> str:
+    """Find the actual name of a plug-in without importing it if possible
+
+    Works as `load`, but uses the manifest of the package to check that the
+    plug-in exists. Only modules that are not in the manifest, or that can not
+    be understood from their source code, are imported.
+
+    Args:
+        package_name:  Name of package containing plug-ins.
+        plugin_name:   Name of the plug-in (module).
+        prefix:        Prefix of the plug-in name, used if the plug-in name is unknown (optional).
+
+    Returns:
+        Actual name of plug-in (with or without prefix).
+    """
+    if plugin_name in _PLUGINS.get(package_name, dict()):
+        return plugin_name
+
+    try:
+        manifest = _manifest(package_name)
+    except UnknownPackageError:
+        manifest = dict()
+    names_to_try = [plugin_name] + ([f"{prefix}_{plugin_name}"] if prefix else [])
+    for name in names_to_try:
+        plugin_info = manifest.get(name)
+        if plugin_info is not None and plugin_info["static"] and plugin_info["parts"]:
+            return name
+        if name in _PLUGINS.get(package_name, dict()):
+            return name
+
+    # Plug-ins not understood by the manifest are imported
+    if all(n in manifest and manifest[n]["static"] for n in names_to_try):
+        raise UnknownPluginError(f"Plug-in {plugin_name!r} not found in package {package_name!r}")
+    return load(package_name, plugin_name, prefix=prefix)
+
+
+def _manifest_plugin(package_name: str, plugin_name: str) -> Optional[Dict[str, Any]]:
+    """Get information about a plug-in from the manifest
+
+    Plug-ins that are already imported are documented by the registered functions, so None is returned for these, as
+    well as for plug-ins that are not in the manifest.
+
+    Args:
+        package_name:  Name of package containing plug-ins.
+        plugin_name:   Name of the plug-in (module).
+
+    Returns:
+        Dictionary with information about the plug-in, see `_scan_module`.
+    """
+    if plugin_name in _PLUGINS.get(package_name, dict()):
+        return None
+    try:
+        plugin_info = _manifest(package_name).get(plugin_name)
+    except UnknownPackageError:
+        return None
+    if plugin_info is None or not plugin_info["static"] or not plugin_info["parts"]:
+        return None
+    return plugin_info
+
+
+def _manifest(package_name: str) -> Dict[str, Dict[str, Any]]:
+    """Get the manifest of the plug-ins in a package
+
+    The package itself is not imported, only located.
+
+    Args:
+        package_name:  Name of package containing plug-ins.
+
+    Returns:
+        Dictionary with plug-in names as keys and information about the plug-ins as values, see `_scan_module`.
+    """
+    manifest: Dict[str, Dict[str, Any]] = dict()
+    for package_alias in _aliases(package_name):
+        try:
+            spec = importlib.util.find_spec(package_alias)
+        except (ImportError, ValueError):
+            spec = None
+        if spec is None or not spec.submodule_search_locations:
+            raise UnknownPackageError(f"Plug-in package {package_name!r} not found")
+
+        for directory in spec.submodule_search_locations:
+            for plugin_name, plugin_info in _directory_manifest(pathlib.Path(directory)).items():
+                manifest.setdefault(plugin_name, plugin_info)
+    return manifest
+
+
+def _directory_manifest(directory: pathlib.Path) -> Dict[str, Dict[str, Any]]:
+    """Get the manifest of the plug-in modules in a directory
+
+    Only modules that have changed since the last time they were scanned are scanned again. The manifest is stored in
+    `MANIFEST_DIRECTORY` if it has changed.
+
+    Args:
+        directory:  Directory containing plug-in modules.
+
+    Returns:
+        Dictionary with module names as keys and information about the plug-ins as values, see `_scan_module`.
+    """
+    if directory not in _MANIFESTS:
+        _MANIFESTS[directory] = _read_manifest(directory)
+    cached = _MANIFESTS[directory]
+
+    modules = dict()
+    is_changed = False
+    for file_path in directory.glob("*.py"):
+        if file_path.stem.startswith("_"):
+            continue
+        try:
+            stat = file_path.stat()
+        except OSError:
+            continue
+        signature = [stat.st_mtime_ns, stat.st_size]
+        module_info = cached.get(file_path.stem)
+        if module_info is None or module_info["signature"] != signature:
+            module_info = dict(signature=signature, plugin=_scan_module(file_path))
+            is_changed = True
+        modules[file_path.stem] = module_info
+
+    if is_changed or len(modules) != len(cached):
+        _MANIFESTS[directory] = modules
+        _write_manifest(directory, modules)
+    return {n: m["plugin"] for n, m in modules.items()}
+
+
+def _manifest_path(directory: pathlib.Path) -> Optional[pathlib.Path]:
+    """Path to the cached manifest of a directory"""
+    if MANIFEST_DIRECTORY is None:
+        return None
+    directory_hash = hashlib.md5(str(directory.resolve()).encode()).hexdigest()
+    return pathlib.Path(MANIFEST_DIRECTORY) / f"{directory.name}-{directory_hash}.json"
+
+
+def _read_manifest(directory: pathlib.Path) -> Dict[str, Dict[str, Any]]:
+    """Read cached manifest of a directory, an empty manifest is returned if there is no valid cached manifest"""
+    manifest_path = _manifest_path(directory)
+    if manifest_path is None:
+        return dict()
+    try:
+        manifest = json.loads(manifest_path.read_text())
+    except (OSError, ValueError):
+        return dict()
+    if manifest.get("version") != _MANIFEST_VERSION:
+        return dict()
+    return manifest.get("modules", dict())
+
+
+def _write_manifest(directory: pathlib.Path, modules: Dict[str, Dict[str, Any]]) -> None:
+    """Store manifest of a directory in the manifest cache"""
+    manifest_path = _manifest_path(directory)
+    if manifest_path is None:
+        return
+    tmp_path = manifest_path.with_name(f"{manifest_path.name}.{os.getpid()}.tmp")
+    try:
+        manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_text(json.dumps(dict(version=_MANIFEST_VERSION, directory=str(directory), modules=modules)))
+        os.replace(tmp_path, manifest_path)
+    except OSError as err:
+        log.debug(f"Could not store plug-in manifest {manifest_path}: {err}")
+
+
+def _scan_module(file_path: pathlib.Path) -> Dict[str, Any]:
+    """Find plug-ins registered in a module by scanning its source code
+
+    Functions and classes defined at the top level of the module and decorated by `plugins.register`,
+    `plugins.register_named` or `plugins.register_ordered` are found. If the register functions are used in any other
+    way, the module is marked as not static, and must be imported to find its plug-ins.
+
+    Args:
+        file_path:  Path to module.
+
+    Returns:
+        Dictionary with information about the plug-ins with the following keys:
+            static:      Whether all plug-ins in the module are found by scanning the source.
+            module_doc:  Doc-string of module.
+            parts:       Doc-string and sort value for each part, named and unnamed.
+            unnamed:     Names of unnamed parts in the order they are registered.
+    """
+    plugin_info: Dict[str, Any] = dict(static=False, module_doc=None, parts=dict(), unnamed=list())
+    try:
+        tree = ast.parse(file_path.read_bytes(), filename=str(file_path))
+    except (SyntaxError, ValueError):
+        return plugin_info
+    plugin_info["module_doc"] = ast.get_docstring(tree, clean=False)
+
+    # Find the names used for the plugins module and the register functions
+    module_names = set()
+    function_names = dict()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.ImportFrom) and node.module == "midgard.dev":
+            module_names |= {a.asname or a.name for a in node.names if a.name == "plugins"}
+        elif isinstance(node, ast.ImportFrom) and node.module == "midgard.dev.plugins":
+            function_names.update({a.asname or a.name: a.name for a in node.names if a.name in _REGISTER_FUNCTIONS})
+        elif isinstance(node, ast.Import) and any(a.name == "midgard.dev.plugins" for a in node.names):
+            return plugin_info
+
+    def register_function(node: ast.AST) -> Optional[str]:
+        """Name of register function referred to by node, None if node does not refer to a register function"""
+        if isinstance(node, ast.Attribute) and isinstance(node.value, ast.Name) and node.value.id in module_names:
+            return node.attr if node.attr in _REGISTER_FUNCTIONS else None
+        if isinstance(node, ast.Name):
+            return function_names.get(node.id)
+        return None
+
+    # Find decorated functions and classes
+    num_registered = 0
+    for node in tree.body:
+        if not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            continue
+        for decorator in node.decorator_list:
+            name, sort_value = node.name, 0
+            if register_function(decorator) == "register":
+                plugin_info["unnamed"].append(name)
+            elif isinstance(decorator, ast.Call) and len(decorator.args) == 1 and not decorator.keywords:
+                try:
+                    value = ast.literal_eval(decorator.args[0])
+                except ValueError:
+                    continue
+                function = register_function(decorator.func)
+                if function == "register_named" and isinstance(value, str):
+                    name = value
+                elif function == "register_ordered" and isinstance(value, int):
+                    plugin_info["unnamed"].append(name)
+                    sort_value = value
+                else:
+                    continue
+            else:
+                continue
+            plugin_info["parts"][name] = dict(doc=ast.get_docstring(node, clean=False), sort_value=sort_value)
+            num_registered += 1
+
+    # All uses of the register functions should be found as decorators
+    num_references = sum(register_function(n) is not None for n in ast.walk(tree))
+    plugin_info["static"] = num_references == num_registered
+    return plugin_info
+
+
 def _aliases(package_name: str) -> List[str]:
     """Aliases for the given package
 
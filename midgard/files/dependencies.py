@@ -10,15 +10,25 @@ Two strategies are available:
 - Timestamps: Fast, but not always reliable as timestamps may update without the file actually changing.
 - md5 hash/checksum: Slower, since it needs to read through the whole file, but will reliably only trigger when a file
   has changed.
+
+To make the md5 checks faster, the md5 checksums are cached in an index stored next to the dependency file (with the
+suffix `.md5_index`). The index is keyed on the (inode, size, modification time) signature of each file, so that only
+files that have been touched since the last check are read again. Files that need to be read are hashed concurrently
+in a thread pool.
 """
 
 # Standard library imports
 import atexit
+from concurrent import futures
 from datetime import datetime
 import hashlib
+import json
+import os
 import pathlib
 import re
-from typing import Any, Dict, List, Optional, Union
+import threading
+import time
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
 
 # Midgard imports
 from midgard.config.config import Configuration
@@ -28,6 +38,15 @@ from midgard.dev import log
 _DEPENDENCY_CACHE: Dict[str, Any] = dict()
 _CURRENT_DEPENDENCIES: Dict[str, Dict[str, str]] = dict()
 
+# Dependency files read by `changed`, with the (modification time, size) signature of the file when it was read
+_DEPENDENCY_FILES: Dict[pathlib.Path, Tuple[Tuple[int, int], Configuration]] = dict()
+
+# Index of md5 checksums for each dependency file
+_MD5_INDEXES: Dict[pathlib.Path, "_Md5Index"] = dict()
+
+# Checksums of files modified closer than this (in nanoseconds) to the time of hashing are not stored on disk
+MD5_INDEX_RACE_NS = 2_000_000_000
+
 
 def init(file_path: Union[str, pathlib.Path], fast_check: bool = True) -> None:
     """Start a clean list of dependencies
@@ -79,14 +98,19 @@ def add(*file_paths: Union[str, pathlib.Path], label: str = "") -> None:
         return
     # Add or update dependency information
     fast_check = _DEPENDENCY_CACHE["fast_check"]
+    file_paths = [p for p in file_paths if p is not None]
+    md5_index = None if fast_check else _Md5Index.get(_DEPENDENCY_CACHE["file_path"])
+    if md5_index is not None:
+        md5_index.md5s(file_paths)  # Hash all files concurrently, before file infos are looked up one by one
     for file_path in file_paths:
-        if file_path is not None:
-            file_info = _file_info(file_path, fast_check, label=label)
-            _CURRENT_DEPENDENCIES[str(file_path)] = file_info
-            log.debug(f"Adding dependency: {file_path} ({file_info['checksum']})")
+        file_info = _file_info(file_path, fast_check, md5_index=md5_index, label=label)
+        _CURRENT_DEPENDENCIES[str(file_path)] = file_info
+        log.debug(f"Adding dependency: {file_path} ({file_info['checksum']})")
 
 
-def _file_info(file_path: Union[str, pathlib.Path], fast_check: bool, **info_args: str) -> Dict[str, str]:
+def _file_info(
+    file_path: Union[str, pathlib.Path], fast_check: bool, md5_index: Optional["_Md5Index"] = None, **info_args: str
+) -> Dict[str, str]:
     """Get file info for a file path
 
     The contents of the file info depends on whether we are doing a fast check or not.
@@ -94,6 +118,7 @@ def _file_info(file_path: Union[str, pathlib.Path], fast_check: bool, **info_arg
     Args:
         file_path:   File path.
         fast_check:  Whether to do a fast check.
+        md5_index:   Index of md5 checksums used for slow checks, if None the file is always read.
         info_args:   Optional arguments that will be added to file info.
 
     Returns:
@@ -102,6 +127,8 @@ def _file_info(file_path: Union[str, pathlib.Path], fast_check: bool, **info_arg
     file_info = dict(timestamp=get_timestamp(file_path))
     if fast_check:
         file_info["checksum"] = file_info["timestamp"]
+    elif md5_index is not None:
+        file_info["checksum"] = md5_index.md5s([file_path])[str(file_path)]
     else:
         file_info["checksum"] = get_md5(file_path)
 
@@ -152,6 +179,11 @@ def _write(write_as_crash: bool = True) -> None:
     # Write to dependency file
     dependencies.write_to_file(_DEPENDENCY_CACHE["file_path"])
 
+    # Store md5 checksums for the next check
+    md5_index = _MD5_INDEXES.get(_DEPENDENCY_CACHE["file_path"])
+    if md5_index is not None:
+        md5_index.write()
+
 
 def changed(file_path: Union[str, pathlib.Path], fast_check: bool = True) -> bool:
     """Check if the dependencies have changed
@@ -173,17 +205,51 @@ def changed(file_path: Union[str, pathlib.Path], fast_check: bool = True) -> boo
         return True
 
     # Check if any dependencies have changed
-    dependencies = Configuration.read_from_file("dependencies", file_path)
-    for file_path in dependencies.section_names:
-        previous_checksum = dependencies[file_path].checksum.str
-        current_checksum = _file_info(file_path, fast_check=fast_check)["checksum"]
-        if current_checksum != previous_checksum:
-            log.debug(f"Dependency {file_path} changed from {previous_checksum} to {current_checksum}")
-            return True
+    dependencies = _read_dependencies(file_path)
+    previous_checksums = {p: dependencies[p].checksum.str for p in dependencies.section_names}
+    if fast_check:
+        for dependency_path, previous_checksum in previous_checksums.items():
+            current_checksum = _file_info(dependency_path, fast_check=True)["checksum"]
+            if current_checksum != previous_checksum:
+                log.debug(f"Dependency {dependency_path} changed from {previous_checksum} to {current_checksum}")
+                return True
+        return False
+
+    md5_index = _Md5Index.get(file_path)
+    current_checksums = md5_index.iter_md5s(previous_checksums)
+    try:
+        for dependency_path, current_checksum in current_checksums:
+            previous_checksum = previous_checksums[dependency_path]
+            if current_checksum != previous_checksum:
+                log.debug(f"Dependency {dependency_path} changed from {previous_checksum} to {current_checksum}")
+                return True
+    finally:
+        current_checksums.close()  # Stop hashing remaining files
+        md5_index.write()
 
     return False
 
 
+def _read_dependencies(file_path: pathlib.Path) -> Configuration:
+    """Read a dependency file
+
+    The dependency file is only read again if it has changed since it was last read.
+
+    Args:
+        file_path:  Path to dependency file.
+
+    Returns:
+        Configuration with one section for each dependency.
+    """
+    stat = file_path.stat()
+    signature = (stat.st_mtime_ns, stat.st_size)
+    cached_signature, dependencies = _DEPENDENCY_FILES.get(file_path, (None, None))
+    if signature != cached_signature:
+        dependencies = Configuration.read_from_file("dependencies", file_path)
+        _DEPENDENCY_FILES[file_path] = (signature, dependencies)
+    return dependencies
+
+
 def get_paths_with_label(file_path: Union[str, pathlib.Path], label_pattern: str) -> List[pathlib.Path]:
     """Find all paths with the given label
 
@@ -203,7 +269,7 @@ def get_paths_with_label(file_path: Union[str, pathlib.Path], label_pattern: str
         return []
 
     # Find dependencies with the given label
-    dependencies = Configuration.read_from_file("dependencies", file_path)
+    dependencies = _read_dependencies(file_path)
     paths = list()
     for file_path in dependencies.section_names:
         label = dependencies[file_path].label.str
@@ -250,3 +316,114 @@ def get_md5(file_path: Union[str, pathlib.Path]) -> str:
         return md5.hexdigest()
     except FileNotFoundError:
         return "File does not exist"
+
+
+class _Md5Index:
+    """Index of md5 checksums, keyed on the (inode, size, modification time) signature of each file
+
+    The index is stored as a JSON file next to the dependency file. A checksum is reused as long as the signature of
+    the file is unchanged. Modification times very close to the time the file was hashed are not stored on disk, since
+    the file may have been changed again within the resolution of the file system timestamps.
+    """
+
+    def __init__(self, file_path: pathlib.Path) -> None:
+        self.file_path = file_path
+        self.entries: Dict[str, List[Any]] = dict()
+        self.is_changed = False
+        self._recent: Set[str] = set()  # Files modified close to when they were hashed
+        self._lock = threading.Lock()
+        try:
+            self.entries = json.loads(file_path.read_text())
+        except (OSError, ValueError):
+            pass  # Start with an empty index if the index file does not exist or can not be read
+
+    @classmethod
+    def get(cls, dependency_path: Union[str, pathlib.Path]) -> "_Md5Index":
+        """Get the md5 index belonging to a dependency file"""
+        dependency_path = pathlib.Path(dependency_path)
+        if dependency_path not in _MD5_INDEXES:
+            index_path = dependency_path.with_name(dependency_path.name + ".md5_index")
+            _MD5_INDEXES[dependency_path] = cls(index_path)
+        return _MD5_INDEXES[dependency_path]
+
+    def md5s(self, file_paths: Iterable[Union[str, pathlib.Path]]) -> Dict[str, str]:
+        """Get md5 checksums of files
+
+        Args:
+            file_paths:  Paths to files.
+
+        Returns:
+            Dictionary with the file paths as strings as keys and the md5 checksums as values.
+        """
+        return dict(self.iter_md5s(file_paths))
+
+    def iter_md5s(self, file_paths: Iterable[Union[str, pathlib.Path]]) -> Iterator[Tuple[str, str]]:
+        """Get md5 checksums of files, with indexed checksums first
+
+        Files with an unchanged signature are returned first. Afterwards the remaining files are hashed in a thread
+        pool, and returned as they are finished. If the caller stops the iteration, files that are not started are
+        not hashed.
+
+        Args:
+            file_paths:  Paths to files.
+
+        Returns:
+            Generator of tuples with file path as string and md5 checksum.
+        """
+        to_hash = dict()
+        for file_path in file_paths:
+            file_path = str(file_path)
+            try:
+                stat = os.stat(file_path)
+            except FileNotFoundError:
+                yield file_path, "File does not exist"
+                continue
+            signature = [stat.st_ino, stat.st_size, stat.st_mtime_ns]
+            entry = self.entries.get(file_path)
+            if entry is not None and entry[:3] == signature:
+                yield file_path, entry[3]
+            else:
+                to_hash[file_path] = signature
+
+        if len(to_hash) <= 1:
+            for file_path, signature in to_hash.items():
+                yield file_path, self._hash(file_path, signature)
+            return
+
+        with futures.ThreadPoolExecutor() as executor:
+            jobs = {executor.submit(self._hash, p, s): p for p, s in to_hash.items()}
+            try:
+                for job in futures.as_completed(jobs):
+                    yield jobs[job], job.result()
+            finally:
+                for job in jobs:
+                    job.cancel()
+
+    def _hash(self, file_path: str, signature: List[int]) -> str:
+        """Calculate md5 checksum of a file and store it in the index"""
+        hashed_at = time.time_ns()
+        md5 = get_md5(file_path)
+        if md5 != "File does not exist":
+            with self._lock:
+                self.entries[file_path] = signature + [md5]
+                self.is_changed = True
+                if signature[2] < hashed_at - MD5_INDEX_RACE_NS:
+                    self._recent.discard(file_path)
+                else:
+                    self._recent.add(file_path)
+        return md5
+
+    def write(self) -> None:
+        """Write the index to disk, if it has changed"""
+        if not self.is_changed:
+            return
+        with self._lock:
+            tmp_path = self.file_path.with_name(f"{self.file_path.name}.{os.getpid()}.tmp")
+            try:
+                entries = {p: e for p, e in self.entries.items() if p not in self._recent}
+                tmp_path.write_text(json.dumps(entries))
+                os.replace(tmp_path, self.file_path)
+            except OSError as err:
+                log.warn(f"Could not write md5 index {self.file_path}: {err}")
+            else:
+                self.is_changed = False
@@ -0,0 +1,277 @@
+"""Download many files concurrently
+
+Description:
+------------
+
+The DownloadManager fetches a queue of files concurrently using the multi interface of pycurl (libcurl). The number
+of connections to each host is limited, and connections are reused between the files downloaded from the same host.
+
+Files are first downloaded to a partial file, `<file_name>.part`, next to the final file. The partial file is moved
+to the final file only when the download is complete and the checksum (if given) is correct, so that a file is never
+seen half written. If a partial file exists when a download starts, the download is resumed from the end of the
+partial file.
+
+Example:
+--------
+
+    from midgard.files import download
+
+    manager = download.DownloadManager(max_host_connections=4)
+    manager.add("https://example.com/data/abcd0010.20o", pathlib.Path("abcd0010.20o"))
+    manager.add("https://example.com/data/efgh0010.20o", pathlib.Path("efgh0010.20o"), checksum="md5:7c42...")
+    results = manager.download()
+
+"""
+# Standard library imports
+import builtins
+import collections
+import hashlib
+import os
+import pathlib
+from typing import Dict, List, Optional
+
+# Third party imports
+import pycurl
+
+# Midgard imports
+from midgard.dev import console
+from midgard.dev import log
+
+# Number of bytes of an error response that are kept for logging
+ERROR_BODY_SIZE = 4096
+
+
+class DownloadManager:
+    """Queue of files that are downloaded concurrently"""
+
+    def __init__(
+        self,
+        max_host_connections: int = 4,
+        max_connections: int = 16,
+        retries: int = 1,
+        connect_timeout: Optional[int] = None,
+        create_dirs: bool = True,
+    ) -> None:
+        """Set up a download manager
+
+        Args:
+            max_host_connections:  Maximal number of simultaneous connections to one host.
+            max_connections:       Maximal number of simultaneous transfers.
+            retries:               Number of times a failed download is retried.
+            connect_timeout:       Timeout in seconds for connecting to a host, None to use the libcurl default.
+            create_dirs:           Create directories as necessary before downloading files.
+        """
+        if max_host_connections < 1 or max_connections < 1:
+            raise ValueError("Number of connections must be positive")
+        self.max_host_connections = max_host_connections
+        self.max_connections = max_connections
+        self.retries = retries
+        self.connect_timeout = connect_timeout
+        self.create_dirs = create_dirs
+        self._queue: List["_Download"] = list()
+
+    def add(
+        self, url: str, file_path: pathlib.Path, checksum: Optional[str] = None, description: Optional[str] = None
+    ) -> None:
+        """Add a file to the download queue
+
+        The checksum is given as `<algorithm>:<hex digest>`, for instance `md5:d41d8cd98f00b204e9800998ecf8427e`. Any
+        algorithm supported by hashlib can be used.
+
+        Args:
+            url:          URL of file to download.
+            file_path:    Path where the file will be saved.
+            checksum:     Expected checksum of file, not checked if None.
+            description:  Short description of the file used in log messages, e.g. the file key.
+        """
+        if checksum is not None and ":" not in checksum:
+            raise ValueError(f"Checksum should be given as '<algorithm>:<hex digest>', not {checksum!r}")
+        self._queue.append(_Download(str(url), pathlib.Path(file_path), checksum, description or str(url)))
+
+    def download(self) -> Dict[pathlib.Path, bool]:
+        """Download all files in the queue
+
+        Files that already exist with the correct checksum are not downloaded again.
+
+        Returns:
+            Dictionary with file paths as keys and whether the file was successfully downloaded as values.
+        """
+        results: Dict[pathlib.Path, bool] = dict()
+        pending = collections.deque()
+        for item in self._queue:
+            if item.checksum and item.file_path.exists() and item.has_checksum(item.file_path):
+                log.debug(f"{item.file_path} is already downloaded")
+                results[item.file_path] = True
+            else:
+                pending.append(item)
+        self._queue = list()
+        if not pending:
+            return results
+
+        multi = pycurl.CurlMulti()
+        multi.setopt(pycurl.M_MAX_HOST_CONNECTIONS, self.max_host_connections)
+        multi.setopt(pycurl.M_MAX_TOTAL_CONNECTIONS, self.max_connections)
+        handles = [pycurl.Curl() for _ in range(min(self.max_connections, len(pending)))]
+        free = list(handles)
+        active: Dict[int, _Download] = dict()
+
+        try:
+            while pending or active:
+                # Start new transfers, reusing free handles
+                while pending and free:
+                    curl = free.pop()
+                    item = pending.popleft()
+                    self._start(curl, item)
+                    active[id(curl)] = item
+                    multi.add_handle(curl)
+
+                # Let libcurl do the transfers, and take care of finished transfers
+                while multi.perform()[0] == pycurl.E_CALL_MULTI_PERFORM:
+                    pass
+                while True:
+                    num_queued, ok_list, err_list = multi.info_read()
+                    finished = [(c, None) for c in ok_list] + [(c, msg) for c, _, msg in err_list]
+                    for curl, error_msg in finished:
+                        multi.remove_handle(curl)
+                        item = active.pop(id(curl))
+                        if self._finish(curl, item, error_msg):
+                            results[item.file_path] = True
+                        elif item.attempts <= self.retries:
+                            log.info(f"Retry downloading {item.description} from '{item.url}'")
+                            pending.append(item)
+                        else:
+                            log.warn(f"Try to download '{item.url}' manually and save it at '{item.file_path}'")
+                            results[item.file_path] = False
+                        curl.reset()
+                        free.append(curl)
+                    if num_queued == 0:
+                        break
+
+                if active:
+                    multi.select(1.0)
+        finally:
+            for item in active.values():
+                item.close()
+            for curl in handles:
+                curl.close()
+            multi.close()
+
+        return results
+
+    def _start(self, curl: pycurl.Curl, item: "_Download") -> None:
+        """Set up handle for downloading one file"""
+        if self.create_dirs:
+            item.file_path.parent.mkdir(parents=True, exist_ok=True)
+        item.start()
+        log.info(f"Download {item.description} from '{item.url}' to '{item.file_path}'")
+
+        curl.setopt(pycurl.URL, item.url)
+        curl.setopt(pycurl.WRITEFUNCTION, item.write)
+        curl.setopt(pycurl.HEADERFUNCTION, item.header)
+        curl.setopt(pycurl.NOSIGNAL, 1)
+        if item.offset:
+            curl.setopt(pycurl.RESUME_FROM_LARGE, item.offset)
+        if self.connect_timeout is not None:
+            curl.setopt(pycurl.CONNECTTIMEOUT, self.connect_timeout)
+
+    def _finish(self, curl: pycurl.Curl, item: "_Download", error_msg: Optional[str]) -> bool:
+        """Finish the download of one file
+
+        Returns:
+            True if the file was downloaded successfully, False otherwise.
+        """
+        item.close()
+        response_code = curl.getinfo(pycurl.RESPONSE_CODE)
+        is_success = error_msg is None and 200 <= response_code <= 299
+        if item.is_resumed and not is_success:
+            # The partial file can not be resumed, e.g. range not satisfiable or byte ranges not supported by server
+            log.warn(f"Could not resume download of '{item.url}', starting over")
+            if item.part_path.exists():
+                item.part_path.unlink()
+            item.attempts -= 1
+            return False
+
+        if not is_success:
+            log.error(f"Problem downloading file: {curl.getinfo(pycurl.EFFECTIVE_URL)} ({response_code})")
+            if error_msg:
+                log.info(console.indent(error_msg, num_spaces=8))
+            if item.error_body:  # Print first 10 lines to console
+                error_text = item.error_body.decode(errors="replace")
+                head_of_file = f"Response from '{item.url}':\n" + "\n".join(error_text.split("\n")[:10])
+                log.info(console.indent(head_of_file, num_spaces=8))
+            return False
+
+        if not item.part_path.exists():  # Empty file
+            item.part_path.touch()
+        if item.checksum and not item.has_checksum(item.part_path):
+            log.error(f"Checksum of '{item.url}' does not match {item.checksum}")
+            item.part_path.unlink()
+            return False
+
+        os.replace(item.part_path, item.file_path)
+        log.info(f"Done downloading {item.description}")
+        return True
+
+
+class _Download:
+    """Download of one file"""
+
+    def __init__(self, url: str, file_path: pathlib.Path, checksum: Optional[str], description: str) -> None:
+        self.url = url
+        self.file_path = file_path
+        self.part_path = file_path.with_name(file_path.name + ".part")
+        self.checksum = checksum
+        self.description = description
+        self.is_http = url.lower().startswith(("http:", "https:"))
+        self.attempts = 0
+        self.offset = 0
+        self.is_resumed = False
+        self.error_body = b""
+        self.status_code = 0
+        self._fid = None
+
+    def start(self) -> None:
+        """Prepare a new attempt of downloading the file, resuming from a partial file if it exists"""
+        self.attempts += 1
+        self.offset = self.part_path.stat().st_size if self.part_path.exists() else 0
+        self.is_resumed = self.offset > 0
+        self.error_body = b""
+        self.status_code = 0
+
+    def header(self, header_line: bytes) -> None:
+        """Read the HTTP status code from the header lines received from libcurl
+
+        The status line of the last response is used, in case of informational responses before the final response.
+        """
+        if self.is_http and header_line.startswith(b"HTTP/"):
+            self.status_code = int(header_line.split()[1])
+
+    def write(self, data: bytes) -> None:
+        """Write data received from libcurl to the partial file
+
+        Error responses are kept in memory, and are not written to the file. If the server does not support resuming,
+        the partial file is overwritten.
+        """
+        if self._fid is None:
+            if self.is_http and not (200 <= self.status_code <= 299):
+                self.error_body = (self.error_body + data)[:ERROR_BODY_SIZE]
+                return
+            if self.is_http and self.status_code != 206:
+                self.offset = 0
+            self._fid = builtins.open(self.part_path, mode="ab" if self.offset else "wb")
+        self._fid.write(data)
+
+    def close(self) -> None:
+        """Close the partial file"""
+        if self._fid is not None:
+            self._fid.close()
+            self._fid = None
+
+    def has_checksum(self, file_path: pathlib.Path) -> bool:
+        """Check whether the file has the expected checksum"""
+        algorithm, _, hex_digest = self.checksum.partition(":")
+        file_hash = hashlib.new(algorithm)
+        with builtins.open(file_path, mode="rb") as fid:
+            for block in iter(lambda: fid.read(1 << 20), b""):
+                file_hash.update(block)
+        return file_hash.hexdigest() == hex_digest.strip().lower()
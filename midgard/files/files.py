@@ -5,29 +5,44 @@
 import builtins
 from contextlib import contextmanager
 import gzip
+import io
 import pathlib
 from typing import Any, Iterator, Optional, Union
 
+# Midgard imports
+from midgard.files import hatanaka
+
 
 @contextmanager
 def open(
     file_path: Union[str, pathlib.Path],
     create_dirs: bool = False,
     open_as_gzip: Optional[bool] = None,
+    open_as_hatanaka: Optional[bool] = None,
+    in_memory: bool = False,
     **open_args: Any
 ) -> Iterator:
     """Open a file.
 
-    Can automatically create the necessary directories before writing to a file, as well as handle gzipped files.
+    Can automatically create the necessary directories before writing to a file, as well as handle gzipped files and
+    Hatanaka compressed RINEX observation files.
 
     With `open_as_gzip` set to None (default), it will try to detect whether the path is a .gz file simply by looking
-    at the path suffix. For more control, you can set the parameter to True or False explicitly.
+    at the path suffix. For more control, you can set the parameter to True or False explicitly. In the same way
+    `open_as_hatanaka` detects compact RINEX files by the suffixes .crx and .yyd (optionally followed by .gz). Compact
+    RINEX files are decompressed while reading, and can only be opened for reading in text mode.
+
+    With `in_memory` set to True, a file opened for reading is read (and inflated if it is gzipped) with one call, and
+    the returned file object reads from the data in memory. This is much faster than reading lines from a gzip
+    stream, but the whole (uncompressed) file is kept in memory.
 
     Args:
-        file_path:     String or pathlib.Path representing the full file path.
-        create_dirs:   True or False, if True missing directories are created.
-        open_as_gzip:  Use gzip library to open file.
-        open_args:     All keyword arguments are passed on to the built-in open.
+        file_path:         String or pathlib.Path representing the full file path.
+        create_dirs:       True or False, if True missing directories are created.
+        open_as_gzip:      Use gzip library to open file.
+        open_as_hatanaka:  Decompress compact RINEX file.
+        in_memory:         Read whole file into memory before returning file object.
+        open_args:         All keyword arguments are passed on to the built-in open.
 
     Returns:
         File object representing the file.
@@ -41,15 +56,92 @@ def open(
     if open_as_gzip is None:
         open_as_gzip = file_path.suffix == ".gz"
 
+    # Compact RINEX and in-memory files are only handled when reading
+    mode = open_args.get("mode", "rb" if open_as_gzip else "r")
+    read_text = not set(mode) & set("wax+b")
+    if open_as_hatanaka is None:
+        open_as_hatanaka = read_text and hatanaka.is_hatanaka(file_path)
+    elif open_as_hatanaka and not read_text:
+        raise ValueError(f"Compact RINEX file {file_path} can only be opened for reading in text mode, not {mode!r}")
+    if in_memory and set(mode) & set("wax+"):
+        raise ValueError(f"File {file_path} can only be read into memory when opened for reading, not {mode!r}")
+
+    if in_memory:
+        fid = _read_into_memory(file_path, open_as_gzip, binary="b" in mode, **open_args)
+        if open_as_hatanaka:
+            fid = io.StringIO("".join(hatanaka.decompress(fid)))
+        with fid:
+            yield fid
+        return
+
     open_func = gzip.open if open_as_gzip else builtins.open
 
     try:
         with open_func(file_path, **open_args) as fid:
-            yield fid
+            yield _TextLines(hatanaka.decompress(fid)) if open_as_hatanaka else fid
     except Exception:
         raise
 
 
+def _read_into_memory(file_path: pathlib.Path, open_as_gzip: bool, binary: bool, **open_args: Any) -> io.IOBase:
+    """Read a file into memory
+
+    Args:
+        file_path:     Path to file.
+        open_as_gzip:  Inflate gzipped file.
+        binary:        Return binary file object instead of text file object.
+        open_args:     Keyword arguments encoding, errors and newline are used for text files, others are ignored.
+
+    Returns:
+        File object reading from memory.
+    """
+    data = file_path.read_bytes()
+    if open_as_gzip:
+        data = gzip.decompress(data)
+    if binary:
+        return io.BytesIO(data)
+
+    text_args = {k: v for k, v in open_args.items() if k in ("encoding", "errors", "newline")}
+    return io.TextIOWrapper(io.BytesIO(data), **text_args)
+
+
+class _TextLines(io.TextIOBase):
+    """Read-only text file object reading from an iterator of lines"""
+
+    def __init__(self, lines: Iterator[str]) -> None:
+        self._lines = lines
+        self._buffer = ""
+
+    def readable(self) -> bool:
+        return True
+
+    def readline(self, size: Optional[int] = -1) -> str:
+        line, self._buffer = (self._buffer or next(self._lines, "")), ""
+        if size is not None and 0 <= size < len(line):
+            line, self._buffer = line[:size], line[size:]
+        return line
+
+    def read(self, size: Optional[int] = -1) -> str:
+        if size is None or size < 0:
+            text, self._buffer = self._buffer + "".join(self._lines), ""
+            return text
+
+        chunks = list()
+        while size > 0:
+            line = self.readline(size)
+            if not line:
+                break
+            chunks.append(line)
+            size -= len(line)
+        return "".join(chunks)
+
+    def __next__(self) -> str:
+        line = self.readline()
+        if not line:
+            raise StopIteration
+        return line
+
+
 def move(from_path: Union[str, pathlib.Path], to_path: Union[str, pathlib.Path], overwrite: bool = True) -> None:
     """Move a file to another path
 
@@ -0,0 +1,243 @@
+"""Decompression of Hatanaka compressed RINEX observation files
+
+Description:
+------------
+
+Compact RINEX (CRINEX) is the Hatanaka compression of RINEX observation files used in the IGS data archives, see
+Hatanaka (2008): A Compression Format and Tools for GNSS Observation Data, Bulletin of GSI, 55. The observations are
+stored as integer differences of a given order along each satellite arc, and the epoch lines and the LLI/signal
+strength flags are stored as text differences to the previous epoch. CRINEX version 1.0 is used for RINEX 2 files and
+CRINEX version 3.0 for RINEX 3 files.
+
+The decompression is done line by line, so that a RINEX observation file can be read directly from a CRINEX file
+without creating a temporary file. The RINEX lines are formatted as by the CRX2RNX program, i.e. with trailing blanks
+removed.
+
+Example:
+--------
+
+    from midgard.files import hatanaka
+
+    with open("trds0320.18d") as fid:
+        for line in hatanaka.decompress(fid):
+            print(line, end="")
+
+"""
+# Standard library imports
+import pathlib
+import re
+from typing import Dict, Iterable, Iterator, List, Optional, Union
+
+# Midgard imports
+from midgard.dev import exceptions
+
+# File names of compact RINEX files (e.g. abcd0010.18d or ABCD00NOR_R_20180010000_01D_30S_MO.crx.gz)
+FILE_NAME_PATTERN = re.compile(r"(\.crx|\.\d\dd)(\.gz)?$", re.IGNORECASE)
+
+
+def is_hatanaka(file_path: Union[str, pathlib.Path]) -> bool:
+    """Check if a file is Hatanaka compressed based on the file name
+
+    Args:
+        file_path:  Path to file.
+
+    Returns:
+        True if the file name has a CRINEX suffix (.crx or .yyd, optionally followed by .gz).
+    """
+    return FILE_NAME_PATTERN.search(pathlib.Path(file_path).name) is not None
+
+
+def decompress(lines: Iterable[str]) -> Iterator[str]:
+    """Decompress lines of a CRINEX file to lines of a RINEX observation file
+
+    Args:
+        lines:  Lines of the CRINEX file, e.g. an open text file.
+
+    Returns:
+        Generator yielding the lines of the RINEX observation file, each ending with a newline.
+    """
+    lines = iter(lines)
+    first_line = next(lines, "")
+    if first_line[60:80].strip() != "CRINEX VERS   / TYPE":
+        raise exceptions.ParserError(f"Not a compact RINEX file, first line is {first_line.rstrip()!r}")
+    version = first_line[0:9].strip()
+    if version[:1] not in ("1", "3"):
+        raise exceptions.ParserError(f"Compact RINEX version {version} is not supported")
+    next(lines, "")  # CRINEX PROG / DATE
+
+    decompressor = _Decompressor(version=int(version[:1]))
+    for line in lines:
+        yield line.rstrip("\r\n") + "\n"
+        decompressor.read_header_line(line)
+        if line[60:73] == "END OF HEADER":
+            break
+
+    for line in decompressor.decompress(lines):
+        yield line + "\n"
+
+
+class _Arc:
+    """Differences of one observation (or the receiver clock offset) along a continuous arc"""
+
+    __slots__ = ("order", "diffs")
+
+    def __init__(self, order: int, value: int) -> None:
+        self.order = order
+        self.diffs = [value]  # Value and differences of increasing order at the last epoch
+
+    def restore(self, diff: int) -> int:
+        """Restore next value from its difference of the order of the arc"""
+        diffs = self.diffs
+        k = min(len(diffs), self.order)
+        if k == len(diffs):
+            diffs.append(diff)
+        else:
+            diffs[k] = diff
+        for i in range(k, 0, -1):
+            diffs[i - 1] += diffs[i]
+        return diffs[0]
+
+
+class _Decompressor:
+    """State of the decompression of the body of a CRINEX file"""
+
+    def __init__(self, version: int) -> None:
+        self.version = version
+        self.num_obstypes: Dict[str, int] = dict()
+
+    def read_header_line(self, line: str) -> None:
+        """Read number of observation types from the RINEX header"""
+        marker = line[60:80].strip()
+        if marker == "# / TYPES OF OBSERV" and line[0:6].strip():
+            self.num_obstypes[""] = int(line[0:6])
+        elif marker == "SYS / # / OBS TYPES" and line[0:1].strip():
+            self.num_obstypes[line[0:1]] = int(line[3:6])
+
+    def decompress(self, lines: Iterator[str]) -> Iterator[str]:
+        """Decompress body of CRINEX file
+
+        Args:
+            lines:  Lines of CRINEX file after the header.
+
+        Returns:
+            Generator yielding RINEX lines without newline.
+        """
+        rinex2 = self.version == 1
+        init_marker = "&" if rinex2 else ">"
+        flag_idx, sat_idx = (28, 32) if rinex2 else (31, 41)
+
+        epoch = ""
+        clock: Optional[_Arc] = None
+        arcs: Dict[str, List[Optional[_Arc]]] = dict()
+        flags: Dict[str, str] = dict()
+
+        for line in lines:
+            line = line.rstrip("\r\n")
+            if line[:1] == init_marker:
+                epoch = (" " + line[1:]) if rinex2 else line
+                clock = None
+                arcs.clear()
+                flags.clear()
+            else:
+                epoch = _repair(epoch, line)
+
+            # Special events are followed by header lines which are not compressed
+            num_sat = int(epoch[flag_idx + 1 : flag_idx + 4])
+            if epoch[flag_idx : flag_idx + 1] in ("2", "3", "4", "5"):
+                yield epoch.rstrip()
+                for _ in range(num_sat):
+                    yield next(lines).rstrip("\r\n")
+                continue
+
+            # Receiver clock offset
+            clock_line = next(lines).strip()
+            if not clock_line:
+                clock = None
+                clock_offset = None
+            elif "&" in clock_line:
+                order, _, value = clock_line.partition("&")
+                clock = _Arc(int(order), int(value))
+                clock_offset = clock.diffs[0]
+            elif clock is None:
+                raise exceptions.ParserError(f"Missing initialization of receiver clock offset in epoch {epoch!r}")
+            else:
+                clock_offset = clock.restore(int(clock_line))
+
+            satellites = [epoch[i : i + 3] for i in range(sat_idx, sat_idx + 3 * num_sat, 3)]
+            if rinex2:
+                first_line = epoch[:32] + "".join(satellites[:12])
+                if clock_offset is not None:
+                    first_line = first_line.ljust(68) + _format(clock_offset, 9, 12)
+                yield first_line.rstrip()
+                for idx in range(12, num_sat, 12):
+                    yield " " * 32 + "".join(satellites[idx : idx + 12])
+            else:
+                epoch_line = epoch[:35]
+                if clock_offset is not None:
+                    epoch_line = epoch_line.ljust(41) + _format(clock_offset, 12, 15)
+                yield epoch_line.rstrip()
+
+            # Observations for each satellite
+            for sat in satellites:
+                num_obstypes = self.num_obstypes["" if rinex2 else sat[0]]
+                fields = next(lines).rstrip("\r\n").split(" ", num_obstypes)
+                flag_diff = fields[num_obstypes] if len(fields) > num_obstypes else ""
+                sat_flags = flags[sat] = _repair(flags.get(sat, ""), flag_diff)
+                sat_arcs = arcs.setdefault(sat, [None] * num_obstypes)
+
+                values = list()
+                for idx, field in enumerate(fields[:num_obstypes]):
+                    if not field:
+                        sat_arcs[idx] = None
+                        values.append(" " * 14)
+                    elif "&" in field:
+                        order, _, value = field.partition("&")
+                        sat_arcs[idx] = _Arc(int(order), int(value))
+                        values.append(_format(sat_arcs[idx].diffs[0], 3, 14))
+                    elif sat_arcs[idx] is None:
+                        raise exceptions.ParserError(f"Missing initialization of arc for {sat} in epoch {epoch!r}")
+                    else:
+                        values.append(_format(sat_arcs[idx].restore(int(field)), 3, 14))
+                values.extend(" " * 14 for _ in range(len(values), num_obstypes))
+                sat_flags = sat_flags.ljust(2 * num_obstypes)
+                obs = [v + sat_flags[2 * i : 2 * i + 2] for i, v in enumerate(values)]
+
+                if rinex2:
+                    for idx in range(0, num_obstypes, 5):
+                        yield "".join(obs[idx : idx + 5]).rstrip()
+                else:
+                    yield (sat + "".join(obs)).rstrip()
+
+
+def _repair(old: str, diff: str) -> str:
+    """Restore text from its difference to the previous text
+
+    A blank in the difference means that the character is unchanged, while '&' means that the character is changed
+    to a blank.
+
+    Args:
+        old:   Previous text.
+        diff:  Text difference.
+
+    Returns:
+        Restored text.
+    """
+    if not diff:
+        return old
+    chars = list(old.ljust(len(diff)))
+    for idx, char in enumerate(diff):
+        if char == "&":
+            chars[idx] = " "
+        elif char != " ":
+            chars[idx] = char
+    return "".join(chars)
+
+
+def _format(value: int, decimals: int, width: int) -> str:
+    """Format integer value in units of 10**-decimals as a fixed point number like CRX2RNX
+
+    Leading zeros are not written, e.g. -353 is formatted as '-.353' with 3 decimals.
+    """
+    sign = "-" if value < 0 else ""
+    integer, fraction = divmod(abs(value), 10 ** decimals)
+    return f"{sign}{integer or ''}.{fraction:0{decimals}d}".rjust(width)
@@ -22,11 +22,31 @@ from midgard.gnss.antenna_calibration import AntennaCalibration
 # Get instance of AntennaCalibration class by defining ANTEX file path 
 ant = AntennaCalibration(file_path="igs14.atx")
 
+# Get receiver antenna phase center variations for arrays of azimuth and zenith angles in [rad]
+pcv = ant.get_pcv("AERAT1675_120", "G01", azimuth, zenith, radome="SPKE")
+
+
+Binary cache:
+-------------
+The antenna corrections of an ANTEX file are compiled into contiguous arrays: for each antenna (and validity period
+for satellites) and frequency the zenith/azimuth grid is described by its start and increment, and the phase center
+variations are saved as a matrix, whose first row contains the non-azimuth-dependent values and the following rows
+the azimuth-dependent values. All matrices are saved in one flat array.
+
+Parsing of large ANTEX files is slow. If `use_binary_cache` is set, the compiled arrays are therefore written to a
+binary sidecar file next to the ANTEX file (or in `cache_dir`) named like the ANTEX file with the suffix `.pcv` added.
+The sidecar starts with a JSON header line containing the description of all antenna/frequency entries and the size and
+modification time of the ANTEX file, followed by the raw phase center variation values, which are opened with
+`np.memmap`. No pickling is involved. The sidecar is rewritten if the ANTEX file is changed.
+
 """
 # Standard library imports
+import bisect
 import datetime
+import json
+import os
 from pathlib import Path, PosixPath
-from typing import List, Dict, Union
+from typing import Any, List, Dict, Optional, Tuple, Union
 from warnings import warn
 
 # External library imports
@@ -37,6 +57,12 @@ from midgard import parsers
 from midgard.collections import enums
 from midgard.dev import log
 from midgard.dev import plugins
+from midgard.files import files
+
+# Suffix, format version and alignment of raw phase center variation values of binary cache files
+CACHE_SUFFIX = ".pcv"
+CACHE_VERSION = 2
+CACHE_ALIGNMENT = 64
 
 
 @plugins.register
@@ -101,24 +127,42 @@ class AntennaCalibration():
         _used_date(): Choose correct date for use of satellite antenna corrections
     """
 
-    def __init__(self, file_path: Union[str, PosixPath]) -> None:
+    def __init__(
+            self,
+            file_path: Union[str, PosixPath],
+            use_binary_cache: bool = False,
+            cache_dir: Optional[Union[str, PosixPath]] = None,
+    ) -> None:
         """Set up a new GNSS antenna calibration object by parsing ANTEX file
 
-        The parsing is done by `midgard.parsers.antex.py` parser.
+        The parsing is done by `midgard.parsers.antex.py` parser. If the binary cache is used and an up to date binary
+        cache of the compiled ANTEX file exists, the ANTEX file is not parsed.
         
         Args:
-            file_path: File path of ANTEX file
+            file_path:         File path of ANTEX file
+            use_binary_cache:  Whether to read and write a binary cache of the compiled ANTEX file.
+            cache_dir:         Directory of binary cache file. Default is the directory of the ANTEX file.
         """
         file_path = Path(file_path)
         if not file_path.exists():
             raise ValueError(f"File {file_path} does not exists.")
-            
-        p = parsers.parse_file(parser_name="antex", file_path=file_path)
-        if not p.data_available:
-            raise ValueError(f"No observations in file {file_path}.")
 
-        self.data = p.as_dict()
-        self.file_path = p.file_path
+        self.file_path = file_path
+        cache_dir = file_path.parent if cache_dir is None else Path(cache_dir)
+        self.cache_path = cache_dir / (file_path.name + CACHE_SUFFIX)
+
+        if not (use_binary_cache and self._read_cache()):
+            p = parsers.parse_file(parser_name="antex", file_path=file_path)
+            if not p.data_available:
+                raise ValueError(f"No observations in file {file_path}.")
+
+            self.data = p.as_dict()
+            self.file_path = p.file_path
+            self._compile(open_ended=p.meta.get("open_ended", list()))
+            if use_binary_cache:
+                self._write_cache()
+
+        self._build_satellite_index()
 
     
     def get_pco_rcv(
@@ -165,26 +209,33 @@ class AntennaCalibration():
 
     def get_pco_sat(
             self, 
-            date: Union[datetime.datetime, datetime.date],
+            date: Union[datetime.datetime, datetime.date, List[datetime.datetime], np.ndarray],
             system: str,
             frequency: Union[str, List[str]],
-            satellite: str, 
-    ) -> Union[None, List[float]]:
+            satellite: Union[str, List[str], np.ndarray],
+    ) -> Union[None, List[float], np.ndarray]:
         """Get satellite PCO in satellite reference system
 
         If two frequencies are given over the 'sys_freq' argument, then the PCOs are determined as an ionospheric linear
         combination.
 
+        If an array of satellites is given, the PCOs are looked up for each (date, satellite) pair and returned as an
+        array with one row for each satellite. Rows of satellites without PCO for the given date are NaN.
+
         Args:
-            date:       Given date used for finding corresponding satellite PCOs in ANTEX file
+            date:       Given date used for finding corresponding satellite PCOs in ANTEX file or array with one date
+                        for each satellite
             system:     GNSS identifier (e.g. E=Galileo, G=GPS, ...)
-            frequency:  GNSS frequency related to given 'system' argument, which can be a single frequency (e.g. E1) or a frequency combination (e.g. E1, E5a)
-            satellite:  Satellite identifier.
+            frequency:  GNSS frequency related to given 'system' argument, which can be a single frequency (e.g. E1)
+                        or a frequency combination (e.g. E1, E5a)
+            satellite:  Satellite identifier or array with satellite identifiers.
 
         Returns:
             Satellite PCO in satellite reference system or None if no entries could be found
         """
         frequency = [frequency] if type(frequency) == str else frequency  # Convert str to list type
+        if type(satellite) is not str:
+            return self._get_pco_sats(date, system, frequency, satellite)
  
         # Get used date
         used_date = self._used_date(date, satellite)
@@ -236,6 +287,74 @@ class AntennaCalibration():
         return list(pco_sat)
 
 
+    def get_pcv(
+            self,
+            antenna: str,
+            frequency: str,
+            azimuth: Union[float, np.ndarray],
+            zenith: Union[float, np.ndarray],
+            radome: str = "NONE",
+            date: Union[None, datetime.datetime, datetime.date] = None,
+    ) -> np.ndarray:
+        """Get antenna phase center variations by bilinear interpolation in the azimuth/zenith grid
+
+        Receiver antennas are given by antenna type and radome. Satellite antennas are given by the satellite
+        identifier together with the date, which selects the valid satellite antenna corrections. For satellite
+        antennas the zenith angle corresponds to the nadir angle. If no azimuth-dependent corrections are given, the
+        non-azimuth-dependent corrections are interpolated. Zenith angles outside the grid are clipped to the grid.
+
+        Args:
+            antenna:    Antenna type of receiver or satellite identifier (e.g. G01).
+            frequency:  ANTEX frequency identifier (e.g. G01, see `_gnss_to_antex_freq()`).
+            azimuth:    Azimuth angles in [rad].
+            zenith:     Zenith (or nadir) angles in [rad].
+            radome:     4-digit radome type name of receiver antenna.
+            date:       Date used for finding satellite antenna corrections.
+
+        Returns:
+            Phase center variations in [m] with the shape of the broadcasted azimuth and zenith arrays.
+        """
+        if date is None:
+            key = (f"{antenna:15s} {radome}", None, frequency)
+        else:
+            used_date = self._used_date(date, antenna)
+            key = (antenna, used_date.isoformat() if used_date else None, frequency)
+
+        if key not in self._pcv_index:
+            raise ValueError(
+                f"Phase center variations for frequency {frequency} of antenna {key[0]!r} are not available in "
+                f"ANTEX file {self.file_path}."
+            )
+        idx = self._pcv_index[key]
+        num_zen = self._pcv_num_zen[idx]
+        num_rows = self._pcv_num_rows[idx]
+        pcv = self._pcv_values[self._pcv_offset[idx] : self._pcv_offset[idx] + num_rows * num_zen].reshape(
+            num_rows, num_zen
+        )
+        azimuth, zenith = np.broadcast_arrays(np.asarray(azimuth, dtype=float), np.asarray(zenith, dtype=float))
+
+        # Fractional grid index of zenith angles
+        dzen = self._pcv_dzen[idx]
+        zen_idx = np.clip((np.degrees(zenith) - self._pcv_zen1[idx]) / dzen, 0, num_zen - 1)
+        zen_lower = np.minimum(zen_idx.astype(int), num_zen - 2) if num_zen > 1 else np.zeros(zen_idx.shape, int)
+        zen_weight = zen_idx - zen_lower
+
+        def interpolate_zenith(row: np.ndarray) -> np.ndarray:
+            if num_zen == 1:
+                return pcv[row, 0]
+            return (1 - zen_weight) * pcv[row, zen_lower] + zen_weight * pcv[row, zen_lower + 1]
+
+        # Only non-azimuth-dependent corrections are given
+        if num_rows == 1:
+            return interpolate_zenith(np.zeros(zen_idx.shape, int))
+
+        # Fractional grid index of azimuth angles. The last azimuth row (360 degrees) equals the first one.
+        azi_idx = np.mod(np.degrees(azimuth), 360) / self._pcv_dazi[idx]
+        azi_lower = np.minimum(azi_idx.astype(int), num_rows - 3)
+        azi_weight = azi_idx - azi_lower
+        return (1 - azi_weight) * interpolate_zenith(azi_lower + 1) + azi_weight * interpolate_zenith(azi_lower + 2)
+
+
     def get_satellite_info(
             self,
             date: Union[datetime.datetime, datetime.date],
@@ -266,13 +385,13 @@ class AntennaCalibration():
     
     def get_satellite_type(
             self, 
-            date: Union[datetime.datetime, datetime.date], 
+            date: Union[datetime.datetime, datetime.date, List[datetime.datetime], np.ndarray],
             satellite: Union[str, List[str], np.ndarray],
     ) -> List[str]:
         """Get satellite type from ANTEX file (e.g. BLOCK IIF, GALILEO-1, GALILEO-2, GLONASS-M, BEIDOU-2G, ...)
 
         Args:
-            date:       Date for which satellite PCOs should be collected
+            date:       Date for which satellite PCOs should be collected or array with one date for each satellite
             satellite:  Array with satellite numbers 
 
         Returns:
@@ -280,34 +399,236 @@ class AntennaCalibration():
 
         """
         satellite = np.array([satellite]) if type(satellite) is str else np.array(satellite)
-        num_obs = satellite.shape[0]
-        sat_types = np.zeros(num_obs, dtype=object)
+        sat_types = np.zeros(satellite.shape[0], dtype=object)
 
-        # Loop over all satellites given in RINEX observation file and configuration file
-        for sat in set(satellite):
+        # Get satellite type for each (date, satellite) pair, with one lookup for each satellite
+        rows = self._satellite_rows(satellite)
+        positions = self._used_dates(date, satellite, rows=rows)
+        for sat, idx in rows:
+            pos = positions[idx]
+            found = pos >= 0
+            sat_types[idx[found]] = self._sat_type_np[sat][pos[found]]
 
-            # Skip satellites, which are not given in ANTEX file
-            if sat not in self.data:
-                warn(
-                    f"Satellite {sat!r} is not given in ANTEX file {self.file_path}."
+        return list(sat_types)
+
+    def _get_pco_sats(
+            self,
+            dates: Union[datetime.datetime, datetime.date, List[datetime.datetime], np.ndarray],
+            system: str,
+            frequency: List[str],
+            satellites: Union[List[str], np.ndarray],
+    ) -> Union[None, np.ndarray]:
+        """Get satellite PCOs in satellite reference system for arrays of (date, satellite) pairs
+
+        Vectorized version of `get_pco_sat()`, see there for a description of the arguments.
+
+        Returns:
+            Array with satellite PCO for each satellite, NaN if no entries could be found, or None if the frequency is
+            not known
+        """
+        antex_freqs = [self._gnss_to_antex_freq(system, freq) for freq in frequency]
+        if None in antex_freqs:
+            return None
+
+        if len(frequency) == 1:
+            coefficients = [1.0]
+        elif len(frequency) == 2:
+            # Coefficient of ionospheric-free linear combination
+            f1 = getattr(enums, "gnss_freq_" + system)[frequency[0]]  # Frequency of 1st band
+            f2 = getattr(enums, "gnss_freq_" + system)[frequency[1]]  # Frequency of 2nd band
+            coefficients = [f1 ** 2 / (f1 ** 2 - f2 ** 2), -f2 ** 2 / (f1 ** 2 - f2 ** 2)]
+        else:
+            raise ValueError(
+                f"Wrong frequency type '{system}:{'_'.join(frequency)}'. Only single or dual frequencies can be "
+                f"handled."
+            )
+
+        satellites = np.atleast_1d(satellites)
+        pco_sat = np.full((satellites.shape[0], 3), np.nan)
+        rows = self._satellite_rows(satellites)
+        positions = self._used_dates(dates, satellites, rows=rows)
+        for sat, idx in rows:
+            pos = positions[idx]
+            found = pos >= 0
+            pco = np.zeros((np.count_nonzero(found), 3))
+            for coefficient, antex_freq in zip(coefficients, antex_freqs):
+                pco_freq = self._sat_pco_np[sat].get(antex_freq)
+                pco = pco + coefficient * (np.nan if pco_freq is None else pco_freq[pos[found]])
+            pco_sat[idx[found]] = pco
+
+        return pco_sat
+
+
+    #
+    # COMPILED ANTENNA CORRECTIONS
+    #
+    def _compile(self, open_ended: Optional[List[Any]] = None) -> None:
+        """Compile antenna corrections to contiguous arrays
+
+        For each antenna (and validity period for satellites) and frequency an entry describing the zenith/azimuth
+        grid and the PCO is generated. The phase center variation matrix of each entry, with the non-azimuth-dependent
+        corrections in the first row and the azimuth-dependent corrections in the following rows, is saved in one flat
+        array.
+
+        Args:
+            open_ended:  (<prn>, <valid from>) of satellite periods with no end of validity in the ANTEX file. The end
+                         of these periods is saved as None, as the parser sets it to the time of parsing.
+        """
+        open_ended = {tuple(period) for period in (open_ended or list())}
+        entries = list()
+        values = list()
+        offset = 0
+
+        for antenna, antenna_data in self.data.items():
+            if all(isinstance(k, datetime.datetime) for k in antenna_data):
+                # Satellite antenna corrections are given for several validity periods
+                periods = [(k, v) for k, v in antenna_data.items()]
+            else:
+                periods = [(None, antenna_data)]
+
+            for valid_from_dt, period in periods:
+                valid_from = None if valid_from_dt is None else valid_from_dt.isoformat()
+                elevation = np.degrees(period["elevation"])
+                info = dict(
+                    antenna=antenna,
+                    valid_from=valid_from,
+                    zen1=90.0 - elevation[0],
+                    zen2=90.0 - elevation[-1],
+                    dzen=(elevation[0] - elevation[1]) if len(elevation) > 1 else 0.0,
+                    dazi=float(np.degrees(period["azimuth"][1])) if "azimuth" in period else 0.0,
                 )
-                continue
+                if valid_from is not None:
+                    info.update({k: period[k] for k in ("cospar_id", "sat_code", "sat_type")})
+                    is_open_ended = (antenna, valid_from_dt) in open_ended
+                    info["valid_until"] = None if is_open_ended else period["valid_until"].isoformat()
+
+                for frequency, corr in period.items():
+                    if not isinstance(corr, dict):
+                        continue
+                    pcv = np.vstack((corr["noazi"], corr["azi"])) if "azi" in corr else corr["noazi"][None, :]
+                    entries.append(
+                        dict(
+                            info,
+                            frequency=frequency,
+                            neu=[float(v) for v in corr["neu"]],
+                            offset=offset,
+                            num_rows=pcv.shape[0],
+                            num_zen=pcv.shape[1],
+                        )
+                    )
+                    values.append(pcv.ravel())
+                    offset += pcv.size
+
+        self._set_compiled(entries, np.concatenate(values) if values else np.empty(0))
+
+    def _set_compiled(self, entries: List[Dict[str, Any]], values: np.ndarray) -> None:
+        """Set arrays describing compiled antenna corrections
 
-            # Get array with information about, when observation are available for the given satellite (indicated
-            # by True)
-            idx = satellite == sat
+        Args:
+            entries:  Description of antenna/frequency entries.
+            values:   Flat array with phase center variation matrices of all entries.
+        """
+        self._pcv_entries = entries
+        self._pcv_values = values
+        self._pcv_index = {(e["antenna"], e["valid_from"], e["frequency"]): i for i, e in enumerate(entries)}
+        for field in ("offset", "num_rows", "num_zen"):
+            setattr(self, f"_pcv_{field}", np.array([e[field] for e in entries], dtype=int))
+        for field in ("zen1", "dzen", "dazi"):
+            setattr(self, f"_pcv_{field}", np.array([e[field] for e in entries], dtype=float))
 
-            # Get used date
-            used_date = self._used_date(date, sat)
-            if used_date is None:
-                continue
+    def _data_from_compiled(self) -> Dict[str, Any]:
+        """Restore antenna calibration data dictionary from compiled antenna corrections
 
-            # Get satellite type
-            sat_type = self.data[sat][used_date]["sat_type"]
-            sat_types[idx] = sat_type
+        Validity periods without end are given the current time as end of validity, as done by the ANTEX parser.
 
-        return list(sat_types)
+        Returns:
+            Antenna calibration data in the structure given by the ANTEX parser.
+        """
+        now = datetime.datetime.now()
+        data: Dict[str, Any] = dict()
+        for idx, entry in enumerate(self._pcv_entries):
+            if entry["valid_from"] is None:
+                period = data.setdefault(entry["antenna"], dict())
+            else:
+                valid_from = datetime.datetime.fromisoformat(entry["valid_from"])
+                period = data.setdefault(entry["antenna"], dict()).setdefault(valid_from, dict())
+                period.update({k: entry[k] for k in ("cospar_id", "sat_code", "sat_type")})
+                valid_until = entry["valid_until"]
+                period["valid_until"] = now if valid_until is None else datetime.datetime.fromisoformat(valid_until)
+
+            zen1, zen2, dzen, dazi = entry["zen1"], entry["zen2"], entry["dzen"], entry["dazi"]
+            if dzen != 0.0:
+                period["elevation"] = np.radians(np.arange(90.0 - zen1, 90.0 - (zen2 + dzen), -dzen))
+            if dazi != 0.0:
+                period["azimuth"] = np.radians(np.arange(0, 360 + dazi, dazi))
+
+            num_rows, num_zen = entry["num_rows"], entry["num_zen"]
+            pcv = np.array(self._pcv_values[entry["offset"] : entry["offset"] + num_rows * num_zen]).reshape(
+                num_rows, num_zen
+            )
+            period[entry["frequency"]] = dict(neu=entry["neu"], noazi=pcv[0])
+            if num_rows > 1:
+                period[entry["frequency"]]["azi"] = pcv[1:]
 
+        return data
+
+    #
+    # BINARY CACHE
+    #
+    def _source_signature(self) -> Dict[str, int]:
+        """Cache format version, size and modification time of the ANTEX file, used to detect outdated cache files"""
+        stat = self.file_path.stat()
+        return dict(version=CACHE_VERSION, source_size=stat.st_size, source_mtime_ns=stat.st_mtime_ns)
+
+    def _read_cache(self) -> bool:
+        """Read compiled antenna corrections by memory mapping the binary cache file
+
+        Returns:
+            True if antenna corrections were read from an up to date binary cache file, otherwise False.
+        """
+        try:
+            with open(self.cache_path, mode="rb") as fid:
+                header = json.loads(fid.readline())
+                offset = fid.tell()
+        except (OSError, ValueError):
+            return False
+
+        if any(header.get(key) != value for key, value in self._source_signature().items()):
+            log.debug(f"Binary cache {self.cache_path} is outdated")
+            return False
+
+        try:
+            values = np.memmap(self.cache_path, dtype="<f8", mode="r", offset=offset, shape=(header["size"],))
+        except (OSError, ValueError) as err:
+            log.debug(f"Could not read binary cache {self.cache_path}: {err}")
+            return False
+
+        self._set_compiled(header["entries"], values)
+        self.data = self._data_from_compiled()
+        log.debug(f"Read antenna corrections from binary cache {self.cache_path}")
+        return True
+
+    def _write_cache(self) -> None:
+        """Write compiled antenna corrections to a binary cache file
+
+        The binary cache file is first written to a temporary file, which is renamed when complete. Thereby other
+        processes never see a partly written cache file.
+        """
+        header = dict(entries=self._pcv_entries, size=len(self._pcv_values), **self._source_signature())
+        header_line = json.dumps(header).encode()
+        header_size = -(-(len(header_line) + 1) // CACHE_ALIGNMENT) * CACHE_ALIGNMENT
+        tmp_path = self.cache_path.with_name(f"{self.cache_path.name}.{os.getpid()}.tmp")
+        try:
+            with files.open(tmp_path, mode="wb", create_dirs=True) as fid:
+                fid.write(header_line.ljust(header_size - 1, b" ") + b"\n")
+                fid.write(np.ascontiguousarray(self._pcv_values, dtype="<f8").tobytes())
+            tmp_path.replace(self.cache_path)
+        except OSError as err:
+            log.debug(f"Could not write binary cache {self.cache_path}: {err}")
+            tmp_path.unlink(missing_ok=True)
+            return
+
+        log.debug(f"Wrote antenna corrections to binary cache {self.cache_path}")
 
     #
     # AUXILIARY FUNCTIONS
@@ -447,6 +768,36 @@ class AntennaCalibration():
         return gnss_to_antex_freq[system][frequency]
     
     
+    def _build_satellite_index(self) -> None:
+        """Build interval index of satellite antenna corrections
+
+        The start dates of the validity periods of each satellite are sorted once, so that the valid satellite antenna
+        corrections for a date can be found by binary search. The satellite type and the PCO for each frequency are
+        saved in arrays in the same order, so that they can be looked up for many dates at once.
+        """
+        self._valid_from: Dict[str, List[datetime.datetime]] = dict()
+        self._valid_from_np: Dict[str, np.ndarray] = dict()
+        self._valid_until_np: Dict[str, np.ndarray] = dict()
+        self._sat_type_np: Dict[str, np.ndarray] = dict()
+        self._sat_pco_np: Dict[str, Dict[str, np.ndarray]] = dict()
+
+        for antenna, antenna_data in self.data.items():
+            if not all(isinstance(k, datetime.datetime) for k in antenna_data):
+                continue  # Receiver antenna
+            valid_from = sorted(antenna_data)
+            self._valid_from[antenna] = valid_from
+            self._valid_from_np[antenna] = np.array(valid_from, dtype="datetime64[us]")
+            self._valid_until_np[antenna] = np.array(
+                [antenna_data[d]["valid_until"] for d in valid_from], dtype="datetime64[us]"
+            )
+            periods = [antenna_data[d] for d in valid_from]
+            self._sat_type_np[antenna] = np.array([p["sat_type"] for p in periods], dtype=object)
+            frequencies = {k for p in periods for k, v in p.items() if isinstance(v, dict) and "neu" in v}
+            self._sat_pco_np[antenna] = {
+                freq: np.array([p[freq]["neu"] if freq in p else [np.nan] * 3 for p in periods], dtype=float)
+                for freq in frequencies
+            }
+
     def _used_date(
             self, 
             given_date: Union[datetime.datetime, datetime.date],
@@ -463,14 +814,82 @@ class AntennaCalibration():
         Returns:
             Date for getting correct satellite antenna corrections related to given date
         """
-        used_date = None
         given_date = datetime.datetime.combine(given_date, datetime.time())  # conversion from date to datetime
 
-        for date in sorted(self.data[satellite]):
-            if date <= given_date:
-                used_date = date
+        valid_from = self._valid_from[satellite]
+        idx = bisect.bisect_right(valid_from, given_date) - 1
+        used_date = valid_from[idx] if idx >= 0 else None
 
         if (used_date is None) or (given_date > self.data[satellite][used_date]["valid_until"]):
             warn(f"No satellite phase center offset is given for satellite {satellite} and date {given_date}.")
 
         return used_date
+
+    def _used_dates(
+            self,
+            given_dates: Union[datetime.datetime, datetime.date, List[datetime.datetime], np.ndarray],
+            satellites: Union[List[str], np.ndarray],
+            rows: Optional[List[Tuple[str, np.ndarray]]] = None,
+    ) -> np.ndarray:
+        """Choose correct validity periods of satellite antenna corrections for arrays of (date, satellite) pairs
+
+        Vectorized version of `_used_date()`, which finds the validity periods with one binary search for each
+        satellite.
+
+        Args:
+            given_dates:  Given dates used for finding corresponding time periods in ANTEX file, either one date or
+                          one date for each satellite.
+            satellites:   Satellite identifiers.
+            rows:         Rows of each satellite as given by `_satellite_rows()`, computed if not given.
+
+        Returns:
+            Array with index of the used validity period in `_valid_from[satellite]` for each (date, satellite) pair,
+            -1 for dates before the first validity period and for satellites not given in the ANTEX file.
+        """
+        satellites = np.atleast_1d(satellites)
+        days = np.asarray(given_dates, dtype="datetime64[D]").astype("datetime64[us]")
+        days = np.broadcast_to(days, satellites.shape)
+        positions = np.full(satellites.shape, -1, dtype=int)
+
+        for sat, idx in self._satellite_rows(satellites) if rows is None else rows:
+            sat_days = days[idx]
+            pos = np.searchsorted(self._valid_from_np[sat], sat_days, side="right") - 1
+            positions[idx] = pos
+
+            found = pos >= 0
+            invalid = ~found
+            invalid[found] = sat_days[found] > self._valid_until_np[sat][pos[found]]
+            if np.any(invalid):
+                warn(
+                    f"No satellite phase center offset is given for satellite {sat} and dates "
+                    f"{', '.join(str(d) for d in np.unique(sat_days[invalid].astype('datetime64[D]')))}."
+                )
+
+        return positions
+
+    def _satellite_rows(self, satellites: Union[List[str], np.ndarray]) -> List[Tuple[str, np.ndarray]]:
+        """Group rows of an array of satellites by satellite
+
+        The satellites are grouped by sorting once instead of comparing the whole array with each satellite.
+        Satellites, which are not given in the ANTEX file, are skipped with a warning.
+
+        Args:
+            satellites:  Satellite identifiers.
+
+        Returns:
+            List with satellite identifier and indices of the rows of the satellite, for each satellite in ANTEX file.
+        """
+        satellites = np.atleast_1d(satellites)
+        if satellites.size == 0:
+            return []
+        names, inverse = np.unique(satellites, return_inverse=True)
+        order = np.argsort(inverse, kind="stable")
+        groups = np.split(order, np.cumsum(np.bincount(inverse, minlength=len(names)))[:-1])
+
+        rows = list()
+        for sat, idx in zip(names.tolist(), groups):
+            if sat in self._valid_from:
+                rows.append((sat, idx))
+            else:
+                warn(f"Satellite {sat!r} is not given in ANTEX file {self.file_path}.")
+        return rows
@@ -0,0 +1,268 @@
+"""Vectorized satellite positions and clock corrections from broadcast ephemeris
+
+Description:
+------------
+
+The broadcast navigation records read by the `rinex3_nav` parser are stored in a flat dataset. This module builds a
+per-satellite index of the records sorted by time of ephemeris (toe), selects the valid record for each
+(time, satellite) pair with a single `searchsorted` call and evaluates the Keplerian orbit and the satellite clock
+polynomial for all pairs at once. The orbit computation follows IS-GPS-200 (section 20.3.3.4.3), which is also used
+for Galileo, BeiDou, QZSS and IRNSS. GLONASS and SBAS records are not Keplerian and are ignored.
+
+Example:
+--------
+
+    from midgard import parsers
+    from midgard.gnss.broadcast_ephemeris import BroadcastEphemeris
+
+    dset = parsers.parse_file("rinex3_nav", file_path="brdm0330.18p").as_dataset()
+    ephemeris = BroadcastEphemeris(dset)
+    pos, clk = ephemeris.satellite_position(time, satellites)
+
+"""
+# Standard library imports
+from typing import Optional, Tuple, Union
+
+# Third party imports
+import numpy as np
+
+# Midgard imports
+from midgard.data.time import TimeArray
+from midgard.math.constant import constant
+
+# Reference frame sources of GM and omega for each GNSS
+SYSTEM_CONSTANT_SOURCE = dict(C="cgcs2000", E="gtrf", G="wgs84", I="wgs84", J="wgs84")
+
+# BeiDou satellites in geostationary orbit
+BEIDOU_GEO_SATELLITES = {"C01", "C02", "C03", "C04", "C05", "C59", "C60", "C61", "C62", "C63"}
+
+# Offset between BeiDou time and GPS time in seconds
+BEIDOU_TIME_OFFSET = 14
+
+SECONDS_PER_WEEK = 604800
+
+
+class BroadcastEphemeris:
+    """Per-satellite index of broadcast navigation records
+
+    The records are sorted by satellite and time of ephemeris. The sort key of a record is the satellite index
+    multiplied by a large stride plus the toe given in GPS seconds since the GPS epoch, so that the valid record of
+    any number of (time, satellite) pairs can be found by one binary search.
+    """
+
+    def __init__(self, dset: "Dataset", nav_type: Optional[str] = None, max_age: Optional[float] = None) -> None:
+        """Build ephemeris index from navigation dataset
+
+        Args:
+            dset:      Dataset with broadcast navigation records (see `rinex3_nav` parser).
+            nav_type:  Only use records of this navigation message type (e.g. 'INAV_E1'), all records if None.
+            max_age:   Maximal allowed distance in seconds between time and toe of selected record. Larger
+                       distances give NaN values. No limit if None.
+        """
+        self.max_age = max_age
+
+        idx = np.isin(dset.system, list(SYSTEM_CONSTANT_SOURCE))
+        if nav_type is not None:
+            idx &= dset.nav_type == nav_type
+        idx = np.flatnonzero(idx)
+
+        satellites = dset.satellite[idx]
+        toe = _gps_seconds(dset.toe[idx])
+        self.satellites, sat_idx = np.unique(satellites, return_inverse=True)
+
+        # Stride is larger than any GPS seconds value, so that keys of different satellites do not overlap
+        self._stride = 2.0 ** np.ceil(np.log2(max(np.max(np.abs(toe), initial=1), 1) * 4))
+        key = sat_idx * self._stride + toe
+        order = np.argsort(key, kind="stable")
+
+        self._key = key[order]
+        self._first = np.searchsorted(sat_idx[order], np.arange(len(self.satellites)), side="left")
+        self._toe = toe[order]
+        self._toc = _gps_seconds(dset.time[idx[order]])
+        self._system = dset.system[idx[order]]
+        self._satellite = satellites[order]
+        self._geo = np.isin(self._satellite, list(BEIDOU_GEO_SATELLITES))
+
+        fields = (
+            "sqrt_a e i0 idot m0 delta_n omega Omega Omega_dot cuc cus crc crs cic cis "
+            "sat_clock_bias sat_clock_drift sat_clock_drift_rate"
+        )
+        self._elements = {f: np.asarray(dset[f][idx[order]], dtype=float) for f in fields.split()}
+
+        # Constants for each record
+        self._gm = np.empty(len(order))
+        self._omega_e = np.empty(len(order))
+        for sys, source in SYSTEM_CONSTANT_SOURCE.items():
+            sys_idx = self._system == sys
+            self._gm[sys_idx] = constant.get("GM", source=source)
+            self._omega_e[sys_idx] = constant.get("omega", source=source)
+
+    @property
+    def num_records(self) -> int:
+        """Number of indexed navigation records"""
+        return len(self._key)
+
+    def select_records(self, time: Union[TimeArray, np.ndarray], satellite: np.ndarray) -> np.ndarray:
+        """Find index of valid navigation record for each (time, satellite) pair
+
+        The valid record is the latest record with toe not after the given time. For times before the first
+        record of a satellite, the first record is used. Satellites without records get index -1.
+
+        Args:
+            time:       Observation times as Time object or as GPS seconds since the GPS epoch.
+            satellite:  Satellite names (e.g. 'G01'), one for each time.
+
+        Returns:
+            Index of navigation records in the internal (sorted) record arrays.
+        """
+        return self._select(_gps_seconds(time), satellite)
+
+    def satellite_position(
+        self, time: Union[TimeArray, np.ndarray], satellite: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Compute satellite positions and clock corrections for (time, satellite) pairs
+
+        Positions are given in the Earth-fixed reference frame of the navigation message at the given times. No
+        light time or Earth rotation correction is applied. Pairs without a valid navigation record get NaN values.
+
+        Args:
+            time:       Times in GPS time scale as Time object or as GPS seconds since the GPS epoch.
+            satellite:  Satellite names (e.g. 'G01'), one for each time.
+
+        Returns:
+            Tuple with satellite positions in meter (shape (n, 3)) and satellite clock corrections in seconds
+            (shape (n,)). The clock correction includes the relativistic correction, but not the group delay.
+        """
+        gps_sec = _gps_seconds(time)
+        satellite = np.asarray(satellite)
+        gps_sec, satellite = np.broadcast_arrays(gps_sec, satellite)
+        rec = self._select(gps_sec, satellite)
+
+        pos = np.full((len(rec), 3), np.nan)
+        clk = np.full(len(rec), np.nan)
+        valid = rec >= 0
+        if self.max_age is not None:
+            valid[valid] = np.abs(gps_sec[valid] - self._toe[rec[valid]]) <= self.max_age
+        if not np.any(valid):
+            return pos, clk
+
+        t = gps_sec[valid]
+        rec = rec[valid]
+        el = {f: v[rec] for f, v in self._elements.items()}
+        gm = self._gm[rec]
+        omega_e = self._omega_e[rec]
+
+        # Orbit
+        a = el["sqrt_a"] ** 2
+        n = np.sqrt(gm / a ** 3) + el["delta_n"]
+        tk = t - self._toe[rec]
+        mk = el["m0"] + n * tk
+        ek = _solve_kepler(mk, el["e"])
+        sin_ek, cos_ek = np.sin(ek), np.cos(ek)
+        vk = np.arctan2(np.sqrt(1 - el["e"] ** 2) * sin_ek, cos_ek - el["e"])
+        phik = vk + el["omega"]
+        sin_2phik, cos_2phik = np.sin(2 * phik), np.cos(2 * phik)
+        uk = phik + el["cus"] * sin_2phik + el["cuc"] * cos_2phik
+        rk = a * (1 - el["e"] * cos_ek) + el["crs"] * sin_2phik + el["crc"] * cos_2phik
+        ik = el["i0"] + el["idot"] * tk + el["cis"] * sin_2phik + el["cic"] * cos_2phik
+        xk_orb = rk * np.cos(uk)
+        yk_orb = rk * np.sin(uk)
+
+        # Longitude of ascending node refers to toe given in the time system of the GNSS
+        toe_sow = np.mod(self._toe[rec] - np.where(self._system[rec] == "C", BEIDOU_TIME_OFFSET, 0), SECONDS_PER_WEEK)
+        geo = self._geo[rec]
+        omega_k = el["Omega"] + el["Omega_dot"] * tk - omega_e * np.where(geo, toe_sow, tk + toe_sow)
+
+        sin_ok, cos_ok = np.sin(omega_k), np.cos(omega_k)
+        sin_ik, cos_ik = np.sin(ik), np.cos(ik)
+        xyz = np.column_stack(
+            (
+                xk_orb * cos_ok - yk_orb * cos_ik * sin_ok,
+                xk_orb * sin_ok + yk_orb * cos_ik * cos_ok,
+                yk_orb * sin_ik,
+            )
+        )
+
+        # BeiDou GEO satellites are given in an inertial frame rotated -5 degrees about the x-axis
+        if np.any(geo):
+            xyz[geo] = _beidou_geo_to_earth_fixed(xyz[geo], omega_e[geo] * tk[geo])
+        pos[valid] = xyz
+
+        # Clock correction with relativistic effect
+        dt = t - self._toc[rec]
+        f_rel = -2 * np.sqrt(gm) / constant.c ** 2
+        clk[valid] = (
+            el["sat_clock_bias"]
+            + el["sat_clock_drift"] * dt
+            + el["sat_clock_drift_rate"] * dt ** 2
+            + f_rel * el["e"] * el["sqrt_a"] * sin_ek
+        )
+
+        return pos, clk
+
+    def _select(self, gps_sec: np.ndarray, satellite: np.ndarray) -> np.ndarray:
+        """Find index of valid record given times in GPS seconds, see select_records"""
+        gps_sec, satellite = np.broadcast_arrays(np.asarray(gps_sec, dtype=float), np.asarray(satellite))
+        sat_idx = np.searchsorted(self.satellites, satellite)
+        sat_idx = np.clip(sat_idx, 0, max(len(self.satellites) - 1, 0))
+        known = (self.satellites[sat_idx] == satellite) if len(self.satellites) else np.zeros(satellite.shape, bool)
+
+        rec = np.searchsorted(self._key, sat_idx * self._stride + gps_sec, side="right") - 1
+        rec = np.maximum(rec, self._first[sat_idx] if len(self.satellites) else 0)
+        return np.where(known, rec, -1)
+
+
+def _gps_seconds(time: Union[TimeArray, np.ndarray]) -> np.ndarray:
+    """Convert time to GPS seconds since the GPS epoch
+
+    Args:
+        time:  Time object or array of GPS seconds (returned unchanged).
+
+    Returns:
+        GPS seconds since the GPS epoch.
+    """
+    if isinstance(time, TimeArray) or hasattr(time, "gps_ws"):
+        week, sow, _ = time.gps.gps_ws
+        return np.atleast_1d(np.asarray(week, dtype=float) * SECONDS_PER_WEEK + sow)
+    return np.atleast_1d(np.asarray(time, dtype=float))
+
+
+def _solve_kepler(mean_anomaly: np.ndarray, e: np.ndarray, tol: float = 1e-13, max_iter: int = 20) -> np.ndarray:
+    """Solve Kepler's equation E - e sin(E) = M with vectorized Newton iterations
+
+    Args:
+        mean_anomaly:  Mean anomaly M in radians.
+        e:             Eccentricity.
+        tol:           Convergence limit for the correction of the eccentric anomaly in radians.
+        max_iter:      Maximal number of iterations.
+
+    Returns:
+        Eccentric anomaly E in radians.
+    """
+    ecc_anomaly = mean_anomaly.copy()
+    for _ in range(max_iter):
+        delta = (ecc_anomaly - e * np.sin(ecc_anomaly) - mean_anomaly) / (1 - e * np.cos(ecc_anomaly))
+        ecc_anomaly -= delta
+        if np.max(np.abs(delta), initial=0) < tol:
+            break
+    return ecc_anomaly
+
+
+def _beidou_geo_to_earth_fixed(xyz: np.ndarray, angle: np.ndarray) -> np.ndarray:
+    """Rotate BeiDou GEO positions to the Earth-fixed frame
+
+    See BDS-SIS-ICD-2.0, section 5.2.4.12: The positions are rotated by -5 degrees about the x-axis and by the
+    Earth rotation angle since toe about the z-axis.
+
+    Args:
+        xyz:    Positions in the user-defined inertial frame, shape (n, 3).
+        angle:  Earth rotation angle omega_e * tk in radians.
+
+    Returns:
+        Positions in Earth-fixed frame, shape (n, 3).
+    """
+    sin_x, cos_x = np.sin(np.radians(-5)), np.cos(np.radians(-5))
+    y = cos_x * xyz[:, 1] + sin_x * xyz[:, 2]
+    z = -sin_x * xyz[:, 1] + cos_x * xyz[:, 2]
+    sin_z, cos_z = np.sin(angle), np.cos(angle)
+    return np.column_stack((cos_z * xyz[:, 0] + sin_z * y, -sin_z * xyz[:, 0] + cos_z * y, z))
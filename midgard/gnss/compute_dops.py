@@ -5,16 +5,20 @@ Description:
 
 Calculate GDOP, PDOP, TDOP, HDOP and VDOP based on elevation and azimuth between station and satellite for each 
 observation epoch.
+
+The function `compute_dops` determines the DOPs for one observation epoch, whereas `compute_dops_batch` determines
+the DOPs for all observation epochs at once.
 """
 
 # Standard library imports
-from typing import Tuple
+from typing import Callable, Optional, Tuple, Union
 
 # External library imports
 import numpy as np
 
 # Midgard imports
 from midgard.dev import log
+from midgard.gnss.gnss import group_index
 
 
 def compute_dops(az: np.ndarray, el: np.ndarray) -> Tuple[np.ndarray, ...]:
@@ -69,3 +73,66 @@ def compute_dops(az: np.ndarray, el: np.ndarray) -> Tuple[np.ndarray, ...]:
         tdop = np.sqrt(Q[3, 3])  # TDOP
 
     return gdop, pdop, tdop, hdop, vdop
+
+
+def compute_dops_batch(
+    epochs: np.ndarray,
+    az: np.ndarray,
+    el: np.ndarray,
+    weights: Optional[Union[np.ndarray, Callable[[np.ndarray], np.ndarray]]] = None,
+) -> Tuple[np.ndarray, ...]:
+    """Compute dilution of precision (DOP) for several observation epochs
+
+    The observations are grouped by observation epoch. The normal matrices N = H^t*W*H of all epochs are accumulated
+    in one (n_epochs, 4, 4) array and inverted at once. See `compute_dops` for the definition of the design matrix H.
+    The DOPs of epochs, where the normal matrix is singular (e.g. less than 4 satellites), are set to NaN.
+
+    The observations can be weighted, for example with elevation-dependent weights:
+
+        >>> compute_dops_batch(epochs, az, el, weights=lambda el: np.sin(el) ** 2)  # doctest: +SKIP
+
+    Args:
+        epochs:   Observation epochs, one for each observation (e.g. as datetime objects or seconds)
+        az:       Satellite azimuth angle for each observation (radians)
+        el:       Satellite elevation angle for each observation (radians)
+        weights:  Observation weights given either as array or as function of the elevation angle. Default is equal
+                  weights for all observations.
+
+    Returns:
+        Tuple with GDOP, PDOP, TDOP, HDOP and VDOP arrays with one entry for each unique epoch, sorted in the same way
+        as np.unique(epochs).
+    """
+    az = np.asarray(az, dtype=float)
+    el = np.asarray(el, dtype=float)
+    if weights is None:
+        weights = np.ones(el.shape)
+    elif callable(weights):
+        weights = weights(el)
+    weights = np.broadcast_to(np.asarray(weights, dtype=float), el.shape)
+
+    # Group observations by epoch
+    idx_epoch, num_epochs = group_index(epochs)
+
+    # Accumulate the (symmetric) normal matrix N = H^t*W*H for each epoch
+    H = np.stack((-np.cos(el) * np.cos(az), -np.cos(el) * np.sin(az), -np.sin(el), np.ones(el.shape)), axis=1)
+    N = np.empty((num_epochs, 4, 4))
+    for row in range(4):
+        for col in range(row, 4):
+            N[:, row, col] = N[:, col, row] = np.bincount(
+                idx_epoch, weights=weights * H[:, row] * H[:, col], minlength=num_epochs
+            )
+
+    # Invert normal matrices, which are not singular
+    Q = np.full(N.shape, np.nan)
+    is_regular = np.linalg.cond(N) < 1 / np.finfo(float).eps if num_epochs else np.zeros(0, dtype=bool)
+    if not np.all(is_regular):
+        log.debug(f"Inverse of co-factor matrix Q could not be computed for {np.sum(~is_regular)} epoch(s).")
+    Q[is_regular] = np.linalg.inv(N[is_regular])
+
+    gdop = np.sqrt(np.trace(Q, axis1=1, axis2=2))  # GDOP
+    pdop = np.sqrt(Q[:, 0, 0] + Q[:, 1, 1] + Q[:, 2, 2])  # PDOP
+    hdop = np.sqrt(Q[:, 0, 0] + Q[:, 1, 1])  # HDOP
+    vdop = np.sqrt(Q[:, 2, 2])  # VDOP
+    tdop = np.sqrt(Q[:, 3, 3])  # TDOP
+
+    return gdop, pdop, tdop, hdop, vdop
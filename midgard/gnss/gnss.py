@@ -42,9 +42,54 @@ def obstype_to_freq(sys: str, obstype: str) -> float:
     return freq
 
 
+def group_index(*keys: np.ndarray) -> Tuple[np.ndarray, int]:
+    """Get group index of each element, where a group is given by a unique combination of keys
+
+    Grouping is done by sorting (np.unique), so the group indices follow the sort order of the keys.
+
+    Args:
+        keys:   Arrays of equal length with keys (e.g. systems, satellites, epochs)
+
+    Returns:
+        Tuple with group index of each element and number of groups
+    """
+    if not keys:
+        raise ValueError("At least one array with keys has to be given.")
+
+    idx_group = np.zeros(len(keys[0]), dtype=int)
+    num_groups = 1
+    for key in keys:
+        _, idx_key = np.unique(key, return_inverse=True)
+        num_key = idx_key.max() + 1 if idx_key.size else 0
+        # Combine group indices and renumber them to avoid overflow for many keys
+        _, idx_group = np.unique(idx_group * num_key + idx_key.ravel(), return_inverse=True)
+        num_groups = idx_group.max() + 1 if idx_group.size else 0
+
+    return idx_group.ravel(), num_groups
+
+
+def count_per_group(*keys: np.ndarray) -> np.ndarray:
+    """Count number of elements per group, where a group is given by a unique combination of keys
+
+    Example:
+        >>> count_per_group(np.array(["G", "G", "E", "G"]), np.array([1, 1, 1, 2]))
+        array([2, 2, 1, 1])
+
+    Args:
+        keys:   Arrays of equal length with keys (e.g. systems, epochs)
+
+    Returns:
+        Number of elements in the same group for each element
+    """
+    idx_group, num_groups = group_index(*keys)
+    return np.bincount(idx_group, minlength=num_groups)[idx_group]
+
+
 def get_number_of_satellites(systems: np.ndarray, satellites: np.ndarray, epochs: np.ndarray) -> np.ndarray:
     """Get number of satellites per epoch
 
+    The number of satellites is determined for each GNSS separately.
+
     Args:
         satellites:     Array with satellite PRN number together with GNSS identifier (e.g. G07)
         systems:        Array with GNSS identifiers (e.g. G, E, R, ...)
@@ -53,19 +98,10 @@ def get_number_of_satellites(systems: np.ndarray, satellites: np.ndarray, epochs
     Returns:
         Number of satellites per epoch
     """
-    num_satellite = np.zeros((len(systems)))
-
-    for sys in set(systems):
-        idx_sys = systems == sys
-        num_satellite_epoch = np.zeros((len(systems[idx_sys])))
-
-        for epoch in set(epochs):
-            idx = epochs[idx_sys] == epoch
-            num_satellite_epoch[idx] = len(satellites[idx_sys][idx])
-
-        num_satellite[idx_sys] = num_satellite_epoch
+    if len(satellites) != len(systems):
+        raise ValueError("Arrays with systems and satellites have to be of equal length.")
 
-    return num_satellite
+    return count_per_group(systems, epochs).astype(float)
 
 
 def get_rinex_file_version(file_path: pathlib.PosixPath) -> str:
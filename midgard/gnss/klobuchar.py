@@ -40,47 +40,62 @@ def klobuchar(time, ion_coeffs, rec_pos, az, el, freq_l1, freq=None, logger=log.
     Klobuchar, J.A. Ionospheric Time-Delay Algorithm for Single-Frequency GPS Users
     https://scinapse.io/papers/2058160370
 
+    The computation is vectorized, so that the delays of many observations can be computed in one call. The time,
+    azimuth and elevation can be given as scalars or arrays of length n, and the receiver position either as one
+    position (3,) or as one position per observation (n, 3).
+
+    Invalid observations (site height below -1000 m or elevation not above 0) lead to a ValueError for scalar input.
+    For array input the delays and variances of invalid observations are set to NaN.
+
     Args:
         time:       GPST
         ion_coeffs: iono model parameters {a0,a1,a2,a3,b0,b1,b2,b3} as vector
         rec_pos:    receiver position {lat,lon,h} [rad, rad, m] as vector
         az:         azimuth angle [rad]
         el:         elevation angle [rad]
-        system:     GNSS system
         freq_l1:    L1 frequency of given GNSS in [Hz]
-        freq:       Frequency in [Hz] for which ionospheric delay should be determined.
+        freq:       Frequency in [Hz] for which ionospheric delay should be determined. Several frequencies can be
+                    given as vector (m,), for which the delays are returned in the last dimension.
         logger:     Function that logs
 
     Returns:
-        iono_delay:    computed path delay for given frequency [m]
-        L1_variance:   corresponding variance [m^2]
+        iono_delay:    computed path delay for given frequency [m], shape (n,) or (n, m) for several frequencies
+        L1_variance:   corresponding variance [m^2], shape (n,)
 
     TODO: freq_L1 should be determined in klobuchar routine and argument be replaced by system. constants needed in
           Midgard.
     """
 
     # check the input args, and rename them
+    ion_coeffs = np.asarray(ion_coeffs, dtype=float)
     if len(ion_coeffs) != 8:
         raise ValueError(f"klobuchar_model()::number of iono coefficients={len(ion_coeffs)}, required 8")
     alpha, beta = ion_coeffs[:4], ion_coeffs[4:]
 
-    logger(" klobuchar_model():: input ionosphere parameters (alpha's and  beta's) are:")
-    logger(f" \t Alpha coeffs= {alpha[0]:.2E},{alpha[1]:.2E},{alpha[2]:.2E},{alpha[3]:.2E}")
-    logger(f" \t Beta coeffs = {beta[0]:.2E},{beta[1]:.2E},{beta[2]:.2E},{beta[3]:.2E}")
-
-    # input data checks
-    if rec_pos[2] < -1e3 or el <= 0.0:
-        raise ValueError(
-            f"klobuchar_model():: Invalid input parameters --> "
-            f"site height={rec_pos[2]:.2f}, elevation={el:.2f} [radians]"
-        )
-
     if np.linalg.norm(ion_coeffs, ord=8) <= 0.0:
         raise ValueError(
             "klobuchar_model():: Invalid input parameters --> "
             "missing ionosphere model parameters (a0, a1, a2, a3, b0, b1, b2, b3) .."
         )
 
+    rec_pos = np.asarray(rec_pos, dtype=float)
+    time, az, el, lat, lon, height = np.broadcast_arrays(
+        np.asarray(time, dtype=float),
+        np.asarray(az, dtype=float),
+        np.asarray(el, dtype=float),
+        rec_pos[..., 0],
+        rec_pos[..., 1],
+        rec_pos[..., 2],
+    )
+
+    # input data checks
+    invalid = (height < -1e3) | (el <= 0.0)
+    if invalid.ndim == 0 and invalid:
+        raise ValueError(
+            f"klobuchar_model():: Invalid input parameters --> "
+            f"site height={height:.2f}, elevation={el:.2f} [radians]"
+        )
+
     # ==================================================== #
     # 1. calculate the Earth centered angle (semi-circle)  #
     # ==================================================== #
@@ -89,41 +104,22 @@ def klobuchar(time, ion_coeffs, rec_pos, az, el, freq_l1, freq=None, logger=log.
     # ==================================================== #
     # 2. sub-ionospheric latitude/longitude (semi-circle)  #
     # ==================================================== #
-    phi = (rec_pos[0] / np.pi) + psi * np.cos(az)
-    # +TODO: old
-    # phi = 0.416 if phi > 0.416 else -0.416
-    # -TODO: old
-    if phi > 0.416:
-        phi = 0.416
-    elif phi < -0.416:
-        phi = -0.416
-    phi_ = phi
+    phi = np.clip(lat / np.pi + psi * np.cos(az), -0.416, 0.416)
 
     # ==================================================== #
     # 3. compute the sub-ionospheric  longitude           #
     # ==================================================== #
-    lam = rec_pos[1] / np.pi + psi * np.sin(az) / np.cos(phi * np.pi)
+    lam = lon / np.pi + psi * np.sin(az) / np.cos(phi * np.pi)
 
     # ==================================================== #
     #   4. compute geomagnetic latitude (semi-circle)      #
     # ==================================================== #
-    phi += 0.064 * np.cos((lam - 1.617) * np.pi)
+    phi = phi + 0.064 * np.cos((lam - 1.617) * np.pi)
 
     # ==================================================== #
     #       5. find the  local time (s)                    #
     # ==================================================== #
-    # +TODO: old
-    # # tt  = 43200.0*lam + time2gpst(t, week);
-    # tt = t
-    # tt -= np.floor(tt / 86400.0) * 86400.0  #  0<=tt<86400
-    # -TODO: old
-    tt = 43200.0 * lam + time
-    tt -= np.floor(tt / 86400.0) * 86400.0  # Seconds of day (0<=tt<86400)
-    # TODO: Do we need that?
-    if tt > 86400.0:
-        tt -= 86400.0
-    elif tt < 0.0:
-        tt += 86400.0
+    tt = np.mod(43200.0 * lam + time, 86400.0)  # Seconds of day (0<=tt<86400)
 
     # ==================================================== #
     #       6. compute the slant factor                    #
@@ -133,16 +129,11 @@ def klobuchar(time, ion_coeffs, rec_pos, az, el, freq_l1, freq=None, logger=log.
     # ==================================================== #
     #       7.  compute the L1 ionospheric time delay      #
     # ==================================================== #
-    amp = ion_coeffs[0] + phi * (ion_coeffs[1] + phi * (ion_coeffs[2] + phi * ion_coeffs[3]))  # compute the amplitude
-    per = ion_coeffs[4] + phi * (ion_coeffs[5] + phi * (ion_coeffs[6] + phi * ion_coeffs[7]))  # compute the periode
-    amp = 0.0 if amp < 0.0 else amp
-    per = 72000.0 if per < 72000.0 else per
+    amp = np.maximum(alpha[0] + phi * (alpha[1] + phi * (alpha[2] + phi * alpha[3])), 0.0)  # compute the amplitude
+    per = np.maximum(beta[0] + phi * (beta[1] + phi * (beta[2] + phi * beta[3])), 72000.0)  # compute the periode
     x = 2.0 * np.pi * (tt - 50400.0) / per
-    L1_delay = (
-        constant.c * f * (5e-9 + amp * (1.0 + x * x * (-0.5 + x * x / 24.0)))
-        if (np.fabs(x) < 1.57)
-        else constant.c * f * 5e-9
-    )
+    L1_delay = constant.c * f * (5e-9 + np.where(np.fabs(x) < 1.57, amp * (1.0 + x * x * (-0.5 + x * x / 24.0)), 0.0))
+    L1_delay = np.where(invalid, np.nan, L1_delay)
 
     # ==================================================== #
     #  8.  Ionospheric time delay for given frequency     #
@@ -152,7 +143,8 @@ def klobuchar(time, ion_coeffs, rec_pos, az, el, freq_l1, freq=None, logger=log.
     if freq is None:
         iono_delay = L1_delay
     else:
-        iono_delay = (freq_l1 / freq) ** 2 * L1_delay
+        freq = np.asarray(freq, dtype=float)
+        iono_delay = (freq_l1 / freq) ** 2 * (L1_delay if freq.ndim == 0 else L1_delay[..., None])
 
     # ========================================================= #
     # define ERR_BRDCI 0.5:  broadcast iono model error factor  #
@@ -161,22 +153,11 @@ def klobuchar(time, ion_coeffs, rec_pos, az, el, freq_l1, freq=None, logger=log.
     L1_variance = (L1_delay * 0.5) ** 2
 
     #  debuging info
-    logger(" ===================================       OUTPUT     ============================================")
-    logger(f"\t[1] Earth-centered angle      = {psi:11.5f} [semicircles]")
-    logger(f"\t[2] sub-ionospheric latitude  = {phi_:11.5f} [semicircles]")
-    logger(f"\t[3] sub-ionospheric longitude = {lam:11.5f} [semicircles]")
-    logger(f"\t[4] geomagnetic     latitude  = {phi:11.5f} [semicircles]")
-    logger(f"\t[5] local time                = {tt:11.5f} [seconds]")
-    logger(f"\t[6] slant factor              = {f:11.5f} ")
-    logger(f"\t[7] amplitude                 = {amp:11.5e}")
-    logger(f"\t[8] period                    = {per:11.5f}")
-    logger(
-        f"\t[9] ionosphere delay for frequency {freq * 1e-6:11.2f} Mhz and the corresponding variance are: "
-        f"{iono_delay:.5f} (m) and {L1_variance:.5f} (m^2)"
-    )
-    logger(" ================================================================================================")
+    if invalid.any():
+        logger(f"klobuchar_model():: Ionosphere delay set to NaN for {np.sum(invalid)} invalid observation(s)")
 
-    return iono_delay, L1_variance
+    # Return numpy scalars for scalar input
+    return iono_delay[()], L1_variance[()]
 
 
 def main():
@@ -188,8 +169,9 @@ def main():
     rec_pos = np.array([40.0 / 180.0, -100.0 / 180.0, 170])
     az = 240.0 / 180
     el = 20.0 / 180
+    freq_l1 = 1575420000.0
 
-    delay, variance = klobuchar(tt, ion_coeffs, rec_pos, az, el)
+    delay, variance = klobuchar(tt, ion_coeffs, rec_pos, az, el, freq_l1)
 
     # user info
     print(f" Ionospheric path delay on L1= {delay:.5f} [m] and the corresponding variance={variance:.5f} [m^2]")
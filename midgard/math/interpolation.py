@@ -44,6 +44,9 @@ For instance, the following would implement a terrible interpolation function th
 
         return _zero
 
+The scipy interpolators are imported inside the interpolator functions, since importing scipy is slow and not needed
+by all users of this module.
+
 This function would then be available as an interpolator. For instance, one could do
 
     >>> interpolate(x, y, x_new, kind='zero')  # doctest: +SKIP
@@ -55,8 +58,6 @@ from typing import Any, Callable, Dict, List
 
 # Third party imports
 import numpy as np
-import scipy.interpolate
-import scipy.misc
 
 # Midgard imports
 from midgard.dev import exceptions
@@ -128,6 +129,8 @@ def interpolate_with_derivative(
     Returns:
         Tuple with array of interpolated y-values and array of derivatives.
     """
+    import scipy.misc
+
     interpolator = _get_interpolator(kind)(x, y, **ipargs)
     y_new = interpolator(x_new)
     y_dot = scipy.misc.derivative(interpolator, x_new, dx=dx)
@@ -152,6 +155,8 @@ def cubic(x: np.ndarray, y: np.ndarray, **ipargs: Any) -> Callable:
     Returns:
         Cubic spline interpolation function
     """
+    import scipy.interpolate
+
     if y.ndim < 1:
         raise ValueError(f"The y array must have at least one dimension, currently y.ndim={y.ndim}.")
     # Interpolate along axis=0 by default
@@ -173,6 +178,8 @@ def barycentric_interpolator(x: np.ndarray, y: np.ndarray, **ipargs: Any) -> Cal
     Returns:
         Barycentric interpolation function
     """
+    import scipy.interpolate
+
     if y.ndim < 1:
         raise ValueError(f"The y array must have at least one dimension, currently y.ndim={y.ndim}.")
     return scipy.interpolate.BarycentricInterpolator(x, y, **ipargs)
@@ -195,6 +202,8 @@ def interpolated_univariate_spline(x: np.ndarray, y: np.ndarray, **ipargs: Any)
     Returns:
         Interpolating spline function
     """
+    import scipy.interpolate
+
     if y.ndim < 1:
         raise ValueError(f"The y array must have at least one dimension, currently y.ndim={y.ndim}.")
     if y.ndim == 1:
@@ -313,6 +322,8 @@ def linear(x: np.ndarray, y: np.ndarray, **ipargs: Any) -> Callable:
     Returns:
         Linear interpolation function
     """
+    import scipy.interpolate
+
     if y.ndim < 1:
         raise ValueError(f"The y array must have at least one dimension, currently y.ndim={y.ndim}.")
 
@@ -335,6 +346,8 @@ def nearest(x: np.ndarray, y: np.ndarray, **ipargs: Any) -> Callable:
     Returns:
         Nearest neighbor interpolation function
     """
+    import scipy.interpolate
+
     if y.ndim < 1:
         raise ValueError(f"The y array must have at least one dimension, currently y.ndim={y.ndim}.")
 
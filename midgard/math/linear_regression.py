@@ -32,7 +32,6 @@ from typing import Union
 
 # Third party imports
 import numpy as np
-import statsmodels.api as sm
 
 @dataclass
 class LinearRegression:
@@ -124,7 +123,8 @@ class LinearRegression:
     def _generate_result_and_reject_outlier(self) -> object:
         """Generate LinearRegression result by rejecting outliers of x and y arrays
         """       
-       
+        import statsmodels.api as sm  # Importing statsmodels is slow, so it is only done when needed
+
         for ii in range(self.outlier_iteration):
             
             # Make linear regression analysis
@@ -143,6 +143,8 @@ class LinearRegression:
     def _generate_result(self) -> object:
         """Generate LinearRegression result object
         """
+        import statsmodels.api as sm
+
         return sm.OLS(self.y, self._x_ones).fit()
 
     
@@ -152,4 +154,6 @@ class LinearRegression:
         
         This is needed to get also interception results.
         """
+        import statsmodels.api as sm
+
         return sm.add_constant(self.x)  
@@ -26,6 +26,10 @@ ynew = np.arange(-5.01, 5.01, 1e-2)
 # Interpolate for given data points
 values_new = spatial_interpolation.interpolate(grid_x, grid_y, values, xnew, ynew, kind="griddata")
 
+# Build the interpolator once and reuse it for many arrays of data points
+ip = spatial_interpolation.interpolator(grid_x, grid_y, values, kind="griddata")
+values_new = ip(xnew, ynew)
+
 
 
 Developer info:
@@ -41,13 +45,28 @@ interpolator function should have the signature
         y: Union[float, np.ndarray],
     ) -> np.ndarray
 
+Building the underlying scipy interpolator (triangulation, spline fit) is the expensive part of an interpolation. The
+interpolators are therefore built by builder functions decorated with `@register_builder`, which have the signature
+
+    (   grid_x: np.ndarray,
+        grid_y: np.ndarray,
+        values: np.ndarray,
+        **kwargs: Any,
+    ) -> Callable[[np.ndarray, np.ndarray], np.ndarray]
+
+scipy is imported inside the builder functions, since importing scipy is slow.
+
+Built interpolators are cached, keyed on the identity of the grid arrays, the kind of interpolator and the keyword
+arguments. The grid arrays should therefore not be changed in place after an interpolator has been built for them. Use
+`clear_cache()` if that cannot be avoided.
+
 """
 # Standard library imports
-from typing import Any, Callable, Dict, List, Union
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Tuple, Union
 
 # Third party imports
 import numpy as np
-import scipy.interpolate 
 
 # Midgard imports
 from midgard.dev import exceptions
@@ -56,6 +75,13 @@ from midgard.dev import exceptions
 # Dictionary of Enumerations. Populated by the @register_enum-decorators.
 _INTERPOLATORS: Dict[str, Callable] = dict()
 
+# Dictionary of interpolator builders. Populated by the @register_builder-decorators.
+_BUILDERS: Dict[str, Callable] = dict()
+
+# Cache of built interpolators, see _build()
+_CACHE: "OrderedDict[Tuple[Any, ...], Tuple[np.ndarray, np.ndarray, np.ndarray, Callable]]" = OrderedDict()
+_CACHE_SIZE = 32
+
 
 def register_interpolator(func: Callable) -> Callable:
     """Register an interpolation function
@@ -73,6 +99,23 @@ def register_interpolator(func: Callable) -> Callable:
     return func
 
 
+def register_builder(func: Callable) -> Callable:
+    """Register an interpolator builder
+
+    This function should be used as a @register_builder-decorator. The name of the builder function should be the
+    name of the interpolator followed by `_builder`.
+
+    Args:
+        func: Function that will be registered as an interpolator builder.
+
+    Returns:
+        Same function.
+    """
+    name = func.__name__.removesuffix("_builder")
+    _BUILDERS[name] = func
+    return func
+
+
 def interpolators() -> List[str]:
     """Return a list of available interpolators
 
@@ -108,20 +151,64 @@ def interpolate(
         Array of interpolated y-values.
     """
     # Check if data points for interpolation are in the boundary of the grid
-    if not (
-        x >= np.min(grid_x)
-        and x <= np.max(grid_x)
-        and y >= np.min(grid_y)
-        and y <= np.max(grid_y)
-    ):
-        raise ValueError(
-            f"Given data points for interpolation (x: {x}, y: {y}) exceeds grid boundaries (x_min: {np.min(grid_x)}, x_max: {np.max(grid_x)}, y_min: {np.min(grid_y)}, y_max: {np.max(grid_y)})"
-        )
+    _check_boundaries(x, y, *_grid_boundaries(grid_x, grid_y))
 
     interpolator = _get_interpolator(kind)(grid_x, grid_y, values, x, y, **kwargs)
     return interpolator
 
 
+def interpolator(
+        grid_x: np.ndarray,
+        grid_y: np.ndarray,
+        values: np.ndarray,
+        kind: str,
+        bounds_error: bool = True,
+        **kwargs: Any,
+) -> Callable[[np.ndarray, np.ndarray], np.ndarray]:
+    """Build an interpolator for a grid, which can be reused for many data points
+
+    The interpolator is built only once for a given grid, kind and keyword arguments. Later calls with the same grid
+    arrays return the cached interpolator. See `interpolators()` for a list of valid interpolators.
+
+    Args:
+        grid_x:       (n,m) Array with x-positions for each grid point
+        grid_y:       (n,m) Array with y-positions for each grid point
+        values:       (n,m) Array with data values for each grid point
+        kind:         Name of interpolator to use.
+        bounds_error: If True, a ValueError is raised if any data point is outside the grid, otherwise NaN is
+                      returned for such data points.
+        kwargs:       Keyword arguments passed on to the interpolator builder.
+
+    Returns:
+        Function taking x- and y-positions as scalars or arrays and returning interpolated values.
+    """
+    build = _build(kind, grid_x, grid_y, values, **kwargs)
+    boundaries = _grid_boundaries(grid_x, grid_y)
+
+    def _interpolator(x: Union[float, np.ndarray], y: Union[float, np.ndarray]) -> np.ndarray:
+        """Interpolate grid values for given x- and y-positions"""
+        x, y = np.broadcast_arrays(np.asarray(x, dtype=float), np.asarray(y, dtype=float))
+        if bounds_error:
+            _check_boundaries(x, y, *boundaries)
+            return build(x, y)
+
+        outside = _outside_boundaries(x, y, *boundaries)
+        if not np.any(outside):
+            return build(x, y)
+        result = np.full(x.shape, np.nan)
+        inside = ~outside
+        if np.any(inside):
+            result[inside] = build(x[inside], y[inside])
+        return result
+
+    return _interpolator
+
+
+def clear_cache() -> None:
+    """Remove all cached interpolators"""
+    _CACHE.clear()
+
+
 #
 # INTERPOLATORS
 # 
@@ -155,10 +242,7 @@ def griddata(
     Returns:
         Interpolated value in data grid for a given position
     """
-    method = kwargs["method"] if "method" in kwargs.keys() else "linear"
-    grid_points = np.array([grid_x.flatten(), grid_y.flatten()]).T
-    
-    return scipy.interpolate.griddata(grid_points, values.flatten(), (x, y), method=method)
+    return _build("griddata", grid_x, grid_y, values, **kwargs)(x, y)
     
     
 @register_interpolator
@@ -185,11 +269,7 @@ def rect_bivariate_spline(
     Returns:
         Interpolated value in data grid for a given position
     """
-    # Note: The data point coordinates need to be sorted by increasing order. Therefore the y- (grid_y) and z-values
-    #       (values) has to be rearranged.
-    interp = scipy.interpolate.RectBivariateSpline(np.flip(grid_y[:,0]), grid_x[0], np.flipud(values))
-    
-    return interp.ev(np.array(y),np.array(x))
+    return _build("rect_bivariate_spline", grid_x, grid_y, values, **kwargs)(x, y)
     
     
 @register_interpolator
@@ -216,18 +296,212 @@ def regular_grid_interpolator(
     Returns:
         Interpolated value in data grid for a given position
     """
-    interp = scipy.interpolate.RegularGridInterpolator((np.flip(grid_y[:,0]), grid_x[0]), np.flipud(values))
     if type(x) == float or type(x) == np.float64:
         x = np.array([x])
         y = np.array([y])
-    points = list(map(lambda coord: list(coord), zip(y,x)))
 
-    return interp(points)
-    
-       
+    return _build("regular_grid_interpolator", grid_x, grid_y, values, **kwargs)(x, y)
+
+
+#
+# INTERPOLATOR BUILDERS
+#
+@register_builder
+def griddata_builder(
+        grid_x: np.ndarray,
+        grid_y: np.ndarray,
+        values: np.ndarray,
+        **kwargs: Any,
+) -> Callable[[np.ndarray, np.ndarray], np.ndarray]:
+    """Build griddata interpolator
+
+    The Delaunay triangulation of the grid points is done only once, while scipy.interpolate.griddata would redo it
+    for every call. The 'method' argument can be chosen as for the `griddata` interpolator.
+
+    Args:
+        grid_x: (n,m) Array with x-positions for each grid point
+        grid_y: (n,m) Array with y-positions for each grid point
+        values: (n,m) Array with data values for each grid point
+        kwargs:       Keyword arguments, only 'method' is used.
+
+    Returns:
+        Interpolation function taking x- and y-positions
+    """
+    import scipy.interpolate
+    import scipy.spatial
+
+    method = kwargs.get("method", "linear")
+    grid_points = np.column_stack((grid_x.ravel(), grid_y.ravel()))
+    grid_values = values.ravel()
+
+    if method == "nearest":
+        interp = scipy.interpolate.NearestNDInterpolator(grid_points, grid_values)
+    elif method == "linear":
+        interp = scipy.interpolate.LinearNDInterpolator(scipy.spatial.Delaunay(grid_points), grid_values)
+    elif method == "cubic":
+        interp = scipy.interpolate.CloughTocher2DInterpolator(scipy.spatial.Delaunay(grid_points), grid_values)
+    else:
+        raise ValueError(f"Unknown griddata interpolation method '{method}'. Use 'linear', 'nearest' or 'cubic'.")
+
+    return interp
+
+
+@register_builder
+def rect_bivariate_spline_builder(
+        grid_x: np.ndarray,
+        grid_y: np.ndarray,
+        values: np.ndarray,
+        **kwargs: Any,
+) -> Callable[[np.ndarray, np.ndarray], np.ndarray]:
+    """Build RectBivariateSpline interpolator
+
+    Args:
+        grid_x: (n,m) Array with x-positions for each grid point
+        grid_y: (n,m) Array with y-positions for each grid point
+        values: (n,m) Array with data values for each grid point
+        kwargs:       Keyword arguments (not used).
+
+    Returns:
+        Interpolation function taking x- and y-positions
+    """
+    import scipy.interpolate
+
+    # Note: The data point coordinates need to be sorted by increasing order. Therefore the y- (grid_y) and z-values
+    #       (values) has to be rearranged.
+    interp = scipy.interpolate.RectBivariateSpline(np.flip(grid_y[:, 0]), grid_x[0], np.flipud(values))
+
+    def _rect_bivariate_spline(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+        return interp.ev(np.asarray(y), np.asarray(x))
+
+    return _rect_bivariate_spline
+
+
+@register_builder
+def regular_grid_interpolator_builder(
+        grid_x: np.ndarray,
+        grid_y: np.ndarray,
+        values: np.ndarray,
+        **kwargs: Any,
+) -> Callable[[np.ndarray, np.ndarray], np.ndarray]:
+    """Build RegularGridInterpolator interpolator
+
+    Args:
+        grid_x: (n,m) Array with x-positions for each grid point
+        grid_y: (n,m) Array with y-positions for each grid point
+        values: (n,m) Array with data values for each grid point
+        kwargs:       Keyword arguments (not used).
+
+    Returns:
+        Interpolation function taking x- and y-positions
+    """
+    import scipy.interpolate
+
+    interp = scipy.interpolate.RegularGridInterpolator((np.flip(grid_y[:, 0]), grid_x[0]), np.flipud(values))
+
+    def _regular_grid_interpolator(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+        y, x = np.broadcast_arrays(np.asarray(y, dtype=float), np.asarray(x, dtype=float))
+        return interp(np.stack((y, x), axis=-1))
+
+    return _regular_grid_interpolator
+
+
 #
 # AUXILIARY FUNCTIONS
-#    
+#
+def _build(
+        kind: str,
+        grid_x: np.ndarray,
+        grid_y: np.ndarray,
+        values: np.ndarray,
+        **kwargs: Any,
+) -> Callable[[np.ndarray, np.ndarray], np.ndarray]:
+    """Build an interpolator, or return a cached one for the same grid
+
+    The cache is keyed on the identity of the grid arrays. References to the grid arrays are kept in the cache, so
+    that the identities are not reused by other arrays while the cache entry exists.
+
+    Args:
+        kind:    Name of interpolator to build.
+        grid_x:  (n,m) Array with x-positions for each grid point
+        grid_y:  (n,m) Array with y-positions for each grid point
+        values:  (n,m) Array with data values for each grid point
+        kwargs:  Keyword arguments passed on to the interpolator builder.
+
+    Returns:
+        Interpolation function taking x- and y-positions.
+    """
+    builder = _get_builder(kind)
+    try:
+        key = (kind, id(grid_x), id(grid_y), id(values), tuple(sorted(kwargs.items())))
+        hash(key)
+    except TypeError:
+        # Unhashable keyword arguments, do not cache
+        return builder(grid_x, grid_y, values, **kwargs)
+
+    if key in _CACHE:
+        _CACHE.move_to_end(key)
+        return _CACHE[key][-1]
+
+    interp = builder(grid_x, grid_y, values, **kwargs)
+    _CACHE[key] = (grid_x, grid_y, values, interp)
+    if len(_CACHE) > _CACHE_SIZE:
+        _CACHE.popitem(last=False)
+
+    return interp
+
+
+def _grid_boundaries(grid_x: np.ndarray, grid_y: np.ndarray) -> Tuple[float, float, float, float]:
+    """Return minimum and maximum x- and y-positions of a grid"""
+    return np.min(grid_x), np.max(grid_x), np.min(grid_y), np.max(grid_y)
+
+
+def _outside_boundaries(
+        x: np.ndarray, y: np.ndarray, x_min: float, x_max: float, y_min: float, y_max: float
+) -> np.ndarray:
+    """Return boolean array which is True for data points outside the grid boundaries"""
+    return (x < x_min) | (x > x_max) | (y < y_min) | (y > y_max)
+
+
+def _check_boundaries(
+        x: Union[float, np.ndarray],
+        y: Union[float, np.ndarray],
+        x_min: float,
+        x_max: float,
+        y_min: float,
+        y_max: float,
+) -> None:
+    """Raise ValueError if any of the data points are outside the grid boundaries"""
+    outside = _outside_boundaries(np.asarray(x), np.asarray(y), x_min, x_max, y_min, y_max)
+    if np.any(outside):
+        if np.ndim(outside) > 0:
+            x, y = np.broadcast_arrays(x, y)
+            x, y = x[outside], y[outside]
+        raise ValueError(
+            f"Given data points for interpolation (x: {x}, y: {y}) exceeds grid boundaries (x_min: {x_min}, "
+            f"x_max: {x_max}, y_min: {y_min}, y_max: {y_max})"
+        )
+
+
+def _get_builder(name: str) -> Callable:
+    """Return an interpolator builder
+
+    Interpolator builders are registered by the @register_builder-decorator.
+
+    Args:
+        name:  Name of interpolator.
+
+    Returns:
+        Interpolator builder for the interpolator with the given name.
+    """
+    try:
+        return _BUILDERS[name]
+    except KeyError:
+        builder_list = ", ".join(sorted(_BUILDERS))
+        raise exceptions.UnknownPluginError(
+            f"Interpolator '{name}' can not be built. Available interpolators are {builder_list}."
+        ) from None
+
+
 def _get_interpolator(name: str) -> Callable:
     """Return an interpolation function
 
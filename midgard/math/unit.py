@@ -55,6 +55,9 @@ However, using the full unit system adds some overhead so we should be careful i
 Note that `pint` has a system for defining new units and constants if necessary,
 `http://pint.readthedocs.io/en/latest/defining.html`. To use this system, add units to the `unit.txt` file in the
 current (midgard/math) directory.
+
+Importing `pint` and setting up the unit registry is slow, so this is not done until the first unit conversion.
+Conversion scales are cached, so that repeated conversions like `Unit.km2m` are cheap.
 """
 
 # Standard library imports
@@ -69,7 +72,6 @@ except ImportError:
 
 # Third party imports
 import numpy as np
-import pint
 
 # Midgard imports
 from midgard.dev import exceptions
@@ -80,6 +82,9 @@ np_float = TypeVar("np_float", float, np.array)
 # The _UNITS-dict is used to keep track of units values returned by functions and methods
 _UNITS: Dict[str, Dict[str, str]] = dict()
 
+# Cache of conversion scales, populated by _convert_units.__call__
+_SCALES: Dict[Tuple[str, str], Any] = dict()
+
 
 class _convert_units(type):
     """A meta-class that does the parsing of units
@@ -88,7 +93,23 @@ class _convert_units(type):
     can write `Unit.km2m` instead of `Unit().km2m`.
     """
 
-    _ureg = pint.UnitRegistry()
+    _registry = None
+
+    @property
+    def _ureg(cls) -> "pint.UnitRegistry":
+        """The pint unit registry, set up the first time it is used"""
+        if _convert_units._registry is None:
+            import pint
+
+            registry = pint.UnitRegistry()
+
+            # Read extra units defined specially for Midgard
+            source = importlib_resources.files("midgard.math").joinpath("unit.txt")
+            with importlib_resources.as_file(source) as unit_path:
+                registry.load_definitions(unit_path)
+            _convert_units._registry = registry
+
+        return _convert_units._registry
 
     def __call__(cls, from_unit: str, to_unit: Optional[str] = None) -> Any:  # type: ignore
         """Calculate the conversion scale between from_unit and to_unit
@@ -102,13 +123,25 @@ class _convert_units(type):
         Returns:
             Scale to multiply by to convert from from_unit to to_unit, or from_unit as a Quantity.
         """
+        if to_unit is None:
+            return cls._ureg(from_unit)
+
         try:
-            if to_unit is None:
-                return cls._ureg(from_unit)
-            else:
-                return cls._ureg(from_unit).to(to_unit).magnitude
+            return _SCALES[(from_unit, to_unit)]
+        except (KeyError, TypeError):
+            pass
+
+        import pint
+
+        try:
+            scale = cls._ureg(from_unit).to(to_unit).magnitude
         except pint.errors.DimensionalityError as err:
             raise exceptions.UnitError(err)
+        try:
+            _SCALES[(from_unit, to_unit)] = scale
+        except TypeError:
+            pass  # Units are not hashable
+        return scale
 
     def __getattr__(cls, key: str) -> Any:
         """Simplify notation for converting between units
@@ -128,6 +161,13 @@ class _convert_units(type):
         Returns:
             Scale to multiply by or function to perform the unit conversion, or Quantity.
         """
+        if key.startswith("__"):
+            raise AttributeError(key)  # Special attributes are not units
+        if key == "DimensionalityError":
+            # Make pint exception available without importing pint when the module is imported
+            from pint.errors import DimensionalityError
+
+            return DimensionalityError
         if "2" in key:
             from_unit, _, to_unit = key.partition("2")
             return cls(from_unit, to_unit)
@@ -325,9 +365,6 @@ class Unit(metaclass=_convert_units):
     The implementation of the unit conversion is done in the `_convert_units`-metaclass.
     """
 
-    # Make pint exceptions available
-    from pint.errors import DimensionalityError
-
     #
     # Conversion routines not defined by pint
     #
@@ -458,6 +495,8 @@ class Unit(metaclass=_convert_units):
 
     @classmethod
     def symbol(cls, unit: str):
+        import pint
+
         if unit == "unitless" or unit == "dimensionless":
             return ""
         try:
@@ -472,8 +511,3 @@ class Unit(metaclass=_convert_units):
                     unit = unit.replace(u, cls._ureg._units[u].symbol).replace(" ", "")
             return unit
 
-
-# Read extra units defined specially for Midgard
-source = importlib_resources.files("midgard.math").joinpath("unit.txt")
-with importlib_resources.as_file(source) as unit_path:
-    Unit._ureg.load_definitions(unit_path)
@@ -22,13 +22,23 @@ To use a parser, you will typically use the `parse_file`-function defined below
 
 The name used in `parse_file` to call the parser is the name of the module
 (file) containing the parser.
+
+Many independent files can be parsed in parallel with the `parse_files`-function,
+which returns the parsed data as Midgard Datasets
+
+    dset = parsers.parse_files('rinex3_nav', file_paths, workers=8, merge=True)
 """
 
 # Standard library imports
+from concurrent import futures
+import io
+import os
 import pathlib
-from typing import Any, Callable, List, Optional, Union
+from typing import Any, Callable, Dict, Iterable, List, Optional, Union
 
 # Midgard imports
+from midgard.data import dataset
+from midgard.dev import log
 from midgard.dev import plugins
 from midgard.dev.timer import Timer
 
@@ -36,7 +46,7 @@ from midgard.dev.timer import Timer
 from midgard.parsers._parser import Parser  # noqa
 from midgard.parsers._parser_chain import ParserDef, ChainParser  # noqa
 from midgard.parsers._parser_line import LineParser  # noqa
-from midgard.parsers._parser_rinex import RinexParser, RinexHeader  # noqa
+from midgard.parsers._parser_rinex import RinexParser, RinexHeader, RinexObsChunksMixin  # noqa
 from midgard.parsers._parser_sinex import SinexParser, SinexBlock, SinexField  # noqa
 
 
@@ -84,6 +94,117 @@ def parse_file(
     return parser
 
 
+def parse_files(
+    parser_name: str,
+    file_paths: Iterable[Union[str, pathlib.Path]],
+    workers: Optional[int] = None,
+    merge: bool = False,
+    encoding: Optional[str] = None,
+    timer_logger: Optional[Callable[[str], None]] = None,
+    **parser_args: Any,
+) -> Union[List[Optional[dataset.Dataset]], dataset.Dataset]:
+    """Use the given parser on several files in parallel and return parsed data as datasets
+
+    The files are parsed in a pool of `workers` processes. Each worker converts the parsed data to a Midgard Dataset
+    with `as_dataset`, and sends it back as an in-memory HDF5 file. Thereby only compact binary arrays are transferred
+    between the processes instead of pickled Python objects. The parser must therefore implement `as_dataset`.
+
+    Example:
+
+        >>> dset = parse_files('rinex3_nav', ['brdm0010.19p', 'brdm0020.19p'], workers=2, merge=True)  # doctest: +SKIP
+
+    Args:
+        parser_name:    Name of parser
+        file_paths:     Paths to files that should be parsed.
+        workers:        Number of worker processes, default is the number of CPUs. With 1 worker the files are parsed
+                        in the current process.
+        merge:          Whether to merge the datasets of all files into one dataset.
+        encoding:       Encoding in files that are parsed.
+        timer_logger:   Logging function that will be used to log progress and timing information.
+        parser_args:    Input arguments to the parser
+
+    Returns:
+        List with one dataset for each file in input order (None for files without data), or one merged dataset where
+        the observations are given in input order.
+    """
+    file_paths = list(file_paths)
+    workers = min(workers or os.cpu_count() or 1, max(len(file_paths), 1))
+    payloads: List[Optional[bytes]] = [None] * len(file_paths)
+
+    with Timer(f"Finish {parser_name} ({__name__}) - {len(file_paths)} files in", logger=timer_logger) as timer:
+        progress = timer.logger
+        if workers == 1:
+            for idx, file_path in enumerate(file_paths):
+                payloads[idx] = _parse_file_to_hdf5(parser_name, file_path, encoding, parser_args)
+                progress(f"Parsed {idx + 1}/{len(file_paths)} {parser_name} files in {timer.elapsed():.4f} seconds")
+        else:
+            with futures.ProcessPoolExecutor(max_workers=workers) as executor:
+                jobs = {
+                    executor.submit(_parse_file_to_hdf5, parser_name, file_path, encoding, parser_args): idx
+                    for idx, file_path in enumerate(file_paths)
+                }
+                for num_done, job in enumerate(futures.as_completed(jobs), start=1):
+                    payloads[jobs[job]] = job.result()
+                    progress(
+                        f"Parsed {num_done}/{len(file_paths)} {parser_name} files in {timer.elapsed():.4f} seconds"
+                    )
+
+    dsets = [None if p is None else dataset.Dataset.read(io.BytesIO(p)) for p in payloads]
+    if not merge:
+        return dsets
+
+    dsets = [d for d in dsets if d is not None]
+    if not dsets:
+        log.warn(f"No data available in {len(file_paths)} {parser_name} files")
+        return dataset.Dataset()
+    return _merge_datasets(dsets)
+
+
+def _merge_datasets(dsets: List[dataset.Dataset]) -> dataset.Dataset:
+    """Merge datasets into one dataset with the observations in input order
+
+    Extending one dataset with each of the others in turn copies the observations merged so far for every dataset,
+    which is quadratic in the number of datasets. Instead neighbouring datasets are merged pairwise, level by level,
+    so that every observation is only copied a logarithmic number of times.
+
+    Args:
+        dsets:  Datasets to merge, at least one. The datasets are changed in place.
+
+    Returns:
+        Merged dataset.
+    """
+    while len(dsets) > 1:
+        for first, second in zip(dsets[::2], dsets[1::2]):
+            first.extend(second)
+        dsets = dsets[::2]
+    return dsets[0]
+
+
+def _parse_file_to_hdf5(
+    parser_name: str, file_path: Union[str, pathlib.Path], encoding: Optional[str], parser_args: Dict[str, Any]
+) -> Optional[bytes]:
+    """Parse a file and return the parsed data as a dataset in an in-memory HDF5 file
+
+    Used as worker function by `parse_files`.
+
+    Args:
+        parser_name:    Name of parser
+        file_path:      Path to file that should be parsed.
+        encoding:       Encoding in file that is parsed.
+        parser_args:    Input arguments to the parser
+
+    Returns:
+        Content of HDF5 file with the parsed data, or None if no data are available.
+    """
+    parser = parse_file(parser_name, file_path, encoding=encoding, timer_logger=None, **parser_args)
+    if not parser.data_available:
+        return None
+
+    payload = io.BytesIO()
+    parser.as_dataset().write(payload)
+    return payload.getvalue()
+
+
 def names() -> List[str]:
     """List the names of the available parsers
 
@@ -15,9 +15,9 @@ Example:
 
 """
 # Standard library imports
-import itertools
 import re
-from typing import Any, Callable, Dict, NamedTuple, Optional
+import copy
+from typing import Any, Callable, Dict, Iterator, NamedTuple, Optional
 
 # Midgard imports
 from midgard.files import files
@@ -53,6 +53,9 @@ class ParserDef(NamedTuple):
                                  'strip':     <optional characters to be removed from beginning and end of line>
                      }}
 
+    A parser function can set the entry `skip_group` in the cache to True. The remaining lines of the group are then
+    not parsed, only the end_marker is checked for them.
+
     Args:
         end_marker:   A function returning True for the last line in a group.
         label:        A function returning a label used in the parser_def.
@@ -85,36 +88,90 @@ class ChainParser(Parser):
     def read_data(self) -> None:
         """Read data from a data file and parse the contents
         """
+        for _ in self.read_groups():
+            pass
+
+    def read_groups(self) -> Iterator[Dict[str, Any]]:
+        """Read data from a data file group by group
+
+        A group is the lines handled by one ParserDef in the chain of parsers. The data are stored in `self.data` and
+        `self.meta` as by `read_data`, but the caller gets control back after each group.
+
+        Returns:
+            Generator yielding the cache of each group after all lines of the group are parsed.
+        """
         # Get chain of parsers
         parsers_chain = iter(self.setup_parser())
         parser = next(parsers_chain)  # Pointing to first parser
         cache = dict(line_num=0)
 
         with files.open(self.file_path, mode="rt", encoding=self.file_encoding) as fid:
-            # Get iterators for current and next line
-            line_iter, next_line_iter = itertools.tee(fid)
-            next(next_line_iter, None)
-
-            # Iterate over all file lines including last line by using zip_longest
-            for line, next_line in itertools.zip_longest(line_iter, next_line_iter):
+            # The file iterator is always advanced one line ahead, so that the next line is available for the end
+            # marker and the last line of the file is recognized
+            line_iter = iter(fid)
+            next_line = next(line_iter, None)
+            parse_line = self._compiled_parse_line(parser)
+
+            while next_line is not None:
+                line = next_line.rstrip()
+                next_line = next(line_iter, None)
                 cache["line_num"] += 1
-                self.parse_line(line.rstrip(), cache, parser)
+                if "skip_group" not in cache:
+                    parse_line(line, cache)
 
                 # Skip to next parser
-                if next_line is None or parser.end_marker(line.rstrip(), cache["line_num"], next_line):
+                if next_line is None or parser.end_marker(line, cache["line_num"], next_line):
                     if parser.end_callback is not None:
                         parser.end_callback(cache)
+                    yield cache
                     cache = dict(line_num=0)
                     try:
                         parser = next(parsers_chain)
                     except StopIteration:
                         break
+                    parse_line = self._compiled_parse_line(parser)
+
+    def read_chunks(self, chunk_groups: int, num_header_groups: int = 1) -> Iterator["ChainParser"]:
+        """Read data from a data file in chunks of groups
+
+        The first `num_header_groups` groups are read as header. Afterwards `self.data` and `self.meta` are reset to a
+        copy of the header information before each chunk, so that only the data of one chunk are kept in memory.
+        Groups skipped by the parser functions (see `skip_group` in ParserDef) are not counted.
+
+        Args:
+            chunk_groups:       Number of groups (after the header) in each chunk.
+            num_header_groups:  Number of groups at the beginning of the file that are read as header.
+
+        Returns:
+            Generator yielding the parser itself with the data of each chunk, before postprocessing.
+        """
+        if chunk_groups < 1:
+            raise ValueError(f"Number of groups in a chunk must be positive, not {chunk_groups}")
+
+        groups = self.read_groups()
+        for _ in zip(range(num_header_groups), groups):
+            pass
+        header_data, header_meta = copy.deepcopy(self.data), copy.deepcopy(self.meta)
+
+        num_groups = 0
+        for cache in groups:
+            if cache.get("skip_group"):
+                continue
+            num_groups += 1
+            if num_groups == chunk_groups:
+                yield self
+                self.data, self.meta = copy.deepcopy(header_data), copy.deepcopy(header_meta)
+                num_groups = 0
+
+        if num_groups:
+            yield self
 
     def parse_line(self, line: str, cache: Dict[str, Any], parser: ParserDef) -> None:
         """Parse line
 
         A line is parsed by separating a line in fields. How the separation is done, is defined in the `parser_def`
-        entry of the ParserDef.
+        entry of the ParserDef. The `parser_def` entries are compiled to line parser functions the first time a
+        ParserDef is used, see `_compile_parser_def`.
 
         Args:
             line:    Line to be parsed.
@@ -127,21 +184,108 @@ class ChainParser(Parser):
         if parser.skip_line and parser.skip_line(line):
             return
 
-        label = parser.label(line.rstrip(), cache["line_num"])
-        if label not in parser.parser_def:
-            return
+        line_parser = self._line_parsers(parser)[parser.label(line.rstrip(), cache["line_num"])]
+        if line_parser is not None:
+            line_parser(line, cache)
+
+    def _compiled_parse_line(self, parser: ParserDef) -> Callable[[str, Dict[str, Any]], None]:
+        """Get function parsing one line with the given ParserDef
+
+        The returned function does the same as `parse_line`, but looks up the label, skip_line and compiled line
+        parsers only once for each ParserDef. If a subclass overrides `parse_line`, that method is used instead.
+
+        Args:
+            parser:  ParserDef with the parser definitions.
+
+        Returns:
+            Function parsing a line, called with the line and the cache.
+        """
+        if type(self).parse_line is not ChainParser.parse_line:
+            return lambda line, cache: self.parse_line(line, cache, parser)
+
+        label = parser.label
+        if not label:
+            return lambda line, cache: None
+
+        skip_line = parser.skip_line
+        line_parsers = self._line_parsers(parser)
+
+        def parse_line(line: str, cache: Dict[str, Any]) -> None:
+            if skip_line and skip_line(line):
+                return
+            line_parser = line_parsers[label(line, cache["line_num"])]
+            if line_parser is not None:
+                line_parser(line, cache)
+
+        return parse_line
+
+    def _line_parsers(self, parser: ParserDef) -> "_LineParsers":
+        """Get line parser functions for each label of a ParserDef
+
+        The compiled line parsers are stored together with the ParserDef, so that they are only compiled once for
+        each ParserDef, also when the same ParserDef is repeated in the chain of parsers.
+
+        Args:
+            parser:  ParserDef with the parser definitions.
+
+        Returns:
+            Dictionary with labels as keys and line parser functions as values.
+        """
+        compiled = self.__dict__.setdefault("_compiled_parsers", dict())
+        if id(parser) not in compiled:
+            compiled[id(parser)] = (parser, _LineParsers(parser.parser_def))  # Reference keeps id of parser unique
+        return compiled[id(parser)][1]
+
+
+class _LineParsers(dict):
+    """Line parser functions for the labels of a parser definition, compiled when a label is first seen
+
+    Labels without parser definition are stored with the value None.
+    """
+
+    def __init__(self, parser_def: Dict[Any, Dict[str, Any]]) -> None:
+        super().__init__()
+        self.parser_def = parser_def
+
+    def __missing__(self, label: Any) -> Optional[Callable[[str, Dict[str, Any]], None]]:
+        line_parser = _compile_parser_def(self.parser_def[label]) if label in self.parser_def else None
+        self[label] = line_parser
+        return line_parser
+
+
+def _compile_parser_def(parser_def: Dict[str, Any]) -> Callable[[str, Dict[str, Any]], None]:
+    """Compile the parser definition of one label to a line parser function
+
+    Slice objects, strip characters and the delimiter regular expression are set up once, so that parsing of a line
+    only consists of slicing or splitting the line and calling the parser function.
+
+    Args:
+        parser_def:  Parser definition with the entries 'fields', 'parser' and optionally 'strip' and 'delimiter'.
+
+    Returns:
+        Function parsing a line and calling the parser function with the field values and the cache.
+    """
+    fields = parser_def["fields"]
+    parse_func = parser_def["parser"]
+    strip = parser_def.get("strip")
+
+    if isinstance(fields, dict):
+        slices = [(field, slice(*idx)) for field, idx in fields.items()]
+
+        def line_parser(line: str, cache: Dict[str, Any]) -> None:
+            parse_func({field: line[idx].strip(strip) for field, idx in slices}, cache)
+
+    elif isinstance(fields, list):
+        # Split on whitespaces if delimiter is not defined
+        split = re.compile(parser_def.get("delimiter", r"\s+")).split
+
+        def line_parser(line: str, cache: Dict[str, Any]) -> None:
+            values = {f: v.strip(strip) for f, v in zip(fields, split(line.strip(strip))) if f is not None}
+            parse_func(values, cache)
+
+    else:
+
+        def line_parser(line: str, cache: Dict[str, Any]) -> None:
+            parse_func(dict(), cache)
 
-        fields = parser.parser_def[label]["fields"]
-        values: Dict[str, str] = dict()
-        if isinstance(fields, dict):
-            for field, idx in fields.items():
-                values[field] = line[slice(*idx)].strip(parser.parser_def[label].get("strip"))
-        elif isinstance(fields, list):
-            line = line.strip(parser.parser_def[label].get("strip"))
-            # Split on whitespaces if delimiter is not defined
-            for field, value in zip(fields, re.split(parser.parser_def[label].get("delimiter", r"\s+"), line)):
-                if field is not None:
-                    values[field] = value.strip(parser.parser_def[label].get("strip"))
-
-        parse_func = parser.parser_def[label]["parser"]
-        parse_func(values, cache)
+    return line_parser
@@ -11,11 +11,12 @@ for a given Rinex format.
 
 """
 # Standard library imports
+import collections
 from datetime import datetime
 import functools
 import itertools
 import pathlib
-from typing import Any, Callable, cast, Dict, List, NamedTuple, Optional, Tuple, Union
+from typing import Any, Callable, cast, Dict, Iterator, List, NamedTuple, Optional, Tuple, Union
 
 import numpy as np
 
@@ -61,6 +62,36 @@ def parser_cache(
     return wrapper_parser_cache
 
 
+class RinexObsChunksMixin:
+    """A mixin reading RINEX observations in chunks of epochs, for RINEX observation parsers based on ChainParser
+
+    The observation epochs are expected to be parsed as one group each by the parser definitions following the header.
+    """
+
+    def iter_epochs(self, chunk_epochs: int = 1) -> Iterator["Dataset"]:
+        """Read RINEX observations in chunks of epochs
+
+        Instead of reading the whole file before returning any data, the observation epochs are read in chunks and
+        each chunk is returned as a Dataset. Epochs rejected by the sampling rate are skipped while reading. Each chunk
+        is postprocessed like a separate file, so observation types without observations in a chunk are not included
+        in the Dataset of the chunk.
+
+        Args:
+            chunk_epochs:  Number of observation epochs in each chunk.
+
+        Returns:
+            Generator yielding a Dataset with the observations of each chunk.
+        """
+        if not self.data_available:
+            return
+
+        for _ in self.read_chunks(chunk_epochs):
+            if not self.data.get("time"):  # Chunk without observations
+                continue
+            self.postprocess_data()
+            yield self.as_dataset()
+
+
 class RinexParser(Parser):
     """An abstract base class that has basic methods for parsing a datafile
 
@@ -91,7 +122,7 @@ class RinexParser(Parser):
             file_path=file_path, encoding=encoding, sampling_rate=sampling_rate, strict=strict
         )
         self.header: Dict[str, Any] = dict()
-        self.samling_rate = sampling_rate
+        self.sampling_rate = sampling_rate
         self.error = cast(Callable[[str], None], self._raise_error if strict else log.warn)
 
     def _raise_error(self, text: str) -> None:
@@ -161,21 +192,59 @@ class RinexParser(Parser):
 
         Add data to self.data
         """
-        sampling_rate = 400  # TODO: Why does not self.sampling_rate work?
+        for _ in self._read_epochs(fid):
+            pass
+
+    def iter_epochs(self, chunk_epochs: int = 1) -> Iterator[Dict[str, Any]]:
+        """Read data from Rinex file in chunks of epochs
+
+        The header is read first and stored in self.header. Afterwards the epochs are read in chunks, and only the data
+        of one chunk are kept in self.data. Epochs rejected by the sampling rate are skipped without being parsed.
+
+        Args:
+            chunk_epochs:  Number of epochs in each chunk.
+
+        Returns:
+            Generator yielding the data of each chunk, structured as by `read_data`.
+        """
+        if chunk_epochs < 1:
+            raise ValueError(f"Number of epochs in a chunk must be positive, not {chunk_epochs}")
+
+        with open(self.file_path, mode="r", encoding=self.file_encoding) as fid:
+            self.read_header(fid)
+            num_epochs = 0
+            for _ in self._read_epochs(fid):
+                num_epochs += 1
+                if num_epochs == chunk_epochs:
+                    self.structure_data()
+                    yield self.data
+                    self.data = dict()
+                    num_epochs = 0
+
+        if num_epochs:
+            self.structure_data()
+            yield self.data
+
+    def _read_epochs(self, fid) -> Iterator[Dict[str, Any]]:
+        """Read epochs from Rinex file, add data to self.data and yield information about each read epoch
+
+        Epochs closer than sampling_rate seconds to the previous read epoch are skipped. Their data lines are
+        consumed without being parsed.
+        """
         prev_epoch = datetime.min
         for epoch_line in fid:
             num_data_lines, epoch_info = self.parse_epoch_line(epoch_line)
             data_lines = itertools.islice(fid, num_data_lines)
 
-            if sampling_rate is not None:
+            if self.sampling_rate is not None:
                 epoch = epoch_info["epoch"]
-                if (epoch - prev_epoch).total_seconds() < sampling_rate:
-                    for line in data_lines:
-                        pass  # Consume lines  # TODO: Better way for this?
+                if (epoch - prev_epoch).total_seconds() < self.sampling_rate:
+                    collections.deque(data_lines, maxlen=0)  # Consume lines
                     continue
                 prev_epoch = epoch
 
-            data_info = self.parse_data_lines(data_lines, epoch_info)
+            self.parse_data_lines(data_lines, epoch_info)
+            yield epoch_info
 
     def parse_epoch_line(self, line):
         raise NotImplementedError
@@ -91,6 +91,9 @@ class AntexParser(ChainParser):
     | Value          | Type | Description                                      |
     | :------------- | :--- | :----------------------------------------------- |
     | comment        | list | Header commments given in list line by line      |
+    | open_ended     | list | (<prn>, <valid from>) of satellite periods with  |
+    |                |      | no end of validity. The time of parsing is used  |
+    |                |      | as 'valid_until' for these periods.              |
     | pcv_type       | str  | Phase center variation type                      |
     | ref_antenna    | str  | Reference antenna type for relative antenna      |
     | ref_serial_num | str  | Serial number of the reference antenna           |
@@ -279,11 +282,15 @@ class AntexParser(ChainParser):
         values = line["values"].split()
 
         if values[0] == "NOAZI":
-            del values[0]
-            cache["noazi"] = [float(v) for v in values]
+            cache["noazi"] = np.array(values[1:], dtype=float)
         else:
-            del values[0]
-            cache.setdefault("azi", list()).append([float(v) for v in values])
+            # Azimuth-dependent corrections are written row by row into an array preallocated for the azimuth grid
+            if "azi" not in cache:
+                num_azi = int(round(360 / cache["dazi"])) + 1
+                cache["azi"] = np.empty((num_azi, len(values) - 1))
+                cache["azi_row"] = 0
+            cache["azi"][cache["azi_row"]] = np.array(values[1:], dtype=float)
+            cache["azi_row"] += 1
 
     def parse_num_of_frequencies(self, line: Dict[str, str], cache: Dict[str, Any]) -> None:
         """Parse '# OF FREQUENCIES' entry of ANTEX antenna section.
@@ -370,6 +377,7 @@ class AntexParser(ChainParser):
                     tmp["valid_until"] = cache["valid_until"]
                 else:
                     tmp["valid_until"] = datetime.datetime.now()
+                    self.meta.setdefault("open_ended", list()).append((ant, dt))
 
             # Determine elevation list
             if cache["dzen"] != 0.0:
@@ -389,10 +397,10 @@ class AntexParser(ChainParser):
             cache["east"] * Unit.millimeter2meter,
             cache["up"] * Unit.millimeter2meter,
         ]
-        tmp[freq]["noazi"] = np.array(cache["noazi"]) * Unit.millimeter2meter
+        tmp[freq]["noazi"] = cache["noazi"] * Unit.millimeter2meter
         if "azi" in cache:
-            tmp[freq]["azi"] = np.array(cache["azi"]) *  Unit.millimeter2meter
-            del cache["azi"] # Otherwise 'azi' information of frequencies are stacked together
+            tmp[freq]["azi"] = cache["azi"][: cache["azi_row"]] * Unit.millimeter2meter
+            del cache["azi"]  # Otherwise 'azi' information of frequencies are stacked together
 
         # Save satellite antenna correction in data structure
         if cache["sat_code"]:
@@ -32,18 +32,38 @@ More information about the GRAVSOFT grid format can be found under:
 Forsberg, R. and Tscherning, C. C. (2014): "An overview manual for the GRAVSOFT Geodetic Gravity Field Modelling 
 Programs", 3. edition, August 2014
 
+Binary cache:
+-------------
+Parsing of large GRAVSOFT text grids is slow. If `use_binary_cache` is set, the grid values are therefore written to a
+binary sidecar file next to the grid file (or in `cache_dir`) the first time a grid file is parsed, named like the grid
+file with the suffix `.mmap` added. The sidecar starts with a JSON header line containing the grid label (lat1, lat2,
+lon1, lon2, dlat, dlon), the data type and shape of the grid values and the size and modification time of the original
+grid file. The header is padded with spaces, so that the raw grid values start at a fixed offset. Later parsing of the
+same grid file opens the raw grid values with `np.memmap`, so that no text parsing is needed and processes using the
+same grid share the memory pages. The sidecar is rewritten if the original grid file is changed.
+
 Example:
 --------
 
     from midgard import parsers
 
-    p = parsers.parse_file(parser_name="gravsoft_grid",  file_path="MeanSeaLevel1996-2014_above_Ellipsoid_EUREF89_v2021a.bin")
+    p = parsers.parse_file(
+        parser_name="gravsoft_grid",
+        file_path="MeanSeaLevel1996-2014_above_Ellipsoid_EUREF89_v2021a.bin",
+        use_binary_cache=True,
+    )
     data = p.as_dict()
+
+    # Bilinear interpolation directly in the (memory mapped) grid
+    values = p.interpolate(latitude=[59.91, 60.39], longitude=[10.75, 5.32])
     
 
 """
 # Standard library imports
-from typing import Any, Dict
+import json
+import os
+import pathlib
+from typing import Any, Dict, Optional, Tuple, Union
 
 # Third party imports
 import numpy as np
@@ -54,6 +74,13 @@ from midgard.dev import plugins
 from midgard.files import files
 from midgard.parsers import Parser
 
+# Unknown grid data are given with this value
+UNKNOWN_VALUE = 9999
+
+# Suffix of binary cache files and offset of raw grid values in the binary cache file
+CACHE_SUFFIX = ".mmap"
+CACHE_DATA_OFFSET = 1024
+
 
 @plugins.register
 class GravsoftGrid(Parser):
@@ -63,7 +90,7 @@ class GravsoftGrid(Parser):
 
     | Parameter           | Description                                                                           |
     | :------------------ | :------------------------------------------------------------------------------------ |
-    | griddata            | Grid data with ordered grid blocks as list                                            |
+    | griddata            | Grid data as array of dimension (latitude x longitude), ordered from north to south   |
 
     and **meta**-data:
 
@@ -79,7 +106,30 @@ class GravsoftGrid(Parser):
     | __data_path__       | File path                                                                             |
     | __parser_name__     | Parser name                                                                           |
     """
-    
+
+    def __init__(
+        self,
+        *args: Tuple[Any],
+        use_binary_cache: bool = False,
+        cache_dtype: str = "float64",
+        cache_dir: Optional[Union[str, pathlib.Path]] = None,
+        **kwargs: Dict[Any, Any],
+    ) -> None:
+        """Initialize GRAVSOFT grid parser
+
+        Args:
+            args:              Parameters without keyword.
+            use_binary_cache:  Whether to read and write a memory mapped binary cache of the grid values.
+            cache_dtype:       Data type of grid values in binary cache file, 'float32' or 'float64'.
+            cache_dir:         Directory of binary cache file. Default is the directory of the grid file.
+            kwargs:            Keyword arguments.
+        """
+        super().__init__(*args, **kwargs)
+        self.use_binary_cache = use_binary_cache
+        self.cache_dtype = np.dtype(cache_dtype)
+        cache_dir = self.file_path.parent if cache_dir is None else pathlib.Path(cache_dir)
+        self.cache_path = cache_dir / (self.file_path.name + CACHE_SUFFIX)
+
     #TODO: Can the reading also be handled of setup_parser() by using LineParser
     def _not_used_setup_parser(self) -> Dict[str, Any]:
         """Set up information needed for the parser
@@ -108,14 +158,15 @@ class GravsoftGrid(Parser):
         )
 
     def read_data(self) -> None:
-        """Read grid data from GRAVSOFT text file"""
-   
+        """Read grid data from binary cache file or GRAVSOFT text file"""
+        if self.use_binary_cache and self._read_cache():
+            return
+
         # Parse header
         #
         # ----+----1----+----2----+----3----+----4----+----5----+----6----+----7----+-
         #     57.000000   72.000000    4.000000   32.000000   0.0050000   0.0100000
         self._parse_header()
-        
 
         # Parse data
         #
@@ -123,25 +174,168 @@ class GravsoftGrid(Parser):
         #   9999.999 9999.999 9999.999 9999.999 9999.999 9999.999 9999.999 9999.999
         #   9999.999 9999.999 9999.999 9999.999 9999.999 9999.999 9999.999 9999.999
         #   9999.999 9999.999 9999.999 9999.999 9999.999 9999.999 9999.999 9999.999
-        with files.open(self.file_path, mode="r") as fid:
-            for num_line, line in enumerate(fid):
-                if len(line) > 1 and num_line != 0: # Skip empty lines and first line
-                    self.data.setdefault("griddata", list()).extend(line.split())
+        with files.open(self.file_path, mode="rt", encoding=self.file_encoding) as fid:
+            fid.readline()  # Skip header line
+            griddata = np.array(fid.read().split(), dtype=float)
+
+        num_grid_lat, num_grid_lon = self._grid_shape()
+        if griddata.size != num_grid_lon * num_grid_lat:
+            log.fatal(
+                f"Wrong dimensions. Number of grid values in {self.file_path} is {griddata.size}, but grid label "
+                f"defines {num_grid_lat} x {num_grid_lon} grid values."
+            )
+        self.data["griddata"] = griddata.reshape(num_grid_lat, num_grid_lon)
+
+        if self.use_binary_cache:
+            self._write_cache()
                     
     def _parse_header(self) -> None:
         """Parse header
         """
         with files.open(self.file_path, mode="rt", encoding=self.file_encoding) as fid:
-            
-            for line in fid: # TODO: Read only one line. Better solution as loop.
-                lat_min, lat_max, lon_min, lon_max, dlat, dlon = line.split()
-                self.meta["grid_lat_min"] = float(lat_min)
-                self.meta["grid_lat_max"] = float(lat_max)
-                self.meta["grid_lon_min"] = float(lon_min)
-                self.meta["grid_lon_max"] = float(lon_max)
-                self.meta["grid_increment_lat"] = float(dlat)
-                self.meta["grid_increment_lon"] = float(dlon)
-                break
+            lat_min, lat_max, lon_min, lon_max, dlat, dlon = fid.readline().split()
+            self.meta["grid_lat_min"] = float(lat_min)
+            self.meta["grid_lat_max"] = float(lat_max)
+            self.meta["grid_lon_min"] = float(lon_min)
+            self.meta["grid_lon_max"] = float(lon_max)
+            self.meta["grid_increment_lat"] = float(dlat)
+            self.meta["grid_increment_lon"] = float(dlon)
+
+    def _grid_shape(self) -> Tuple[int, int]:
+        """Number of grid points in latitude and longitude given by the grid label"""
+        lat_range = self.meta["grid_lat_max"] - self.meta["grid_lat_min"]
+        lon_range = self.meta["grid_lon_max"] - self.meta["grid_lon_min"]
+        num_grid_lat = int(round(lat_range / self.meta["grid_increment_lat"], 1) + 1)
+        num_grid_lon = int(round(lon_range / self.meta["grid_increment_lon"], 1) + 1)
+        return num_grid_lat, num_grid_lon
+
+    #
+    # BINARY CACHE
+    #
+    def _source_signature(self) -> Dict[str, int]:
+        """Size and modification time of the grid file, used to detect outdated binary cache files"""
+        stat = self.file_path.stat()
+        return dict(source_size=stat.st_size, source_mtime_ns=stat.st_mtime_ns)
+
+    def _read_cache(self) -> bool:
+        """Read grid data by memory mapping the binary cache file
+
+        Returns:
+            True if grid data was read from an up to date binary cache file, otherwise False.
+        """
+        try:
+            with open(self.cache_path, mode="rb") as fid:
+                header = json.loads(fid.readline())
+        except (OSError, ValueError):
+            return False
+
+        if any(header.get(key) != value for key, value in self._source_signature().items()):
+            log.debug(f"Binary cache {self.cache_path} is outdated")
+            return False
+
+        try:
+            griddata = np.memmap(
+                self.cache_path, dtype=header["dtype"], mode="r", offset=header["offset"], shape=tuple(header["shape"])
+            )
+        except (OSError, ValueError) as err:
+            log.debug(f"Could not read binary cache {self.cache_path}: {err}")
+            return False
+
+        self.meta["grid_lat_min"] = header["lat1"]
+        self.meta["grid_lat_max"] = header["lat2"]
+        self.meta["grid_lon_min"] = header["lon1"]
+        self.meta["grid_lon_max"] = header["lon2"]
+        self.meta["grid_increment_lat"] = header["dlat"]
+        self.meta["grid_increment_lon"] = header["dlon"]
+        self.data["griddata"] = griddata
+        log.debug(f"Read grid data from binary cache {self.cache_path}")
+        return True
+
+    def _write_cache(self) -> None:
+        """Write grid data to a binary cache file and memory map the written grid data
+
+        The binary cache file is first written to a temporary file, which is renamed when complete. Thereby other
+        processes never see a partly written cache file.
+        """
+        griddata = self.data["griddata"].astype(self.cache_dtype)
+        header = dict(
+            lat1=self.meta["grid_lat_min"],
+            lat2=self.meta["grid_lat_max"],
+            lon1=self.meta["grid_lon_min"],
+            lon2=self.meta["grid_lon_max"],
+            dlat=self.meta["grid_increment_lat"],
+            dlon=self.meta["grid_increment_lon"],
+            dtype=griddata.dtype.str,
+            shape=griddata.shape,
+            offset=CACHE_DATA_OFFSET,
+            **self._source_signature(),
+        )
+        header_line = json.dumps(header).encode() + b"\n"
+        tmp_path = self.cache_path.with_name(f"{self.cache_path.name}.{os.getpid()}.tmp")
+        try:
+            with files.open(tmp_path, mode="wb", create_dirs=True) as fid:
+                fid.write(header_line.ljust(CACHE_DATA_OFFSET, b" "))
+                fid.write(np.ascontiguousarray(griddata).tobytes())
+            tmp_path.replace(self.cache_path)
+        except OSError as err:
+            log.debug(f"Could not write binary cache {self.cache_path}: {err}")
+            tmp_path.unlink(missing_ok=True)
+            return
+
+        self._read_cache()
+        log.debug(f"Wrote grid data to binary cache {self.cache_path}")
+
+    #
+    # INTERPOLATION
+    #
+    def interpolate(
+        self, latitude: Union[float, np.ndarray], longitude: Union[float, np.ndarray]
+    ) -> Union[float, np.ndarray]:
+        """Bilinear interpolation of grid data for given positions
+
+        The interpolation uses only the four surrounding grid values of each position. It works directly on the
+        (memory mapped) grid data, so only the needed parts of the grid are read from disk.
+
+        Args:
+            latitude:   Latitude(s) in degree.
+            longitude:  Longitude(s) in degree.
+
+        Returns:
+            Interpolated grid value(s). NaN is returned for positions outside the grid or next to unknown grid values.
+        """
+        griddata = self.data["griddata"]
+        num_grid_lat, num_grid_lon = griddata.shape
+        latitude, longitude = np.broadcast_arrays(
+            np.asarray(latitude, dtype=float), np.asarray(longitude, dtype=float)
+        )
+
+        # Fractional row and column indices. Rows are ordered from north to south.
+        row = (self.meta["grid_lat_max"] - latitude) / self.meta["grid_increment_lat"]
+        col = (longitude - self.meta["grid_lon_min"]) / self.meta["grid_increment_lon"]
+
+        # Snap indices to grid points to avoid using neighbouring grid values due to round-off errors
+        row = np.where(np.abs(row - np.round(row)) < 1e-9, np.round(row), row)
+        col = np.where(np.abs(col - np.round(col)) < 1e-9, np.round(col), col)
+        outside = (row < 0) | (row > num_grid_lat - 1) | (col < 0) | (col > num_grid_lon - 1) | np.isnan(row + col)
+
+        row0 = np.clip(np.floor(np.where(outside, 0, row)).astype(int), 0, max(num_grid_lat - 2, 0))
+        col0 = np.clip(np.floor(np.where(outside, 0, col)).astype(int), 0, max(num_grid_lon - 2, 0))
+        row1 = np.minimum(row0 + 1, num_grid_lat - 1)
+        col1 = np.minimum(col0 + 1, num_grid_lon - 1)
+        drow = np.where(outside, 0, row - row0)
+        dcol = np.where(outside, 0, col - col0)
+
+        # Unknown grid values are only a problem if they are used in the interpolation
+        corners = np.stack(
+            (griddata[row0, col0], griddata[row0, col1], griddata[row1, col0], griddata[row1, col1])
+        ).astype(float)
+        weights = np.stack(((1 - drow) * (1 - dcol), (1 - drow) * dcol, drow * (1 - dcol), drow * dcol))
+        used = weights > 0
+        unknown = np.any(used & (corners >= UNKNOWN_VALUE), axis=0)
+        values = np.sum(np.where(used, corners, 0) * weights, axis=0)
+        values = np.where(outside | unknown, np.nan, values)
+
+        return values if values.ndim else float(values)
 
     #
     # GET DICTIONARY
@@ -155,7 +349,7 @@ class GravsoftGrid(Parser):
 
            | Key        | Type              | Description                                                  |
            | :--------- | :---------------- | :----------------------------------------------------------- |
-           | data       | numpy.ndarray     | Grid data of dimension (longitude x latitude)                |
+           | data       | numpy.ndarray     | Grid data of dimension (latitude x longitude)                |
            | latitude   | numpy.ndarray     | Latitude values of grid in degree                            |
            | longitude  | numpy.ndarray     | Longitude values of grid in degree                           |
            
@@ -164,8 +358,7 @@ class GravsoftGrid(Parser):
         if not self.data:
             return dict()
         
-        num_grid_lon = int(round((self.meta["grid_lon_max"] - self.meta["grid_lon_min"]) / self.meta["grid_increment_lon"], 1) + 1)
-        num_grid_lat = int(round((self.meta["grid_lat_max"] - self.meta["grid_lat_min"]) / self.meta["grid_increment_lat"], 1) + 1)
+        num_grid_lat, num_grid_lon = self._grid_shape()
 
         lon = np.linspace(
                     self.meta["grid_lon_min"],
@@ -179,20 +372,9 @@ class GravsoftGrid(Parser):
                     num_grid_lat,
                     endpoint=True,
         )
-        
-        if len(self.data["griddata"]) != num_grid_lon * num_grid_lat:
-            log.fatal("Wrong dimensions.")
-
-        data = np.array(self.data["griddata"]).astype(float)
-        #import IPython; IPython.embed()
-        data = data.reshape(num_grid_lat, num_grid_lon)
 
         return dict(
                 longitude = lon, 
                 latitude = lat, 
-                data = data,
+                data = self.data["griddata"],
         )
-        
-            
-
-
@@ -32,7 +32,7 @@ from midgard.data import dataset
 from midgard.dev import plugins
 from midgard.dev import log
 from midgard.gnss.gnss import obstype_to_freq
-from midgard.parsers import ChainParser, ParserDef
+from midgard.parsers import ChainParser, ParserDef, RinexObsChunksMixin
 from midgard.math.constant import constant
 from midgard.math.unit import Unit
 
@@ -41,7 +41,7 @@ SYSTEM_TIME_OFFSET_TO_GPS_TIME = dict(BDT=14, GAL=0, IRN=0, QZS=0)
 
 
 @plugins.register
-class Rinex2Parser(ChainParser):
+class Rinex2Parser(RinexObsChunksMixin, ChainParser):
     """A parser for reading RINEX observation file
 
     The parser reads GNSS observations in RINEX format 2.11 (see :cite:`rinex2`). The GNSS observations
@@ -511,6 +511,7 @@ class Rinex2Parser(ChainParser):
             if self.sampling_rate:
                 if cache["obs_sec"] % self.sampling_rate != 0:
                     cache["obs_sec"] = None  # Ignore epoch
+                    cache["skip_group"] = True  # Observation lines of epoch are not parsed
 
             cache["num_sat"] = int(line["num_sat"])
 
@@ -21,8 +21,6 @@ converted to GPS time scale.
 """
 
 # Standard library imports
-from datetime import datetime, timedelta
-import dateutil.parser
 import itertools
 from typing import Any, Callable, Dict, Iterable, List, Union
 
@@ -47,6 +45,9 @@ SYSTEM_TIME_OFFSET_TO_GPS_SECOND = dict(C=14, E=0, G=0, I=0, J=0)
 # corresponds to GPS week, whereas BeiDou (C) week starts at GPS week 1356.
 SYSTEM_TIME_OFFSET_TO_GPS_WEEK = dict(C=1356, E=0, G=0, I=0, J=0)
 
+# Start of GPS time scale
+GPS_EPOCH = np.datetime64("1980-01-06T00:00:00", "ns")
+
 SYSNAMES = dict(
     gnss_data_info={"G": "codes_l2", "J": "codes_l2", "E": "data_source"},
     gnss_interval={"G": "fit_interval", "J": "fit_interval", "C": "age_of_clock_corr"},
@@ -694,73 +695,35 @@ class Rinex3NavParser(ChainParser):
                 (", ").join(valid_systems),
             )
 
-        # Time conversion is only necessary for M-Mixed or C-BeiDou navigation files
+        # Time offsets to GPS time scale for each record, looked up once per system code. Time conversion is only
+        # necessary for M-Mixed or C-BeiDou navigation files.
+        num_obs = len(self.data["time"])
         if system == "M" or system == "C":
-            self.data["time"] = [
-                dateutil.parser.parse(t) + timedelta(seconds=SYSTEM_TIME_OFFSET_TO_GPS_SECOND.get(s, 0))
-                for s, t in zip(self.data["system"], self.data["time"])
-            ]
-
-            self.data["toe"] = [
-                t + SYSTEM_TIME_OFFSET_TO_GPS_SECOND.get(s, 0) for s, t in zip(self.data["system"], self.data["toe"])
-            ]
-
-            self.data["transmission_time"] = [
-                t + SYSTEM_TIME_OFFSET_TO_GPS_SECOND.get(s, 0)
-                for s, t in zip(self.data["system"], self.data["transmission_time"])
-            ]
-
-            self.data["gnss_week"] = [
-                w + SYSTEM_TIME_OFFSET_TO_GPS_WEEK.get(s, 0)
-                for s, w in zip(self.data["system"], self.data["gnss_week"])
-            ]
-
-            # Convert time data entries to Time object
-            self.data["time"] = Time(val=self.data["time"], scale="gps", fmt="datetime")
+            codes, sys_idx = np.unique(np.array(self.data["system"]), return_inverse=True)
+            offset_second = np.array([SYSTEM_TIME_OFFSET_TO_GPS_SECOND.get(c, 0) for c in codes])[sys_idx]
+            offset_week = np.array([SYSTEM_TIME_OFFSET_TO_GPS_WEEK.get(c, 0) for c in codes])[sys_idx]
         else:
-            # Conversion to datetime format
-            # TODO workaround: "isot" does not work for initialization of time field (only 5 decimals for seconds are
-            #                  allowed). Therefore self.data["time"] is converted to datetime object.
-            date = []
-            millisec = []
-            for v in self.data["time"]:
-                val, val2 = v.split(".")
-                date.append(datetime.strptime(val, "%Y-%m-%dT%H:%M:%S"))
-                millisec.append(timedelta(milliseconds=int(val2)))
-
-            # Convert time data entries to Time object
-            self.data["time"] = Time(val=date, val2=millisec, scale="gps", fmt="datetime")
-            # TODO: Better solution: self.data["time"] = Time(self.data["time"], scale="gps", fmt="isot")
-
-        self.data["toe"] = Time(
-                            val=self.data["gnss_week"], 
-                            val2=self.data["toe"], 
-                            scale="gps", 
-                            fmt="gps_ws",
-        ) 
-        self.data["transmission_time"] = Time(
-                                            val=self.data["gnss_week"], 
-                                            val2=self.data["transmission_time"], 
-                                            scale="gps", 
-                                            fmt="gps_ws",
-        )
+            offset_second = np.zeros(num_obs)
+            offset_week = np.zeros(num_obs)
+
+        # Navigation epoch (time of clock (toc)) is given in GNSS time scale without leap seconds, so GPS week and
+        # seconds of week are derived directly from the elapsed time since the GPS epoch
+        elapsed = (np.array(self.data["time"], dtype="datetime64[ns]") - GPS_EPOCH) / np.timedelta64(1, "s")
+        toc_week, toc_sec = np.divmod(elapsed + offset_second, 604_800)
+
+        gnss_week = np.array(self.data["gnss_week"], dtype=float) + offset_week
+        self.data["gnss_week"] = gnss_week
+        self.data["time"] = Time(val=toc_week, val2=toc_sec, scale="gps", fmt="gps_ws")
 
         # Handling of week crossovers - refer time of ephemeris (toe) and transmission time to same GPS week as
         # navigation epoch (time of clock (toc))
-        # TODO: It is only a workaround. This should be done before generating a TimeObject!!!! Use 28.02.2016 as check.
         # TODO: Is it necessary for toe? Or is toe always refered to current GPS week?
         for field in ["toe", "transmission_time"]:
-            # gpssec = self.data[field].gpssec.copy()
-            gpssec = self.data[field].gps_ws.seconds
-            # time_diff = self.data["time"].gpssec - gpssec
-            time_diff = self.data["time"].gps_ws.seconds - gpssec
-            if np.any(time_diff > 302_400):
-                idx = time_diff > 302_400
-                gpssec[idx] += 604_800
-            elif np.any(time_diff < -302_400):
-                idx = time_diff < -302_400
-                gpssec[idx] -= 604_800
-            self.data[field] = Time(val=self.data["gnss_week"], val2=gpssec, scale="gps", fmt="gps_ws")
+            gpssec = np.array(self.data[field], dtype=float) + offset_second
+            time_diff = toc_sec - gpssec
+            gpssec[time_diff > 302_400] += 604_800
+            gpssec[time_diff < -302_400] -= 604_800
+            self.data[field] = Time(val=gnss_week, val2=gpssec, scale="gps", fmt="gps_ws")
 
     #
     # WRITE DATA
@@ -33,7 +33,7 @@ from midgard.data import dataset
 from midgard.dev import plugins
 from midgard.dev import log
 from midgard.gnss.gnss import obstype_to_freq
-from midgard.parsers import ChainParser, ParserDef
+from midgard.parsers import ChainParser, ParserDef, RinexObsChunksMixin
 from midgard.math.constant import constant
 from midgard.math.unit import Unit
 
@@ -42,7 +42,7 @@ SYSTEM_TIME_OFFSET_TO_GPS_TIME = dict(BDT=14, GAL=0, IRN=0, QZS=0)
 
 
 @plugins.register
-class Rinex3Parser(ChainParser):
+class Rinex3Parser(RinexObsChunksMixin, ChainParser):
     """A parser for reading RINEX observation file
 
     The parser reads GNSS observations in RINEX format 3.03 (see :cite:`rinex3`). The GNSS observations
@@ -587,6 +587,7 @@ class Rinex3Parser(ChainParser):
         if self.sampling_rate:
             if cache["obs_sec"] % self.sampling_rate != 0:
                 cache["obs_sec"] = None  # Ignore epoch
+                cache["skip_group"] = True  # Observation lines of epoch are not parsed
 
     def _parse_observation(self, line: Dict[str, str], cache: Dict[str, Any]) -> None:
         """Parse observation record of RINEX file
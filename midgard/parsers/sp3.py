@@ -6,11 +6,17 @@ Example:
     from midgard import parsers
 
     # Parse data
-    p = parsers.parse_file(parser_name="sp3d", file_path=file_path)
+    p = parsers.parse_file(parser_name="sp3", file_path=file_path)
 
     # Get Dataset with parsed data
     dset = p.as_dataset()
 
+    # Get dense epoch x satellite arrays of positions and clock biases
+    cube = p.as_orbit_cube()
+
+    # Parse several SP3 files (e.g. a week of daily files) at once
+    p = parsers.parse_file(parser_name="sp3", file_path=[file_path_1, file_path_2, file_path_3])
+
 
 Description:
 ------------
@@ -20,11 +26,16 @@ defined in the header of the SP3 file, which is for IGS products the current IGS
 (e.g. IGb08). The time system is for IGS products the GPS time scale. The orbit position and velocities are given 
 normally for every 15 minutes.
 
+Several SP3 files can be read by one parser. Epochs given in more than one SP3 file are only read from the first of
+these files. The satellite records are stored in arrays with one row per epoch and one column per satellite, which are
+preallocated based on the number of epochs and satellites given in the SP3 header.
+
 """
 
 # Standard library imports
 import itertools
-from typing import Any, Callable, Dict, Iterable, List
+import pathlib
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
 
 # Third party imports
 import numpy as np
@@ -36,6 +47,8 @@ from midgard.math.constant import constant
 from midgard.math.unit import Unit
 from midgard.parsers._parser_chain import ChainParser, ParserDef
 
+_NANOSECONDS_PER_DAY = 86_400 * 10**9
+
 
 @plugins.register
 class Sp3dParser(ChainParser):
@@ -43,6 +56,7 @@ class Sp3dParser(ChainParser):
 
     Attributes:
         data (dict):             Dict containing the (precise orbit) data read from file.
+        file_paths (list):       File paths of all SP3 orbit files, which are read by the parser.
         data_available (bool):   Indicator of whether data are available.
         dependencies (list):     List of files that have been read by the parser.
         file_key (str):          Key to the SP3 orbit file defined in files.conf file.
@@ -62,15 +76,51 @@ class Sp3dParser(ChainParser):
         read_data()             Read data from datafiles
         setup_calculators()     List steps necessary for postprocessing
         setup_parsers()         Setup parser definition
+        as_orbit_cube()         Return satellite positions and clocks as dense epoch x satellite arrays
         write_to_dataset()      Write data based on GNSS SP3 orbit file
 
         _parse_date()           Parse date orbit position/velocity block
         _parse_float()          Parse float entries of SP3 header to instance variable 'meta'
+        _parse_num_satellites() Parse number of satellites given in SP3 header
         _parse_position()       Parse orbit position
         _parse_string()         Parse string entries of SP3 header to instance variable 'meta'
         _parse_velocity()       Parse orbit velocity
     """
 
+    # Fields of epoch-satellite arrays and their fill values
+    _ARRAY_FIELDS = {
+        "sat_pos": (3, np.nan),
+        "sat_clock_bias": (None, np.nan),
+        "sat_pos_sigma": (3, np.nan),
+        "sat_clock_bias_sigma": (None, np.nan),
+        "sat_vel": (3, np.nan),
+        "has_pos": (None, False),
+        "has_vel": (None, False),
+    }
+
+    def __init__(
+        self,
+        file_path: Union[str, pathlib.Path, List[Union[str, pathlib.Path]]],
+        encoding: Optional[str] = None,
+    ) -> None:
+        """Set up the basic information needed by the parser
+
+        Args:
+            file_path:    Path to SP3 file or list of paths to SP3 files that will be read.
+            encoding:     Encoding of file that will be read.
+        """
+        file_paths = [file_path] if isinstance(file_path, (str, pathlib.Path)) else list(file_path)
+        super().__init__(file_paths[0], encoding)
+        self.file_paths = [pathlib.Path(f) for f in file_paths]
+        self.data_available = any(f.exists() for f in self.file_paths)
+
+        # Epoch and satellite indices of epoch-satellite arrays
+        self._epoch_idx: Dict[str, int] = dict()
+        self._satellite_idx: Dict[str, int] = dict()
+        self._arrays: Dict[str, np.ndarray] = dict()
+        self._num_skipped_epochs = 0
+        self._orbit_cube: Dict[str, np.ndarray] = dict()
+
     #
     # PARSER for reading each line of the SP3 file.
     #
@@ -80,6 +130,7 @@ class Sp3dParser(ChainParser):
         header_parser = ParserDef(
             end_marker=lambda _l, _ln, next_line: next_line.startswith("*"),
             label=lambda line, _ln: line[0:2],
+            end_callback=self._reserve_arrays_for_file,
             parser_def={
                 # Header of SP3-c format
                 # ----+----1----+----2----+----3----+----4----+----5----+----6
@@ -141,6 +192,9 @@ class Sp3dParser(ChainParser):
                 # ----+----1----+----2----+----3----+----4----+----5----+----6
                 # %f  1.2500000  1.025000000  0.00000000000  0.000000000000000
                 "%f": {"parser": self._parse_float, "fields": {"base_posvel": (3, 13), "base_clkrate": (14, 26)}},
+                # ----+----1----+----2----+----3----+----4----+----5----+----6
+                # +   74   G01G02G03G05G06G07G08G09G10G11G12G13G14G15G16G17G18
+                "+ ": {"parser": self._parse_num_satellites, "fields": {"num_sat": (3, 6)}},
             },
         )
 
@@ -200,6 +254,81 @@ class Sp3dParser(ChainParser):
 
         return itertools.chain([header_parser], itertools.repeat(data_parser))
 
+    def read_data(self) -> None:
+        """Read data from all SP3 files and parse the contents"""
+        for file_path in self.file_paths:
+            if not file_path.exists():
+                log.warn(f"SP3 file {file_path} does not exist")
+                continue
+            self.file_path = file_path
+            super().read_data()
+        self.file_path = self.file_paths[0]
+
+        if self._num_skipped_epochs:
+            log.warn(f"{self._num_skipped_epochs} identical epochs given in the SP3 files are skipped")
+
+        self._copy_arrays_to_data()
+
+    #
+    # EPOCH-SATELLITE ARRAYS
+    #
+    def _reserve_arrays_for_file(self, cache: Dict[str, Any]) -> None:
+        """Reserve space in epoch-satellite arrays for number of epochs and satellites given in SP3 header
+
+        Args:
+            cache (dict): Temporary dictionary with the number of satellites 'num_sat' given in SP3 header.
+        """
+        num_epochs = len(self._epoch_idx) + int(self.meta.get("num_epoch") or 0)
+        num_satellites = len(self._satellite_idx) + cache.get("num_sat", 0)
+        self._reserve_arrays(num_epochs, num_satellites)
+
+    def _reserve_arrays(self, num_epochs: int, num_satellites: int) -> None:
+        """Make sure that epoch-satellite arrays have space for given number of epochs and satellites
+
+        Arrays are grown at least by a factor 2, when they are too small.
+
+        Args:
+            num_epochs:      Number of epochs.
+            num_satellites:  Number of satellites.
+        """
+        old_epochs, old_satellites = self._arrays["has_pos"].shape if self._arrays else (0, 0)
+        if num_epochs <= old_epochs and num_satellites <= old_satellites:
+            return
+
+        new_epochs = max(num_epochs, 2 * old_epochs) if num_epochs > old_epochs else old_epochs
+        new_satellites = max(num_satellites, 2 * old_satellites) if num_satellites > old_satellites else old_satellites
+        for field, (dim, fill_value) in self._ARRAY_FIELDS.items():
+            shape = (new_epochs, new_satellites) if dim is None else (new_epochs, new_satellites, dim)
+            array = np.full(shape, fill_value)
+            if field in self._arrays:
+                array[:old_epochs, :old_satellites] = self._arrays[field]
+            self._arrays[field] = array
+
+    def _copy_arrays_to_data(self) -> None:
+        """Copy satellite records from epoch-satellite arrays to data sorted by epoch"""
+        if not self._epoch_idx:
+            return
+
+        # Epochs are given in fixed-width ISO format, which can be sorted as strings
+        epochs = np.array(list(self._epoch_idx))
+        satellites = np.array(list(self._satellite_idx))
+        epoch_order = np.argsort(epochs, kind="stable")
+        arrays = {
+            field: array[: len(epochs), : len(satellites)][epoch_order] for field, array in self._arrays.items()
+        }
+        epochs = epochs[epoch_order]
+        self._orbit_cube = dict(epochs=epochs, satellites=satellites, **arrays)
+
+        idx_epoch, idx_sat = np.nonzero(arrays["has_pos"])
+        self.data["time"] = epochs[idx_epoch]
+        self.data["satellite"] = satellites[idx_sat]
+        for field in ["sat_pos", "sat_clock_bias", "sat_pos_sigma", "sat_clock_bias_sigma"]:
+            self.data[field] = arrays[field][idx_epoch, idx_sat]
+        self.data["system"] = self.data["satellite"].astype("U1")
+        if np.any(arrays["has_vel"]):
+            # Satellite records without velocity are NaN, so that velocities are given for the same rows as positions
+            self.data["sat_vel"] = arrays["sat_vel"][idx_epoch, idx_sat]
+
     #
     # HEADER PARSER
     #
@@ -220,6 +349,26 @@ class Sp3dParser(ChainParser):
             second=float(line["second"]),
         )
 
+        # Skip identical epochs given in several SP3 files
+        if cache["time"] in self._epoch_idx:
+            log.debug(f"Identical epoch {cache['time']} given in the SP3 files")
+            self._num_skipped_epochs += 1
+            cache["epoch_idx"] = None
+            return
+
+        cache["epoch_idx"] = self._epoch_idx[cache["time"]] = len(self._epoch_idx)
+        self._reserve_arrays(len(self._epoch_idx), len(self._satellite_idx))
+
+    def _parse_num_satellites(self, line: Dict[str, str], cache: Dict[str, Any]) -> None:
+        """Parse number of satellites given in SP3 header
+
+        Args:
+            line (dict):  Dict containing the fields of a line.
+            cache (dict): Temporary dictionary with the fields 'key' and 'values'.
+        """
+        # Number of satellites is only given in the first line of the satellite list
+        if line["num_sat"]:
+            cache["num_sat"] = int(line["num_sat"])
 
     def _parse_float(self, line, _):
         """Parse float entries of SP3 header to instance variable 'meta'
@@ -275,11 +424,9 @@ class Sp3dParser(ChainParser):
 
         """
 
-        # Remove identical epochs given in two different SP3 files
-        if cache["line_num"] == 2:
-            if "time" in self.data and cache["time"] in self.data["time"]:
-                log.warn(f"Identical epoch {cache['time']} given in the SP3 files")
-                return
+        # Skip identical epochs given in several SP3 files
+        if cache["epoch_idx"] is None:
+            return
 
         # SP3-a (GPS-only) format files missing satellite system identicator 'G' before satellite number
         if self.meta["version"] == "a":
@@ -299,27 +446,34 @@ class Sp3dParser(ChainParser):
             if line[k] == "":
                 line[k] = float("nan")
 
-        self.data.setdefault("time", list()).append(cache["time"])
-        self.data.setdefault("satellite", list()).append(line["sat"])
-        self.data.setdefault("sat_pos", list()).append(
+        idx = cache["epoch_idx"], self._get_satellite_idx(line["sat"])
+        self._arrays["has_pos"][idx] = True
+        self._arrays["sat_pos"][idx] = (
             np.array([float(line["pos_x"]), float(line["pos_y"]), float(line["pos_z"])]) * Unit.kilometer2meter
         )
-        self.data.setdefault("sat_clock_bias", list()).append(
-            float(line["clk_bias"]) * Unit.microsecond2second * constant.c
-        )
-        self.data.setdefault("sat_pos_sigma", list()).append(
+        self._arrays["sat_clock_bias"][idx] = float(line["clk_bias"]) * Unit.microsecond2second * constant.c
+        self._arrays["sat_pos_sigma"][idx] = (
             np.array([float(line["sig_pos_x"]), float(line["sig_pos_y"]), float(line["sig_pos_z"])])
             * self.meta["base_posvel"]
             * Unit.millimeter2meter
         )
-        self.data.setdefault("sat_clock_bias_sigma", list()).append(
+        self._arrays["sat_clock_bias_sigma"][idx] = (
             float(line["sig_clk_bias"]) * self.meta["base_clkrate"] * Unit.picosecond2second * constant.c
         )
 
-        # Get GNSS identifier
-        sys = line["sat"][0]
-        self.data.setdefault("system", list()).append(sys)
+    def _get_satellite_idx(self, satellite: str) -> int:
+        """Get column index of satellite in epoch-satellite arrays
+
+        Args:
+            satellite:  Satellite identifier (e.g. G01).
 
+        Returns:
+            Column index of satellite.
+        """
+        if satellite not in self._satellite_idx:
+            self._satellite_idx[satellite] = len(self._satellite_idx)
+            self._reserve_arrays(len(self._epoch_idx), len(self._satellite_idx))
+        return self._satellite_idx[satellite]
 
     def _parse_velocity(self, line: Dict[str, str], cache: Dict[str, Any]) -> None:
         """Parse orbit velocity
@@ -328,7 +482,17 @@ class Sp3dParser(ChainParser):
             line (dict):  Dict containing the fields of a line.
             cache (dict): Temporary dictionary with the fields 'key' and 'values'.
         """
-        self.data.setdefault("sat_vel", list()).append(
+        # Skip identical epochs given in several SP3 files
+        if cache["epoch_idx"] is None:
+            return
+
+        # SP3-a (GPS-only) format files missing satellite system identicator 'G' before satellite number
+        if self.meta["version"] == "a":
+            line["sat"] = "G" + line["sat"].zfill(2)
+
+        idx = cache["epoch_idx"], self._get_satellite_idx(line["sat"])
+        self._arrays["has_vel"][idx] = True
+        self._arrays["sat_vel"][idx] = (
             np.array([float(line["vel_x"]), float(line["vel_y"]), float(line["vel_z"])]) * Unit.decimeter2meter
         )
         return  # TODO: Only read velocity for now. Has to be implemented correctly!!!!
@@ -410,23 +574,10 @@ class Sp3dParser(ChainParser):
         dset = dataset.Dataset(num_obs=len(self.data["time"]))
         dset.meta.update(self.meta)
 
-        # TODO workaround: "isot" does not work for initialization of time field (only 5 decimals for seconds are
-        #                  allowed). Therefore self.data["time"] is converted to datetime object.
-        from datetime import datetime, timedelta
-
-        date = []
-        millisec = []
-        for v in self.data["time"]:
-            val, val2 = v.split(".")
-            date.append(datetime.strptime(val, "%Y-%m-%dT%H:%M:%S"))
-            millisec.append(timedelta(milliseconds=int(val2)))
-
-        if dset.meta["time_sys"] == "GPS":
-            dset.add_time("time", val=date, val2=millisec, scale="gps", fmt="datetime")
-        elif dset.meta["time_sys"] == "UTC":
-            dset.add_time("time", val=date, val2=millisec, scale="utc", fmt="datetime")
-        else:
-            log.fatal(f"Time system {dset.meta['time_sys']} is not handled so far in Where.")
+        # Convert each unique epoch to Modified Julian Date in one vectorized step
+        epochs, idx_epoch = np.unique(self.data["time"], return_inverse=True)
+        mjd_int, mjd_frac = _epochs_to_mjd(epochs)
+        dset.add_time("time", val=mjd_int[idx_epoch], val2=mjd_frac[idx_epoch], scale=self._time_scale(), fmt="mjd")
 
         dset.add_text("satellite", val=self.data["satellite"])
         dset.add_text("system", val=self.data["system"])
@@ -434,3 +585,84 @@ class Sp3dParser(ChainParser):
         dset.add_float("sat_clock_bias", val=np.array(self.data["sat_clock_bias"]))
 
         return dset
+
+    def as_orbit_cube(self, satellites: Optional[List[str]] = None) -> Dict[str, Any]:
+        """Return satellite positions and clock biases as dense epoch x satellite arrays
+
+        Epochs are sorted and each satellite has its own column. Missing satellite records are set to NaN. The
+        arrays of all satellites can thereby be interpolated, checked or differenced at once. For example two orbit
+        products can be differenced, if the same list of satellites is given for both products and the common epochs
+        are selected.
+
+        Args:
+            satellites:  Satellites defining the columns of the arrays. Default is all satellites in the SP3 files,
+                         ordered as they are first given in the SP3 files.
+
+        Returns:
+            Dictionary with following entries:
+
+        | Key                  | Type           | Unit   | Description                                               |
+        | :------------------- | :------------- | :----- | :-------------------------------------------------------- |
+        | sat_clock_bias       | numpy.ndarray  | m      | Satellite clock offset from GPS time (n_epochs x n_sats)  |
+        | sat_clock_bias_sigma | numpy.ndarray  | m      | Standard deviation of satellite clock offset              |
+        | sat_pos              | numpy.ndarray  | m      | Satellite position (n_epochs x n_sats x 3)                |
+        | sat_pos_sigma        | numpy.ndarray  | m      | Standard deviation of satellite position                  |
+        | sat_vel              | numpy.ndarray  | m/s    | Satellite velocity (n_epochs x n_sats x 3), if given      |
+        | satellite            | numpy.ndarray  |        | Satellite of each column                                  |
+        | satellite_idx        | dict           |        | Column index of each satellite                            |
+        | time                 | Time           |        | Epochs of each row                                        |
+
+            If no data are available an empty dictionary is returned.
+        """
+        if not self._orbit_cube:
+            return dict()
+
+        from midgard.data.time import Time
+
+        cube = self._orbit_cube
+        if satellites is None:
+            columns = np.arange(len(cube["satellites"]))
+            satellites = cube["satellites"]
+        else:
+            # Columns of satellites not given in the SP3 files point to an extra empty column
+            satellites = np.asarray(satellites)
+            satellite_idx = {sat: idx for idx, sat in enumerate(cube["satellites"])}
+            columns = np.array([satellite_idx.get(sat, -1) for sat in satellites], dtype=int)
+
+        def _select(field: str) -> np.ndarray:
+            array = cube[field]
+            empty_column = np.full(array.shape[:1] + (1,) + array.shape[2:], np.nan)
+            return np.concatenate((array, empty_column), axis=1)[:, columns]
+
+        mjd_int, mjd_frac = _epochs_to_mjd(cube["epochs"])
+        orbit_cube = dict(
+            time=Time(val=mjd_int, val2=mjd_frac, scale=self._time_scale(), fmt="mjd"),
+            satellite=satellites,
+            satellite_idx={sat: idx for idx, sat in enumerate(satellites)},
+        )
+        for field in ["sat_pos", "sat_pos_sigma", "sat_clock_bias", "sat_clock_bias_sigma"]:
+            orbit_cube[field] = _select(field)
+        if np.any(cube["has_vel"]):
+            orbit_cube["sat_vel"] = _select("sat_vel")
+
+        return orbit_cube
+
+    def _time_scale(self) -> str:
+        """Time scale of SP3 epochs given by the time system in the SP3 header"""
+        time_scales = {"GPS": "gps", "UTC": "utc"}
+        if self.meta["time_sys"] not in time_scales:
+            log.fatal(f"Time system {self.meta['time_sys']} is not handled so far in Where.")
+        return time_scales[self.meta["time_sys"]]
+
+
+def _epochs_to_mjd(epochs: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Convert epochs given as ISO strings to Modified Julian Date
+
+    Args:
+        epochs:  Epochs as ISO strings (e.g. 2016-03-01T00:15:00.0000000).
+
+    Returns:
+        Tuple with integer and fractional part of Modified Julian Date
+    """
+    nanoseconds = (epochs.astype("datetime64[ns]") - np.datetime64("1858-11-17", "ns")).astype(np.int64)
+    return nanoseconds // _NANOSECONDS_PER_DAY, nanoseconds % _NANOSECONDS_PER_DAY / _NANOSECONDS_PER_DAY
@@ -45,7 +45,6 @@ class Rinex3ObsParser(Rinex3ObsHeaderMixin, RinexObsParser):
 
         Add data to self.data
         """
-        print(f"parse_epoch_line({line})")
         fields = {k: line[slice(*v)].strip() for k, v in self.EPOCH_FIELDS.items()}
         if fields["identifier"] != ">":
             self.error(f"Line {line.strip()!r} is not an epoch line as expected")
@@ -12,9 +12,13 @@ TODO: 'Identifier' module has no history information. ModuleBase and SiteInfoBas
 
 # Standard library imports
 import abc
+import bisect
 from copy import deepcopy
 from datetime import datetime
-from typing import Any, Dict, List, Union, Iterable
+from typing import Any, Dict, List, Tuple, Union, Iterable
+
+# Third party imports
+import numpy as np
 
 # Midgard imports
 from midgard.dev import log
@@ -110,6 +114,21 @@ class SiteInfoHistoryBase(abc.ABC):
         else:
             self.history = {}
 
+    @property
+    def history(self) -> Union[None, Dict]:
+        """History dictionary with (date_from, date_to) tuples as keys and site information objects as values"""
+        return self._history
+
+    @history.setter
+    def history(self, history: Union[None, Dict]) -> None:
+        """Set history dictionary, and clear the interval index of the history
+
+        The history is stored as a `_History` dictionary, which counts its changes. Thereby changes of the history in
+        place are detected when the interval index is used.
+        """
+        self._history = history if history is None or isinstance(history, _History) else _History(history)
+        self._index = None
+
     def __iter__(self):
         """Make this class iterable"""
         return SiteInfoHistoryIterator(self)        
@@ -160,12 +179,60 @@ class SiteInfoHistoryBase(abc.ABC):
             return None
         
         if date == "last":
-            last_date_period = sorted(self.history.keys())[-1]
+            last_date_period = max(self.history.keys())
             return self.history[last_date_period]
-        
-        for (date_from, date_to), site_info in self.history.items():
-            if date_from <= date < date_to:
-                return site_info
+
+        index = self._get_index()
+        if not index.is_disjoint:
+            for (date_from, date_to), site_info in self.history.items():
+                if date_from <= date < date_to:
+                    return site_info
+            return None
+
+        idx = bisect.bisect_right(index.date_from, date) - 1
+        if idx >= 0 and date < index.date_to[idx]:
+            return self.history[index.keys[idx]]
+        return None
+
+    def get_many(self, dates: Union[Iterable[datetime], np.ndarray]) -> List[Any]:
+        """Get site information objects for many dates
+
+        Dates given as a numpy datetime64 array are looked up in the history all at once, other dates are looked up
+        one by one by bisection.
+
+        Args:
+            dates:  Dates for which site information is chosen, e.g. a list of datetimes or an array of datetime64.
+
+        Returns:
+            List with site information object for each date, None for dates not covered by the history
+        """
+        if self.history is None:
+            return [None for _ in dates]
+
+        index = self._get_index()
+        if not (isinstance(dates, np.ndarray) and np.issubdtype(dates.dtype, np.datetime64) and index.is_disjoint):
+            return [self.get(date) for date in dates]
+
+        if not index.keys:
+            return [None] * len(dates)
+
+        idx = np.searchsorted(index.date_from_array, dates, side="right") - 1
+        is_found = (idx >= 0) & (dates < index.date_to_array[np.maximum(idx, 0)])
+        site_infos = [self.history[key] for key in index.keys]
+        return [site_infos[i] if found else None for i, found in zip(idx.tolist(), is_found.tolist())]
+
+    def _get_index(self) -> "_IntervalIndex":
+        """Get interval index of the history, building it if necessary
+
+        The index is rebuilt when the history is replaced or changed in place, which is detected by the change
+        counter of the history.
+
+        Returns:
+            Interval index of the history
+        """
+        if self._index is None or self._index.num_changes != self.history.num_changes:
+            self._index = _IntervalIndex(self.history)
+        return self._index
 
     @property
     def date_from(self) -> Union[None, List[datetime]]:
@@ -192,6 +259,97 @@ class SiteInfoHistoryBase(abc.ABC):
         return [date_to for (date_from, date_to) in self.history.keys()]
 
 
+class _History(dict):
+    """History dictionary, which counts changes of its entries
+
+    The counter is used to detect when the interval index of the history has to be rebuilt, without comparing the
+    keys of the history on every lookup.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.num_changes = 0
+
+    def __setitem__(self, key: Tuple[datetime, datetime], value: Any) -> None:
+        super().__setitem__(key, value)
+        self.num_changes += 1
+
+    def __delitem__(self, key: Tuple[datetime, datetime]) -> None:
+        super().__delitem__(key)
+        self.num_changes += 1
+
+    def __ior__(self, other: Any) -> "_History":
+        self.update(other)
+        return self
+
+    def clear(self) -> None:
+        super().clear()
+        self.num_changes += 1
+
+    def pop(self, *args: Any) -> Any:
+        self.num_changes += 1
+        return super().pop(*args)
+
+    def popitem(self) -> Tuple[Tuple[datetime, datetime], Any]:
+        self.num_changes += 1
+        return super().popitem()
+
+    def setdefault(self, key: Tuple[datetime, datetime], default: Any = None) -> Any:
+        self.num_changes += 1
+        return super().setdefault(key, default)
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        super().update(*args, **kwargs)
+        self.num_changes += 1
+
+
+class _IntervalIndex:
+    """Index of the date intervals of a history dictionary, sorted by installation date
+
+    Lookups in the index are done by bisection. This is only possible if the intervals do not overlap, otherwise
+    `is_disjoint` is False and the history has to be scanned in order.
+    """
+
+    def __init__(self, history: _History) -> None:
+        """Build the index
+
+        Args:
+            history:  History dictionary with (date_from, date_to) tuples as keys.
+        """
+        self.num_changes = history.num_changes
+        try:
+            # Empty intervals never match any date, and are left out of the index
+            self.keys = sorted((key for key in history if key[0] < key[1]), key=lambda key: key[0])
+            self.date_from = [date_from for date_from, _ in self.keys]
+            self.date_to = [date_to for _, date_to in self.keys]
+            self.is_disjoint = all(
+                date_to <= date_from for date_to, date_from in zip(self.date_to, self.date_from[1:])
+            )
+        except (TypeError, ValueError):
+            self.keys, self.date_from, self.date_to = [], [], []
+            self.is_disjoint = False
+        self._arrays = None
+
+    @property
+    def date_from_array(self) -> np.ndarray:
+        """Installation dates as datetime64 array"""
+        return self._get_arrays()[0]
+
+    @property
+    def date_to_array(self) -> np.ndarray:
+        """Removal dates as datetime64 array"""
+        return self._get_arrays()[1]
+
+    def _get_arrays(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Convert dates to datetime64 arrays, done once when first needed"""
+        if self._arrays is None:
+            self._arrays = (
+                np.array(self.date_from, dtype="datetime64[us]"),
+                np.array(self.date_to, dtype="datetime64[us]"),
+            )
+        return self._arrays
+
+
 class SiteInfoHistoryIterator:
     """Iterator class for SiteInfoHistory classes"""
     
@@ -279,6 +437,50 @@ class ModuleBase(abc.ABC):
         return site_dict
         
 
+    @classmethod
+    def get_many(
+            cls,
+            source: str,
+            source_data: Any,
+            stations: Union[str, Iterable],
+            dates: Union[Iterable[datetime], np.ndarray],
+            source_path: Union[None, str] = None,
+    ) -> Dict[str, Any]:
+        """Get site information objects for many stations and dates in one call
+
+        The site information history of each station is created from the source data once, and is looked up for all
+        dates. If no history classes are defined, for example in case of 'identifier' module, then the site
+        information object of the station is returned instead of a list, as it is valid for all dates.
+
+        Args:
+            source:       Site information source e.g. 'snx' (SINEX file) or 'ssc' (SSC file)
+            source_data:  Source data with site information.
+            stations:     Station names.
+            dates:        Dates for getting site information, e.g. a list of datetimes or an array of datetime64.
+            source_path:  Source path of site information source (e.g. file path of SINEX file)
+
+        Returns:
+            Dictionary with station names as keys and lists with the site information object for each date as values
+        """
+        site_dict: Dict[str, Any] = dict()
+        if isinstance(stations, str):
+            stations = [s.strip().lower() for s in stations.split(",")]
+        else:
+            stations = [s.lower() for s in stations]
+        if not isinstance(dates, np.ndarray):
+            dates = list(dates)
+
+        for station in stations:
+            data = cls.sources[source](station, source_data, source_path)
+            if data is None:
+                site_dict[station] = [None] * len(dates)
+            elif isinstance(data, SiteInfoHistoryBase):
+                site_dict[station] = data.get_many(dates)
+            else:
+                site_dict[station] = data
+
+        return site_dict
+
     @classmethod
     def get_history(
             cls, 
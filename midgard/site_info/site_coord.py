@@ -142,12 +142,16 @@ class SiteCoordHistorySinex(SiteInfoHistoryBase):
         raw_info = list()
 
         if "solution_epochs" in data.keys():
+            # Group estimates by solution number once, instead of scanning all estimates for each epoch
+            estimates_by_soln = dict()
+            for estimate in data["solution_estimate"]:
+                estimates_by_soln.setdefault(estimate["soln"], list()).append(estimate)
+
             for idx, epoch in enumerate(data["solution_epochs"]):
                 raw_info.append(epoch.copy())
 
-                for estimate in data["solution_estimate"]:
-                    if epoch["soln"] == estimate["soln"]:
-                        raw_info[idx].update({estimate["param_name"]: estimate})
+                for estimate in estimates_by_soln.get(epoch["soln"], []):
+                    raw_info[idx].update({estimate["param_name"]: estimate})
         return raw_info
 
 
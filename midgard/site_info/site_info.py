@@ -21,6 +21,7 @@ Example:
     
     SiteInfo.get("snx", "osls", datetime(2020, 1, 1), source_data, source_path=p.file_path)
     SiteInfo.get("snx", all_stations, datetime(2020, 1, 1), source_data, source_path=p.file_path)
+    SiteInfo.get_many("snx", source_data, all_stations, [datetime(2020, 1, 1), datetime(2021, 1, 1)])
     
     SiteInfo.get_history("snx", "osls", source_data, source_path=p.file_path)
     SiteInfo.get_history("snx", all_stations, source_data, source_path=p.file_path)
@@ -33,6 +34,10 @@ Description:
 from datetime import datetime
 from typing import Dict, Iterable, Union, Any
 
+# Third party imports
+import numpy as np
+
+# Midgard imports
 from midgard.site_info.antenna import Antenna
 from midgard.site_info.eccentricity import Eccentricity
 from midgard.site_info.identifier import Identifier
@@ -91,6 +96,55 @@ class SiteInfo:
 
         return site_info
 
+    @classmethod
+    def get_many(
+        cls,
+        source: str,
+        source_data: Any,
+        stations: Union[str, Iterable],
+        dates: Union[Iterable[datetime], np.ndarray],
+        source_path: Union[None, str] = None,
+    ) -> Dict:
+        """Get site information dictionary from given source for many stations and dates in one call
+
+        The site information history of each station and module is created from the source data only once, instead of
+        once for each call of `get`. The results are given as columns, with one entry for each date.
+
+        Args:
+            source:       Site information source type: e.g. 'snx' (SINEX file), 'ssc' (SSC file) or other
+            source_data:  Source data with site information from specified source type.  
+            stations:     List of station names.
+            dates:        Dates for getting site information, e.g. a list of datetimes or an array of datetime64.
+            source_path:  Source path of site information source (e.g. file path of SINEX file) or other. Optional
+                          argument. Only used as information about where the data was obtained. 
+
+        Returns:
+            Dictionary with site information for each station given. For each module there is a list with the site
+            information valid for each date, except for 'identifier' which is valid for all dates.
+        """
+        site_info: Dict[str, Dict] = {}
+        
+        if isinstance(stations, str):
+            stations = [s.strip().lower() for s in stations.split(",")]
+        else:
+            stations = [s.lower() for s in stations]
+        if not isinstance(dates, np.ndarray):
+            dates = list(dates)
+
+        for sta in stations:
+            site_info.setdefault(sta, {})
+
+        for module in _MODULES:
+            module_name = "site_coord" if module.__name__ == "SiteCoord" else module.__name__.lower()
+            if module.__name__ == "Identifier":
+                entries = module.get(source, source_data, stations, None, source_path)
+            else:
+                entries = module.get_many(source, source_data, stations, dates, source_path)
+            for sta in stations:
+                site_info[sta][module_name] = entries[sta] if sta in entries else None
+
+        return site_info
+
     @classmethod
     def get_history(
             cls, 
@@ -2,7 +2,7 @@
 """
 
 # Standard library import
-from pathlib import Path, PosixPath
+from pathlib import PosixPath
 from typing import OrderedDict, List, Union
 
 # Third party imports
@@ -10,8 +10,16 @@ import numpy as np
 
 # Midgard imports
 from midgard.dev import log
+from midgard.files import files
 from midgard.writers._writers import get_field
 
+# Number of rows formatted and written at a time, which limits the memory used for formatted text
+CHUNK_SIZE = 100_000
+
+# Julian date of 1970-01-01, the epoch of numpy datetime64, and number of microseconds per day
+JD_1970 = 2_440_587.5
+DAY2MICROSECONDS = 86_400_000_000
+
 # CSV file example:
 #
 #
@@ -33,8 +41,11 @@ def csv_(
     Field names of dataset, which should be written in CSV file, are defined via the 'fields' argument. The keys of the
     'fields' dictionary represents the field names and optional the format of the field can be defined via dictionary  
     values (e.g. '%.2f'). If the format is not defined (dictionary values is ''), than the specifier 's' is used as 
-    default. For more information about possible format specifiers, check option 'fmt' of numpy savetxt function, which  
-    is used to write the CSV files. 
+    default. The format specifiers are printf-style specifiers as used by the option 'fmt' of the numpy savetxt
+    function.
+
+    The rows are sorted by date and written in chunks of CHUNK_SIZE rows, so that large datasets can be written without
+    keeping the whole formatted file in memory.
 
     Example for 'fields' dictionary:
 
@@ -58,12 +69,7 @@ def csv_(
         file_path:  File path of CSV file.
         fields:     Dictionary with field name as key and format specifiers as values
     """
-    file_path = Path(file_path)
-
-    if not file_path.parent.exists():
-        file_path.parent.mkdir(parents=True, exist_ok=False)
-         
-    # Get data types needed to define numpy array
+    # Get data types and format specifiers of fields
     field_types = list()
     for field, format_ in fields.items():
         if "s" in format_:
@@ -81,10 +87,10 @@ def csv_(
 
     # Add date field to dataset
     if "date" not in dset.fields:
-        dset.add_text("date", val=[d.strftime("%Y-%m-%d %H:%M:%S") for d in dset.time.datetime])
+        dset.add_text("date", val=_format_dates(dset.time))
 
-    # Generate output_list with tuples, which include field values for each row
-    output_list = list()
+    # Get field values
+    columns = list()
     for field in fields.keys():
         words = field.split(".")
         name = words[0]
@@ -93,25 +99,61 @@ def csv_(
             attrs = tuple(words)
         else:
             attrs = ()
-        output_list.append(get_field(dset, name, attrs))
-    output_list = list(zip(*(output_list)))
+        columns.append(get_field(dset, name, attrs))
 
     # List epochs ordered by dates
-    idx = np.concatenate([np.where(dset.filter(date=d))[0] for d in sorted(dset.unique("date"))])
-           
-    # Put together fields in an array as specified by the 'dtype' tuple list    
-    output_array = np.array(output_list, dtype=[(field, type_) for field, type_ in zip(fields, field_types)])[idx]
-
-    # Write to disk
-    np.savetxt(
-        file_path,
-        output_array,
-        fmt=tuple(format_ for format_ in fields.values()),
-        header=_get_csv_header(fields.keys()),
-        comments="",
-        delimiter=",",
-        encoding="utf8",
-    )
+    idx = np.argsort(dset["date"], kind="stable")
+
+    # Write to disk chunk by chunk, formatting one column at a time
+    with files.open(file_path, create_dirs=True, mode="wt", encoding="utf8") as fid:
+        fid.write(f"{_get_csv_header(fields.keys())}\n")
+        for chunk_start in range(0, len(idx), CHUNK_SIZE):
+            idx_chunk = idx[chunk_start : chunk_start + CHUNK_SIZE]
+            chunk = [
+                _format_column(values[idx_chunk], format_, type_)
+                for values, format_, type_ in zip(columns, fields.values(), field_types)
+            ]
+            fid.write("".join(f"{','.join(row)}\n" for row in zip(*chunk)))
+
+
+def _format_column(values: np.ndarray, format_: str, type_: type) -> List[str]:
+    """Format values of one column
+
+    Numerical values are converted to Python numbers in one go before formatting, which is considerably faster than
+    formatting numpy scalars row by row.
+
+    Args:
+        values:   Values of column.
+        format_:  Format specifier, e.g. '%.2f'.
+        type_:    Data type of column, either object, int or float.
+
+    Returns:
+        Formatted values.
+    """
+    if type_ is object:
+        return [format_ % (value,) for value in values]
+
+    return [format_ % value for value in np.asarray(values, dtype=type_).tolist()]
+
+
+def _format_dates(time: "Time") -> np.ndarray:
+    """Format time as date strings 'YYYY-MM-DD HH:MM:SS'
+
+    The Julian dates are converted to numpy datetime64 for all epochs at once, instead of calling strftime for each
+    epoch. As for the datetime format of Time, the epochs are rounded to microseconds before they are truncated to
+    seconds.
+
+    Args:
+        time:  Time object.
+
+    Returns:
+        Array with date strings.
+    """
+    jd1 = np.asarray(time.jd1, dtype=float)
+    jd2 = np.asarray(time.jd2, dtype=float)
+    microseconds = np.round((jd1 - JD_1970) * DAY2MICROSECONDS) + np.round(jd2 * DAY2MICROSECONDS)
+    datetimes = np.atleast_1d(microseconds.astype("int64").astype("datetime64[us]"))
+    return np.char.replace(np.datetime_as_string(datetimes, unit="s"), "T", " ")
 
 
 def _get_csv_header(fields: List[str]) -> str:
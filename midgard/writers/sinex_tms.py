@@ -469,17 +469,11 @@ class TimeseriesBlocks:
             header += f" _{{:{str(fmt)}s}}".format(name.ljust(fmt,"_"))
         self.fid.write(f"{header}\n")
 
-        # Write data
-        idx_sta = self.dset.filter(station=self.station)
-        for time in sorted(self.dset.time.utc.datetime[idx_sta]):
-            idx = time == self.dset.time.utc.datetime[idx_sta]
-            line = " "
-            for name, field in self.data_field_types.items():
-                if self.dset.time.utc.datetime[idx_sta].shape[0] == 1: # only one station coordinate entry are given
-                    line += f"{{:{DATA_TYPES[name].format}}}".format(np.squeeze(attrgetter(field)(self.dset)))
-                else:
-                    line += f"{{:{DATA_TYPES[name].format}}}".format(attrgetter(field)(self.dset)[idx_sta][idx][0])
-            self.fid.write(f"{line}\n")
+        # Write data sorted by time. Epochs given several times are written with the values of their first entry.
+        rows = self._get_rows_sorted_by_time()
+        line_fmt = " " + "".join(f"{{:{DATA_TYPES[name].format}}}" for name in self.data_field_types.keys()) + "\n"
+        columns = [np.asarray(attrgetter(field)(self.dset))[rows].tolist() for field in self.data_field_types.values()]
+        self.fid.writelines(line_fmt.format(*values) for values in zip(*columns))
         self.fid.write("-TIMESERIES/DATA\n")
 
 
@@ -517,10 +511,12 @@ class TimeseriesBlocks:
         self.fid.write("+SOLUTION/ESTIMATE\n")
         self.fid.write("*INDEX TYPE_________ STATION__ PT SOLN __DATA_START__ __DATA_END____ UNIT_ __ESTIMATED_VALUE_____ __STD_DEV____\n")
 
-        index=1
+        # Collect solution entries first, so that all epochs can be converted to SINEX format at once
+        solution_entries = list()
         for type_, entries in self.estimate_parameter_field_types.items():
             if type_.endswith("_SIG"): # Skip standard deviation entries
                 continue
+            sigmas = self.estimate_parameter_field_types.get(f"{type_}_SIG")
 
             # Handling of time dependent entries (e.g. like trend and offset)
             if type(entries) == dict:
@@ -528,42 +524,34 @@ class TimeseriesBlocks:
                 for idx_sol, (period, value) in enumerate(entries.items()):
                     
                     if type(period) == tuple: # Handling of trend time interval
-                        time_from=Time(datetime.fromisoformat(period[0]), scale='utc', fmt='datetime').yyyydddsssss
-                        time_to=Time(datetime.fromisoformat(period[1]), scale='utc', fmt='datetime').yyyydddsssss
+                        time_from, time_to = (datetime.fromisoformat(p) for p in period)
                     else: # Handling of offset timestamp
-                        time_from=Time(datetime.fromisoformat(period), scale='utc', fmt='datetime').yyyydddsssss
-                        time_to="0000:000:00000"
-
-                    self.fid.write(" {index:>5d} {type_:<13s} {station:<9s} {point_id:>2s} {soln_id:>4d} {time_from:12s} {time_to:12s} {unit:5s} {value:>22.15E} {sigma:>13.6E}\n".format(
-                            index=index,
-                            type_=type_,
-                            station=self.station.upper(),
-                            point_id="A",
-                            soln_id=idx_sol+1,
-                            time_from=time_from,
-                            time_to=time_to,
-                            unit=ESTIMATE_PARAMETER_FIELD_TYPES[type_].unit,
-                            value=value,
-                            sigma= self.estimate_parameter_field_types[f"{type_}_SIG"][period] if f"{type_}_SIG" in self.estimate_parameter_field_types.keys() else 0.0,
-                        )
-                    )
-                    index+=1
+                        time_from, time_to = datetime.fromisoformat(period), None
+                    sigma = 0.0 if sigmas is None else sigmas[period]
+                    solution_entries.append((type_, idx_sol + 1, time_from, time_to, value, sigma))
             else:
-
-                self.fid.write(" {index:>5d} {type_:<13s} {station:<9s} {point_id:>2s} {soln_id:>4d} {time_from:12s} {time_to:12s} {unit:5s} {value:>22.15E} {sigma:>13.6E}\n".format(
-                        index=index,
-                        type_=type_,
-                        station=self.station.upper(),
-                        point_id="A",
-                        soln_id=1,
-                        time_from=Time(self.dset.meta["vel"]["interval"][0][0], scale='utc', fmt='datetime').yyyydddsssss,
-                        time_to=Time(self.dset.meta["vel"]["interval"][0][1], scale='utc', fmt='datetime').yyyydddsssss,
-                        unit=ESTIMATE_PARAMETER_FIELD_TYPES[type_].unit,
-                        value=entries,
-                        sigma= self.estimate_parameter_field_types[f"{type_}_SIG"] if f"{type_}_SIG" in self.estimate_parameter_field_types.keys() else 0.0,
-                    )
+                time_from, time_to = self.dset.meta["vel"]["interval"][0]
+                sigma = 0.0 if sigmas is None else sigmas
+                solution_entries.append((type_, 1, time_from, time_to, entries, sigma))
+
+        epochs = list({e for entry in solution_entries for e in entry[2:4] if e is not None})
+        sinex_epochs = dict(zip(epochs, self._format_epochs(epochs)))
+        sinex_epochs[None] = "0000:000:00000"
+
+        for index, (type_, soln_id, time_from, time_to, value, sigma) in enumerate(solution_entries, start=1):
+            self.fid.write(" {index:>5d} {type_:<13s} {station:<9s} {point_id:>2s} {soln_id:>4d} {time_from:12s} {time_to:12s} {unit:5s} {value:>22.15E} {sigma:>13.6E}\n".format(
+                    index=index,
+                    type_=type_,
+                    station=self.station.upper(),
+                    point_id="A",
+                    soln_id=soln_id,
+                    time_from=sinex_epochs[time_from],
+                    time_to=sinex_epochs[time_to],
+                    unit=ESTIMATE_PARAMETER_FIELD_TYPES[type_].unit,
+                    value=value,
+                    sigma=sigma,
                 )
-                index+=1
+            )
 
         self.fid.write("-SOLUTION/ESTIMATE\n")
 
@@ -629,6 +617,38 @@ class TimeseriesBlocks:
         return parameter_fields
 
     
+    @staticmethod
+    def _format_epochs(epochs: List[datetime]) -> List[str]:
+        """Convert epochs to SINEX format YYYY:DDD:SSSSS using one Time object for all epochs
+
+        Args:
+            epochs:  Epochs as datetime objects.
+
+        Returns:
+            Epochs in SINEX format in the same order as given.
+        """
+        if not epochs:
+            return []
+        return np.atleast_1d(Time(epochs, scale="utc", fmt="datetime").yyyydddsssss).tolist()
+
+    def _get_rows_sorted_by_time(self) -> np.ndarray:
+        """Get dataset indices of the station rows sorted by time
+
+        The rows are sorted once, and rows with the same epoch are grouped. For each epoch given several times, the
+        first row of the epoch is repeated, as when the rows are picked by comparing with each epoch.
+
+        Returns:
+            Indices of dataset rows in the order they should be written.
+        """
+        idx_sta = np.flatnonzero(self.dset.filter(station=self.station))
+        times = np.atleast_1d(self.dset.time.utc.datetime)[idx_sta]
+        order = np.argsort(times, kind="stable")
+        sorted_times = times[order]
+        is_first = np.ones(len(sorted_times), dtype=bool)
+        is_first[1:] = sorted_times[1:] != sorted_times[:-1]
+        first_in_group = np.flatnonzero(is_first)[np.cumsum(is_first) - 1]
+        return idx_sta[order[first_in_group]]
+
     def _get_ref_pos(self) -> "Position":
         """Get reference coordinate position for the given station
         
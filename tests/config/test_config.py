@@ -538,3 +538,43 @@ def test_repr_of_entry():
     """Test that the repr of an entry is sensible"""
     entry = config.ConfigurationEntry("key", "value")
     assert repr(entry) == "ConfigurationEntry(key='key', value='value')"
+
+
+def test_snapshot_of_configuration(config_file):
+    """Test that a snapshot gives the same values as the configuration, with variables replaced"""
+    config_file.update("midgard", "path", "{var_1}/{var_2}/{var_3}")
+    snapshot = config_file.snapshot()
+
+    assert snapshot.midgard.foo.str == config_file.midgard.foo.str
+    assert snapshot.data_types.float.float == 3.14
+    assert snapshot.midgard.path.path == pathlib.Path("one/two/{var_3}")
+    assert snapshot.midgard.path.replace(var_3="three").str == "one/two/three"
+    assert snapshot.get("foo", section="midgard", default="none").str == "bar"
+    assert snapshot.get("missing", section="midgard", default="none").str == "none"
+
+
+def test_snapshot_is_reused_until_configuration_changes(config_file):
+    """Test that a snapshot is only rebuilt when the configuration, profiles or variables change"""
+    snapshot = config_file.snapshot()
+    assert config_file.snapshot() is snapshot
+
+    config_file.update("midgard", "pi", "3.1415")
+    assert config_file.snapshot().midgard.pi.float == 3.1415
+
+    assert config_file.snapshot().profile_test.technique.str == "none"
+    config_file.profiles = ["sisre"]
+    assert config_file.snapshot().profile_test.technique.str == "gnss"
+
+    config_file.update("midgard", "path", "{var_1}")
+    config_file.update_vars(dict(var_1="uno"))
+    assert config_file.snapshot().midgard.path.str == "uno"
+
+
+def test_snapshot_is_read_only(config_file):
+    """Test that entries in a snapshot can not be changed"""
+    snapshot = config_file.snapshot()
+    with pytest.raises(TypeError):
+        snapshot.midgard["foo"] = config.ConfigurationEntry("foo", "baz")
+
+    snapshot.data_types.sequence.list.append("four")
+    assert snapshot.data_types.sequence.list == ["one", "two", "three"]
@@ -0,0 +1,100 @@
+"""Tests for the config.files-module
+
+"""
+# Third party imports
+import pytest
+
+# Midgard imports
+from midgard.config import files
+
+
+#
+# Test configuration
+#
+@pytest.fixture
+def file_cfg(tmp_path):
+    """A file configuration with paths in a temporary directory"""
+    cfg = files.FileConfiguration("file_vars")
+    cfg.download_missing = False
+    cfg.update("data", "directory", str(tmp_path / "{station}"))
+    cfg.update("data", "filename", "{station}_{year}.txt{gz}")
+    cfg.update("data", "aliases", "{station}{year}.txt, {station}.dat")
+    return cfg
+
+
+#
+# Tests
+#
+def test_path_no_alias_exists(file_cfg, tmp_path):
+    """Test that the main path is returned when no aliases exist"""
+    path = file_cfg.path("data", file_vars=dict(station="abcd", year="2020"))
+    assert path == tmp_path / "abcd" / "abcd_2020.txt"
+
+
+def test_path_alias_order(file_cfg, tmp_path):
+    """Test that aliases are checked in the order given in the configuration"""
+    directory = tmp_path / "abcd"
+    directory.mkdir()
+    (directory / "abcd.dat").touch()
+    file_vars = dict(station="abcd", year="2020")
+    assert file_cfg.path("data", file_vars=file_vars) == directory / "abcd.dat"
+
+    file_cfg.clear_path_cache()
+    (directory / "abcd2020.txt").touch()
+    assert file_cfg.path("data", file_vars=file_vars) == directory / "abcd2020.txt"
+
+    file_cfg.clear_path_cache()
+    (directory / "abcd_2020.txt.gz").touch()
+    assert file_cfg.path("data", file_vars=file_vars) == directory / "abcd_2020.txt.gz"
+
+
+def test_path_alias_broken_symlink(file_cfg, tmp_path):
+    """Test that aliases that are broken symbolic links are not used"""
+    directory = tmp_path / "abcd"
+    directory.mkdir()
+    (directory / "abcd.dat").touch()
+    (directory / "abcd2020.txt").symlink_to(directory / "missing.txt")
+    file_vars = dict(station="abcd", year="2020")
+    assert file_cfg.path("data", file_vars=file_vars) == directory / "abcd.dat"
+
+
+def test_path_cache(file_cfg, tmp_path):
+    """Test that existing paths are cached and the cache is cleared when the configuration is updated"""
+    directory = tmp_path / "abcd"
+    directory.mkdir()
+    (directory / "abcd.dat").touch()
+    file_vars = dict(station="abcd", year="2020")
+    assert file_cfg.path("data", file_vars=file_vars) == directory / "abcd.dat"
+
+    # Cached path is returned even if a better alias appears
+    (directory / "abcd2020.txt").touch()
+    assert file_cfg.path("data", file_vars=file_vars) == directory / "abcd.dat"
+
+    # Updating the configuration clears the cache
+    file_cfg.update("data", "aliases", "{station}{year}.txt")
+    assert file_cfg.path("data", file_vars=file_vars) == directory / "abcd2020.txt"
+
+
+def test_path_missing_not_cached(file_cfg, tmp_path):
+    """Test that a path that is not found is looked up again"""
+    file_vars = dict(station="abcd", year="2020")
+    assert file_cfg.path("data", file_vars=file_vars) == tmp_path / "abcd" / "abcd_2020.txt"
+
+    (tmp_path / "abcd").mkdir()
+    (tmp_path / "abcd" / "abcd.dat").touch()
+    assert file_cfg.path("data", file_vars=file_vars) == tmp_path / "abcd" / "abcd.dat"
+
+
+def test_glob_paths(file_cfg, tmp_path):
+    """Test that glob_paths finds files matching the file name and the aliases"""
+    directory = tmp_path / "abcd"
+    directory.mkdir()
+    for file_name in ("abcd_2019.txt", "abcd2018.txt", "abcd.dat", "other.txt"):
+        (directory / file_name).touch()
+
+    paths = file_cfg.glob_paths("data", file_vars=dict(station="abcd"))
+    assert {p.name for p in paths} == {"abcd2018.txt", "abcd_2019.txt", "abcd.dat"}
+
+    (directory / "abcd_2021.txt").touch()
+    paths = file_cfg.glob_paths("data", file_vars=dict(station="abcd"))
+    assert "abcd_2021.txt" in {p.name for p in paths}
@@ -0,0 +1,28 @@
+"""Fixtures used by all tests
+
+Plug-in manifests are only kept in memory during the tests, so that the tests do not write to the user's cache
+directory. Tests of the manifest cache set `plugins.MANIFEST_DIRECTORY` to a temporary directory.
+"""
+# Third party imports
+import pytest
+
+# Midgard imports
+from midgard.dev import plugins
+
+
+def pytest_configure(config):
+    """Do not cache plug-in manifests of modules imported while collecting tests"""
+    plugins.MANIFEST_DIRECTORY = None
+
+
+@pytest.fixture(scope="session")
+def cache_home(tmp_path_factory):
+    """Temporary cache directory used instead of the user's cache directory"""
+    return tmp_path_factory.mktemp("cache")
+
+
+@pytest.fixture(autouse=True)
+def plugin_manifest_directory(cache_home, monkeypatch):
+    """Do not cache plug-in manifests in the user's cache directory, also not in subprocesses started by tests"""
+    monkeypatch.setattr(plugins, "MANIFEST_DIRECTORY", None)
+    monkeypatch.setenv("XDG_CACHE_HOME", str(cache_home))
@@ -2,6 +2,7 @@
 # Standard library imports
 import copy
 from datetime import datetime, timedelta
+import io
 import os
 
 # Third party imports
@@ -415,6 +416,21 @@ def test_read_write(dset):
     os.remove(file_name)
 
 
+def test_read_write_in_memory():
+    """Test data equality after write to and read from an in-memory HDF5 file"""
+    dset = dataset.Dataset(2)
+    dset.add_text("text", val=["hello", "goodbye"])
+    dset.add_float("numbers", val=[1.5, 2.5], unit="meter")
+
+    buffer = io.BytesIO()
+    dset.write(buffer)
+    dset_new = dataset.Dataset.read(io.BytesIO(buffer.getvalue()))
+
+    assert np.char.equal(dset.text, dset_new.text).all()
+    assert np.equal(dset.numbers, dset_new.numbers).all()
+    assert dset_new.unit("numbers") == ("meter",)
+
+
 def test_read_write_write_level():
     """Test data equality after write and then read"""
     file_name = "test.hdf5"
@@ -3,6 +3,7 @@
 """
 # Standard library imports
 import pathlib
+import sys
 
 # Third party imports
 import pytest
@@ -175,3 +176,54 @@ def test_all_docs(plugin_package):
     plugin_name = "plugin_plain"
     assert plugin_name in docs
     assert docs[plugin_name] == "A plain plugin"
+
+
+@pytest.fixture
+def tmp_plugin_package(tmp_path, monkeypatch):
+    """A temporary plugin package, with the plugin manifests stored in a temporary directory"""
+    package_dir = tmp_path / "tmp_plugins"
+    package_dir.mkdir()
+    (package_dir / "__init__.py").touch()
+    (package_dir / "plugin_one.py").write_text(
+        "from midgard.dev import plugins\n\n\n"
+        "@plugins.register\n"
+        "def plugin_one():\n"
+        '    """First plugin\n\n    More about the first plugin.\n    """\n'
+        "    return 1\n"
+    )
+    (package_dir / "not_a_plugin.py").write_text("VALUE = 1\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setattr(plugins, "MANIFEST_DIRECTORY", tmp_path / "manifests")
+    yield "tmp_plugins"
+
+    for module_name in [m for m in sys.modules if m.startswith("tmp_plugins")]:
+        del sys.modules[module_name]
+    plugins._PLUGINS.pop("tmp_plugins", None)
+
+
+def test_list_without_import(tmp_plugin_package):
+    """Test that plugins are listed and documented without importing them"""
+    assert plugins.names(tmp_plugin_package) == ["plugin_one"]
+    assert plugins.exists(tmp_plugin_package, "plugin_one")
+    assert not plugins.exists(tmp_plugin_package, "not_a_plugin")
+    assert plugins.doc(tmp_plugin_package, "plugin_one", long_doc=False) == "First plugin"
+    assert plugins.parts(tmp_plugin_package, "plugin_one") == ["plugin_one"]
+    assert not [m for m in sys.modules if m.startswith(tmp_plugin_package)]
+
+    assert plugins.call(tmp_plugin_package, "plugin_one") == 1
+
+
+def test_manifest_updated(tmp_plugin_package):
+    """Test that the manifest is updated when a plugin module changes"""
+    assert plugins.names(tmp_plugin_package) == ["plugin_one"]
+    assert list((plugins.MANIFEST_DIRECTORY).glob("tmp_plugins-*.json"))
+
+    package_dir = pathlib.Path(sys.path[0]) / tmp_plugin_package
+    (package_dir / "not_a_plugin.py").write_text(
+        "from midgard.dev import plugins\n\n\n@plugins.register_ordered(-1)\ndef plugin_two():\n    return 2\n"
+    )
+    assert plugins.names(tmp_plugin_package) == ["not_a_plugin", "plugin_one"]
+
+    # A new process reads the stored manifest
+    plugins._MANIFESTS.clear()
+    assert plugins.names(tmp_plugin_package) == ["not_a_plugin", "plugin_one"]
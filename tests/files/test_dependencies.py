@@ -0,0 +1,65 @@
+"""Tests for the files.dependencies-module"""
+
+# Standard library imports
+import os
+
+# Third party imports
+import pytest
+
+# Midgard imports
+from midgard.files import dependencies
+
+
+@pytest.fixture
+def dependency_files(tmp_path):
+    """Dependency file with three dependencies, all modified long before they are hashed"""
+    file_paths = [tmp_path / f"input{num}.txt" for num in range(3)]
+    for file_path in file_paths:
+        file_path.write_text(f"Contents of {file_path.name}\n")
+        os.utime(file_path, ns=(10 ** 18, 10 ** 18))
+
+    dependency_path = tmp_path / "dependencies.txt"
+    dependencies.init(dependency_path, fast_check=False)
+    dependencies.add(*file_paths, label="input")
+    dependencies.write()
+    yield dependency_path, file_paths
+
+    dependencies._DEPENDENCY_CACHE.clear()
+    dependencies._MD5_INDEXES.clear()
+
+
+def test_changed_slow_check(dependency_files):
+    """Test that changes in file contents are detected with slow check"""
+    dependency_path, file_paths = dependency_files
+    assert not dependencies.changed(dependency_path, fast_check=False)
+
+    # Touching a file without changing its contents is not a change
+    os.utime(file_paths[1], ns=(15 * 10 ** 17, 15 * 10 ** 17))
+    assert not dependencies.changed(dependency_path, fast_check=False)
+
+    file_paths[2].write_text("New contents\n")
+    assert dependencies.changed(dependency_path, fast_check=False)
+
+
+def test_md5_index_persistent(dependency_files, monkeypatch):
+    """Test that files with unchanged signature are not hashed again, also in a new process"""
+    dependency_path, file_paths = dependency_files
+    assert (dependency_path.parent / "dependencies.txt.md5_index").exists()
+    dependencies._MD5_INDEXES.clear()  # Read index from disk, as in a new process
+
+    hashed = list()
+    get_md5 = dependencies.get_md5
+    monkeypatch.setattr(dependencies, "get_md5", lambda file_path: hashed.append(file_path) or get_md5(file_path))
+    assert not dependencies.changed(dependency_path, fast_check=False)
+    assert hashed == []
+
+    os.utime(file_paths[0], ns=(15 * 10 ** 17, 15 * 10 ** 17))
+    assert not dependencies.changed(dependency_path, fast_check=False)
+    assert hashed == [str(file_paths[0])]
+
+
+def test_get_paths_with_label(dependency_files):
+    """Test that paths can be found by label"""
+    dependency_path, file_paths = dependency_files
+    assert sorted(dependencies.get_paths_with_label(dependency_path, "inp.*")) == file_paths
+    assert dependencies.get_paths_with_label(dependency_path, "output") == []
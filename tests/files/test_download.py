@@ -0,0 +1,157 @@
+"""Tests for the files.download-module"""
+
+# Standard library imports
+import hashlib
+import http.server
+import threading
+
+# Third party imports
+import pytest
+
+# Midgard imports
+from midgard.config import files as config_files
+from midgard.files import download
+
+FILES = {f"file{num}.txt": f"Contents of file number {num}\n".encode() * 100 for num in range(8)}
+
+
+class _RangeRequestHandler(http.server.BaseHTTPRequestHandler):
+    """Serve FILES from memory, supporting simple byte range requests"""
+
+    protocol_version = "HTTP/1.1"
+    requests = list()
+
+    def do_GET(self):
+        name = self.path.strip("/")
+        range_header = self.headers.get("Range")
+        self.requests.append((name, range_header, self.client_address))
+        if name not in FILES:
+            body = b"Not found\n"
+            self.send_response(404)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            return
+
+        data = FILES[name]
+        if range_header:
+            start = int(range_header.partition("=")[2].partition("-")[0])
+            self.send_response(206)
+            self.send_header("Content-Range", f"bytes {start}-{len(data) - 1}/{len(data)}")
+            data = data[start:]
+        else:
+            self.send_response(200)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+class _NoRangeRequestHandler(_RangeRequestHandler):
+    """Serve FILES from memory, ignoring byte range requests"""
+
+    def do_GET(self):
+        del self.headers["Range"]
+        super().do_GET()
+
+
+@pytest.fixture(params=[_RangeRequestHandler])
+def server(request):
+    """Local HTTP server, yields the base URL of the server"""
+    _RangeRequestHandler.requests = list()
+    httpd = http.server.ThreadingHTTPServer(("127.0.0.1", 0), request.param)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_download_many(server, tmp_path):
+    """Test that many files are downloaded, reusing connections"""
+    manager = download.DownloadManager(max_host_connections=2)
+    for name in FILES:
+        manager.add(f"{server}/{name}", tmp_path / "sub" / name)
+    results = manager.download()
+
+    assert all(results.values()) and len(results) == len(FILES)
+    for name, data in FILES.items():
+        assert (tmp_path / "sub" / name).read_bytes() == data
+    assert not list((tmp_path / "sub").glob("*.part"))
+
+    # At most two connections are used to the host
+    assert len({client for _, _, client in _RangeRequestHandler.requests}) <= 2
+
+
+def test_download_resume(server, tmp_path):
+    """Test that a partial download is resumed"""
+    data = FILES["file1.txt"]
+    (tmp_path / "file1.txt.part").write_bytes(data[:1000])
+
+    manager = download.DownloadManager()
+    manager.add(f"{server}/file1.txt", tmp_path / "file1.txt")
+    assert manager.download() == {tmp_path / "file1.txt": True}
+
+    assert (tmp_path / "file1.txt").read_bytes() == data
+    assert _RangeRequestHandler.requests[0][1] == "bytes=1000-"
+
+
+@pytest.mark.parametrize("server", [_NoRangeRequestHandler], indirect=True)
+def test_download_resume_not_supported(server, tmp_path):
+    """Test that a partial file is downloaded from the start if the server does not support byte ranges"""
+    data = FILES["file1.txt"]
+    (tmp_path / "file1.txt.part").write_bytes(b"Stale data")
+
+    manager = download.DownloadManager(retries=0)
+    manager.add(f"{server}/file1.txt", tmp_path / "file1.txt")
+    assert manager.download() == {tmp_path / "file1.txt": True}
+
+    assert (tmp_path / "file1.txt").read_bytes() == data
+    assert not (tmp_path / "file1.txt.part").exists()
+
+
+def test_download_checksum(server, tmp_path):
+    """Test that files with wrong checksum are not kept, and that existing files with correct checksum are skipped"""
+    md5 = hashlib.md5(FILES["file2.txt"]).hexdigest()
+    manager = download.DownloadManager(retries=0)
+    manager.add(f"{server}/file2.txt", tmp_path / "file2.txt", checksum=f"md5:{md5}")
+    manager.add(f"{server}/file3.txt", tmp_path / "file3.txt", checksum=f"md5:{md5}")
+    results = manager.download()
+
+    assert results == {tmp_path / "file2.txt": True, tmp_path / "file3.txt": False}
+    assert not (tmp_path / "file3.txt").exists() and not (tmp_path / "file3.txt.part").exists()
+
+    num_requests = len(_RangeRequestHandler.requests)
+    manager.add(f"{server}/file2.txt", tmp_path / "file2.txt", checksum=f"md5:{md5}")
+    assert manager.download() == {tmp_path / "file2.txt": True}
+    assert len(_RangeRequestHandler.requests) == num_requests
+
+
+def test_download_missing(server, tmp_path):
+    """Test that a missing file is retried and not written"""
+    manager = download.DownloadManager(retries=1)
+    manager.add(f"{server}/missing.txt", tmp_path / "missing.txt")
+    assert manager.download() == {tmp_path / "missing.txt": False}
+
+    assert not list(tmp_path.iterdir())
+    assert len(_RangeRequestHandler.requests) == 2
+
+
+def test_file_configuration_download_files(server, tmp_path):
+    """Test that FileConfiguration downloads files given by file keys"""
+    cfg = config_files.FileConfiguration("file_vars")
+    cfg.update("data", "directory", str(tmp_path / "{station}"))
+    cfg.update("data", "filename", "file{num}.txt")
+    cfg.update("data", "url", f"{server}")
+
+    file_paths = cfg.download_files([("data", dict(station="abcd", num=str(num))) for num in range(4)])
+
+    assert file_paths == [tmp_path / "abcd" / f"file{num}.txt" for num in range(4)]
+    for file_path in file_paths:
+        assert file_path.read_bytes() == FILES[file_path.name]
+
+    # Files that are not downloaded are given as None
+    file_paths = cfg.download_files([("data", dict(station="abcd", num=num)) for num in ("5", "missing")])
+    assert file_paths == [tmp_path / "abcd" / "file5.txt", None]
@@ -0,0 +1,74 @@
+"""Tests for the files.files-module"""
+
+# Standard library imports
+import gzip
+import pathlib
+import re
+
+# Third party imports
+import pytest
+
+# Midgard imports
+from midgard.files import files
+
+EXAMPLE_FILES = pathlib.Path(__file__).parent.parent / "parsers" / "example_files"
+
+
+def test_open_hatanaka():
+    """Test that compact RINEX files are decompressed while reading"""
+    expected = [line.rstrip() for line in (EXAMPLE_FILES / "rinex3_obs").read_text().splitlines()]
+
+    with files.open(EXAMPLE_FILES / "rinex3_obs.crx", mode="rt") as fid:
+        assert fid.readline().startswith("     3.03           OBSERVATION DATA")
+        lines = [fid.readline()[:-1]] + fid.read().splitlines()
+
+    assert [expected[0]] + lines == expected
+
+
+def test_open_hatanaka_rinex2():
+    """Test that compact RINEX 1.0 files are decompressed to the RINEX 2 file
+
+    The example has epochs with more than 12 satellites and receiver clock offsets, and more than 5 observation types.
+    CRX2RNX writes observations and clock offsets less than one without leading zero, e.g. '.123' instead of '0.123'.
+    """
+    expected = (EXAMPLE_FILES / "rinex2_obs_short").read_text().splitlines()
+    num_header = next(idx for idx, line in enumerate(expected, start=1) if line[60:73] == "END OF HEADER")
+    expected = [line.rstrip() for line in expected[:num_header]] + [
+        re.sub(r" (-?)0\.(\d{3,5}|\d{9})(?= |$)", r"  \1.\2", line.rstrip()) for line in expected[num_header:]
+    ]
+
+    with files.open(EXAMPLE_FILES / "rinex2_obs_short.18d", mode="rt") as fid:
+        lines = [line.rstrip() for line in fid]
+
+    assert lines == expected
+
+
+@pytest.mark.parametrize("open_as_hatanaka", [None, True])
+def test_open_hatanaka_in_memory(tmp_path, open_as_hatanaka):
+    """Test that gzipped compact RINEX files can be read into memory"""
+    file_path = tmp_path / "rinex3_obs.crx.gz"
+    file_path.write_bytes(gzip.compress((EXAMPLE_FILES / "rinex3_obs.crx").read_bytes()))
+
+    with files.open(EXAMPLE_FILES / "rinex3_obs.crx", mode="rt") as fid:
+        expected = fid.read()
+    with files.open(file_path, mode="rt", open_as_hatanaka=open_as_hatanaka, in_memory=True) as fid:
+        assert fid.read() == expected
+
+
+def test_open_hatanaka_binary():
+    """Test that compact RINEX files can not be decompressed in binary mode"""
+    with pytest.raises(ValueError):
+        with files.open(EXAMPLE_FILES / "rinex3_obs.crx", mode="rb", open_as_hatanaka=True):
+            pass
+
+
+def test_open_gzip_in_memory(tmp_path):
+    """Test that reading a gzipped file into memory gives the same content as reading the gzip stream"""
+    file_path = tmp_path / "test.txt.gz"
+    with gzip.open(file_path, mode="wt") as fid:
+        fid.write("First line\nSecond line\n")
+
+    with files.open(file_path, mode="rt", in_memory=True) as fid:
+        assert list(fid) == ["First line\n", "Second line\n"]
+    with files.open(file_path, in_memory=True) as fid:
+        assert fid.read() == b"First line\nSecond line\n"
@@ -8,6 +8,7 @@ Note: If '-s' option is used by calling pytest, then also debug messages are pri
 """
 # Standard library imports
 from datetime import datetime
+import pathlib
 
 # Third party imports
 import pytest
@@ -20,10 +21,13 @@ from midgard.gnss.antenna_calibration import AntennaCalibration
 #
 # TEST DATA
 #
+ANTEX_FILE = pathlib.Path(__file__).parent.parent / "parsers" / "example_files" / "antex"
+
+
 @pytest.fixture
 def ant():
     """Generate AntennaCalibration object by reading example ANTEX file"""
-    return AntennaCalibration(file_path="../parsers/example_files/antex")
+    return AntennaCalibration(file_path=ANTEX_FILE)
 
     
 #
@@ -73,6 +77,68 @@ def test_get_satellite_type(ant, date, satellite):
     assert type_[0] == "BLOCK IIA" 
 
 
+def test_get_pcv(ant):
+    """Test of get_pcv() function
+    """
+    azi = ant.data["AERAT1675_120   SPKE"]["G01"]["azi"]
+    azimuth = np.radians([0.0, 5.0, 2.5, 725.0])
+    zenith = np.radians([0.0, 5.0, 7.5, 95.0])
+    pcv = ant.get_pcv("AERAT1675_120", "G01", azimuth, zenith, radome="SPKE")
+    expected_pcv = [azi[0, 0], azi[1, 1], (azi[0, 1] + azi[0, 2] + azi[1, 1] + azi[1, 2]) / 4, azi[1, -1]]
+    np.testing.assert_allclose(pcv, expected_pcv, rtol=0, atol=1e-12)
+
+    # Satellite antenna with non-azimuth-dependent corrections
+    pcv = ant.get_pcv("G01", "G01", 0.0, np.radians([0.0, 0.5]), date=datetime(1993, 2, 1))
+    np.testing.assert_allclose(pcv, [-0.0008, -0.00085], rtol=0, atol=1e-12)
+
+
+def test_binary_cache(tmp_path):
+    """Test that antenna calibration read from binary cache is equal to parsed antenna calibration
+    """
+    parsed = AntennaCalibration(file_path=ANTEX_FILE, use_binary_cache=True, cache_dir=tmp_path)
+    assert (tmp_path / "antex.pcv").exists()
+    cached = AntennaCalibration(file_path=ANTEX_FILE, use_binary_cache=True, cache_dir=tmp_path)
+    assert isinstance(cached._pcv_values, np.memmap)
+    assert cached.data.keys() == parsed.data.keys()
+    date = datetime(1993, 2, 1)
+    assert cached.get_satellite_info(date, "G01") == parsed.get_satellite_info(date, "G01")
+    np.testing.assert_allclose(
+        cached.data["AERAT1675_120   SPKE"]["R02"]["azi"], parsed.data["AERAT1675_120   SPKE"]["R02"]["azi"]
+    )
+
+
+def test_binary_cache_not_used_by_default(tmp_path):
+    """Test that no binary cache is written unless asked for
+    """
+    AntennaCalibration(file_path=ANTEX_FILE, cache_dir=tmp_path)
+    assert not (tmp_path / "antex.pcv").exists()
+
+
+def test_binary_cache_truncated(tmp_path):
+    """Test that the ANTEX file is parsed if the binary cache file is truncated
+    """
+    parsed = AntennaCalibration(file_path=ANTEX_FILE, use_binary_cache=True, cache_dir=tmp_path)
+    cache_path = tmp_path / "antex.pcv"
+    cache_path.write_bytes(cache_path.read_bytes()[:-8])
+    reparsed = AntennaCalibration(file_path=ANTEX_FILE, use_binary_cache=True, cache_dir=tmp_path)
+    assert not isinstance(reparsed._pcv_values, np.memmap)
+    assert reparsed.data.keys() == parsed.data.keys()
+
+
+def test_binary_cache_open_ended(tmp_path):
+    """Test that satellite periods without end of validity are not limited to the time the binary cache was written
+    """
+    antex_path = tmp_path / "antex"
+    antex_path.write_text(
+        "".join(line for line in ANTEX_FILE.read_text().splitlines(keepends=True) if "VALID UNTIL" not in line)
+    )
+    parsed = AntennaCalibration(file_path=antex_path, use_binary_cache=True, cache_dir=tmp_path)
+    written = parsed.data["G01"][datetime(1992, 11, 22)]["valid_until"]
+    cached = AntennaCalibration(file_path=antex_path, use_binary_cache=True, cache_dir=tmp_path)
+    assert isinstance(cached._pcv_values, np.memmap)
+    assert cached.data["G01"][datetime(1992, 11, 22)]["valid_until"] > written
+
+
 #
 # TEST AUXILIARY FUNCTIONS
 #
@@ -115,3 +181,39 @@ def test__used_date(ant, date, satellite, expected_used_date):
     """
     used_date = ant._used_date(date, satellite)
     assert used_date == expected_used_date
+
+
+def test__used_dates(ant):
+    """Test of _used_dates() function
+    """
+    # Add a second validity period for satellite G01
+    period = dict(ant.data["G01"][datetime(1992, 11, 22)], sat_type="BLOCK IIR-M", valid_until=datetime(2030, 1, 1))
+    ant.data["G01"][datetime(2009, 3, 24)] = period
+    ant._build_satellite_index()
+
+    dates = np.array([datetime(1993, 2, 1), datetime(2010, 1, 1, 12), datetime(1990, 1, 1), datetime(2010, 1, 1)])
+    satellites = np.array(["G01", "G01", "G01", "E11"])
+    with pytest.warns(UserWarning):
+        used_dates = ant._used_dates(dates, satellites)
+    assert list(used_dates) == [0, 1, -1, -1]
+
+    with pytest.warns(UserWarning):
+        types = ant.get_satellite_type(dates, satellites)
+    assert types == ["BLOCK IIA", "BLOCK IIR-M", 0, 0]
+
+    with pytest.warns(UserWarning):
+        pco = ant.get_pco_sat(dates, "G", "L1", satellites)
+    np.testing.assert_allclose(pco[:2], [[0.279, 0.0, 2.3195]] * 2, rtol=0, atol=1e-5)
+    assert np.all(np.isnan(pco[2:]))
+
+
+@pytest.mark.parametrize("frequency", ["L1", ["L1", "L2"]])
+def test_get_pco_sat_array(ant, frequency):
+    """Test that get_pco_sat() for arrays of satellites gives the same PCOs as for single satellites
+    """
+    date = datetime(1993, 2, 1)
+    with pytest.warns(UserWarning, match="G02"):
+        pco = ant.get_pco_sat(date, "G", frequency, np.array(["G01", "G02", "G01"]))
+    expected_pco = ant.get_pco_sat(date, "G", frequency, "G01")
+    np.testing.assert_allclose(pco[[0, 2]], [expected_pco] * 2, rtol=0, atol=1e-12)
+    assert np.all(np.isnan(pco[1]))
@@ -0,0 +1,74 @@
+""" Tests for the midgard.gnss.broadcast_ephemeris module"""
+
+# Standard library imports
+import pathlib
+
+# Third party imports
+import numpy as np
+import pytest
+
+# Midgard imports
+from midgard import parsers
+from midgard.gnss import broadcast_ephemeris
+from midgard.gnss.broadcast_ephemeris import BroadcastEphemeris
+
+
+@pytest.fixture
+def ephemeris():
+    file_path = pathlib.Path(__file__).parent.parent / "parsers" / "example_files" / "rinex3_nav"
+    dset = parsers.parse_file("rinex3_nav", file_path=file_path).as_dataset()
+    return BroadcastEphemeris(dset), dset
+
+
+def test_select_records(ephemeris):
+    eph, dset = ephemeris
+    idx = eph.select_records(dset.toe, dset.satellite)
+    assert np.all(eph._satellite[idx] == dset.satellite)
+    assert np.allclose(eph._toe[idx], broadcast_ephemeris._gps_seconds(dset.toe))
+
+    # Times before first record use first record, unknown satellites are marked with -1
+    first = eph._toe[eph._satellite == "G01"]
+    idx = eph.select_records(np.array([first.min() - 3600, first.max() + 10, first.max()]), np.array(["G01"] * 3))
+    assert np.allclose(eph._toe[idx], [first.min(), first.max(), first.max()])
+    assert eph.select_records(np.array([first.min()]), np.array(["G32"]))[0] == -1
+
+
+def test_satellite_position_radius(ephemeris):
+    eph, dset = ephemeris
+    pos, clk = eph.satellite_position(dset.toe, dset.satellite)
+    radius = np.linalg.norm(pos, axis=1)
+    assert np.all(radius[dset.system == "G"] == pytest.approx(26560e3, rel=0.01))
+    assert np.all(radius[np.isin(dset.satellite, ["E01", "E05"])] == pytest.approx(29600e3, rel=0.01))
+    assert np.all(radius[np.isin(dset.satellite, ["C01"])] == pytest.approx(42164e3, rel=0.01))
+    assert np.allclose(clk, dset.sat_clock_bias, atol=1e-6)
+
+
+def test_satellite_position_vectorized(ephemeris):
+    eph, dset = ephemeris
+    t0 = broadcast_ephemeris._gps_seconds(dset.toe).min()
+    time = t0 + np.arange(300) * 30.0
+    satellites = np.array(["G01", "E05", "C01", "C12", "J01", "G02"])[np.arange(300) % 6]
+    pos, clk = eph.satellite_position(time, satellites)
+
+    for i in (0, 1, 2, 3, 4, 151):
+        pos_i, clk_i = eph.satellite_position(time[i : i + 1], satellites[i : i + 1])
+        assert np.allclose(pos_i[0], pos[i])
+        assert np.allclose(clk_i[0], clk[i])
+    assert np.all(np.isnan(pos[satellites == "G02"]))
+    assert not np.any(np.isnan(pos[satellites != "G02"]))
+
+
+def test_max_age(ephemeris):
+    eph, dset = ephemeris
+    eph.max_age = 3600
+    t0 = broadcast_ephemeris._gps_seconds(dset.toe[dset.satellite == "G01"]).max()
+    pos, _ = eph.satellite_position(np.array([t0 + 1800, t0 + 7200]), np.array(["G01", "G01"]))
+    assert not np.any(np.isnan(pos[0]))
+    assert np.all(np.isnan(pos[1]))
+
+
+def test_solve_kepler():
+    mean_anomaly = np.linspace(-np.pi, 3 * np.pi, 101)
+    e = np.full(mean_anomaly.shape, 0.2)
+    ecc_anomaly = broadcast_ephemeris._solve_kepler(mean_anomaly, e)
+    assert np.allclose(ecc_anomaly - e * np.sin(ecc_anomaly), mean_anomaly, atol=1e-12)
@@ -0,0 +1,38 @@
+""" Tests for the midgard.gnss.compute_dops module"""
+
+# Third party imports
+import numpy as np
+
+# Midgard imports
+from midgard.gnss import compute_dops
+
+
+def test_compute_dops_batch():
+    """Test that DOPs for several epochs equals DOPs computed epoch by epoch"""
+    rng = np.random.default_rng(42)
+    epochs = np.repeat([10.0, 20.0, 30.0], [6, 8, 3])
+    az = rng.uniform(0, 2 * np.pi, len(epochs))
+    el = rng.uniform(0.1, np.pi / 2, len(epochs))
+
+    dops = compute_dops.compute_dops_batch(epochs, az, el)
+    for idx, epoch in enumerate([10.0, 20.0]):
+        idx_epoch = epochs == epoch
+        expected = compute_dops.compute_dops(az[idx_epoch], el[idx_epoch])
+        assert np.allclose([dop[idx] for dop in dops], expected)
+
+    # Only 3 satellites in last epoch
+    assert all(np.isnan(dop[2]) for dop in dops)
+
+
+def test_compute_dops_batch_weights():
+    """Test that equal weights do not change the DOPs, while elevation-dependent weights do"""
+    rng = np.random.default_rng(42)
+    epochs = np.repeat([10.0, 20.0], [6, 8])
+    az = rng.uniform(0, 2 * np.pi, len(epochs))
+    el = rng.uniform(0.1, np.pi / 2, len(epochs))
+
+    gdop, *_ = compute_dops.compute_dops_batch(epochs, az, el)
+    gdop_equal, *_ = compute_dops.compute_dops_batch(epochs, az, el, weights=np.ones(len(epochs)))
+    gdop_el, *_ = compute_dops.compute_dops_batch(epochs, az, el, weights=lambda el: np.sin(el) ** 2)
+    assert np.allclose(gdop, gdop_equal)
+    assert np.all(gdop_el > gdop)
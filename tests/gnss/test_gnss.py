@@ -1,5 +1,7 @@
 """ Tests for the midgard.gnss.gnss module"""
 
+# Third party imports
+import numpy as np
 
 # Midgard imports
 from midgard.gnss import gnss
@@ -8,3 +10,18 @@ from midgard.gnss import gnss
 def test_obstype_to_freq():
     freq = gnss.obstype_to_freq("E", "C1C")
     assert freq == 1575.42e6
+
+
+def test_count_per_group():
+    systems = np.array(["G", "E", "G", "G", "E", "G"])
+    epochs = np.array([1, 1, 1, 2, 2, 2])
+    assert np.array_equal(gnss.count_per_group(systems, epochs), [2, 1, 2, 2, 1, 2])
+    assert np.array_equal(gnss.count_per_group(epochs), [3, 3, 3, 3, 3, 3])
+
+
+def test_get_number_of_satellites():
+    systems = np.array(["G", "E", "G", "G", "E", "G", "G"])
+    satellites = np.array(["G01", "E11", "G02", "G01", "E11", "G02", "G03"])
+    epochs = np.array([1, 1, 1, 2, 2, 2, 2])
+    num_satellites = gnss.get_number_of_satellites(systems, satellites, epochs)
+    assert np.array_equal(num_satellites, [2, 1, 2, 3, 1, 3, 3])
@@ -0,0 +1,40 @@
+"""Test that heavy initialisation is not done when Midgard modules are imported"""
+
+# Standard library imports
+import subprocess
+import sys
+
+# Third party imports
+import pytest
+
+LAZY_MODULES = ("pint", "scipy", "statsmodels", "h5py", "pandas")
+
+
+@pytest.mark.parametrize(
+    "module",
+    (
+        "midgard.math.unit",
+        "midgard.math.interpolation",
+        "midgard.math.spatial_interpolation",
+        "midgard.math.linear_regression",
+        "midgard.data.time",
+        "midgard.data.dataset",
+    ),
+)
+def test_no_heavy_imports(module):
+    """Test that importing a module does not import heavy third party packages"""
+    code = f"import sys, {module}; print(' '.join(m for m in {LAZY_MODULES} if m in sys.modules))"
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+    assert output.split() == []
+
+
+def test_unit_registry_on_first_use():
+    """Test that the unit registry and leap second table are only initialised when first used"""
+    code = (
+        "from midgard.math.unit import Unit; from midgard.data import _time, time; "
+        "print(Unit._registry is None, _time._tai_utc.cache_info().currsize); "
+        "Unit('km', 'm'); time.Time(58000, scale='utc', fmt='mjd').tai; "
+        "print(Unit._registry is None, _time._tai_utc.cache_info().currsize)"
+    )
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+    assert output.split() == ["True", "0", "False", "1"]
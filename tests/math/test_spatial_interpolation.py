@@ -0,0 +1,70 @@
+"""Tests for the math.spatial_interpolation-module
+
+"""
+# Third party imports
+import pytest
+import numpy as np
+
+# Midgard imports
+from midgard.dev import exceptions
+from midgard.math import spatial_interpolation
+
+
+@pytest.fixture
+def grid():
+    """A regular grid stored from north to south, like GRAVSOFT grids"""
+    x = np.linspace(4, 8, 9)
+    y = np.linspace(62, 58, 5)
+    grid_x, grid_y = np.meshgrid(x, y)
+    values = 2 * grid_x - 3 * grid_y
+    return grid_x, grid_y, values
+
+
+@pytest.mark.parametrize("kind", spatial_interpolation.interpolators())
+def test_interpolator_same_as_interpolate(grid, kind):
+    """Test that the built interpolator gives the same result as interpolate"""
+    grid_x, grid_y, values = grid
+    x, y = 5.3, 60.1
+    expected = spatial_interpolation.interpolate(grid_x, grid_y, values, x, y, kind=kind)
+    ip = spatial_interpolation.interpolator(grid_x, grid_y, values, kind=kind)
+    assert np.allclose(ip(x, y), expected)
+
+
+@pytest.mark.parametrize("kind", spatial_interpolation.interpolators())
+def test_interpolator_arrays(grid, kind):
+    """Test that the built interpolator handles arrays of data points"""
+    grid_x, grid_y, values = grid
+    x = np.linspace(4.2, 7.8, 7)
+    y = np.linspace(58.1, 61.9, 7)
+    ip = spatial_interpolation.interpolator(grid_x, grid_y, values, kind=kind)
+    assert np.allclose(ip(x, y), 2 * x - 3 * y)
+
+
+def test_interpolator_is_cached(grid):
+    """Test that an interpolator is only built once for the same grid"""
+    grid_x, grid_y, values = grid
+    spatial_interpolation.clear_cache()
+    first = spatial_interpolation._build("griddata", grid_x, grid_y, values)
+    second = spatial_interpolation._build("griddata", grid_x, grid_y, values)
+    other = spatial_interpolation._build("griddata", grid_x, grid_y, values.copy())
+    assert first is second
+    assert first is not other
+
+
+def test_interpolator_bounds_error(grid):
+    """Test boundary checking of arrays of data points"""
+    grid_x, grid_y, values = grid
+    x = np.array([5.0, 9.0])
+    y = np.array([60.0, 60.0])
+    with pytest.raises(ValueError):
+        spatial_interpolation.interpolator(grid_x, grid_y, values, kind="griddata")(x, y)
+
+    result = spatial_interpolation.interpolator(grid_x, grid_y, values, kind="griddata", bounds_error=False)(x, y)
+    assert np.isclose(result[0], 2 * 5.0 - 3 * 60.0)
+    assert np.isnan(result[1])
+
+
+def test_interpolator_non_existing(grid):
+    """Test that calling a non-existing interpolator raises an error"""
+    with pytest.raises(exceptions.UnknownPluginError):
+        spatial_interpolation.interpolator(*grid, kind="non_existing")
@@ -17,6 +17,7 @@ import pytest
 
 # Midgard imports
 from midgard import parsers
+from midgard.data import dataset
 
 
 def get_parser(parser_name, example_path = None):
@@ -50,6 +51,70 @@ def test_list_of_parsers():
 #     assert isinstance(parser, Parser)
 
 
+def test_chain_parser(tmpdir):
+    """Test that ChainParser parses fixed-width and delimited fields and switches parsers by end marker"""
+    from midgard.parsers import ChainParser, ParserDef
+
+    file_path = tmpdir.join("chain")
+    file_path.write("HEAD one  two\nEND\nDATA 1;2;3\nSKIP this\nDATA 4;5;6\n")
+
+    class TestParser(ChainParser):
+        def setup_parser(self):
+            save = lambda values, cache: self.data.setdefault("lines", list()).append(values)
+            header = ParserDef(
+                end_marker=lambda line, _ln, next_line: next_line.startswith("DATA"),
+                label=lambda line, _ln: line[:4],
+                parser_def={"HEAD": {"parser": save, "fields": {"first": (5, 10), "second": (10, 13)}}},
+            )
+            data = ParserDef(
+                end_marker=lambda _l, _ln, _n: False,
+                label=lambda line, _ln: line[:4],
+                skip_line=lambda line: line.startswith("SKIP"),
+                parser_def={
+                    "DATA": {"parser": save, "fields": [None, "a", "b", "c"], "delimiter": r"[ ;]", "strip": " "}
+                },
+            )
+            return [header, data]
+
+    parser = TestParser(file_path).parse()
+    assert parser.data["lines"] == [
+        {"first": "one", "second": "two"},
+        {"a": "1", "b": "2", "c": "3"},
+        {"a": "4", "b": "5", "c": "6"},
+    ]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_parse_files(workers):
+    """Test that parsing several files gives datasets in input order"""
+    file_path = pathlib.Path(__file__).parent / "example_files" / "rinex3_nav"
+    dset = parsers.parse_file("rinex3_nav", file_path).as_dataset()
+
+    dsets = parsers.parse_files("rinex3_nav", [file_path, file_path.with_name("missing")], workers=workers)
+    assert dsets[1] is None
+    assert np.all(dsets[0].satellite == dset.satellite)
+    assert np.allclose(dsets[0].toe.mjd, dset.toe.mjd)
+
+    merged = parsers.parse_files("rinex3_nav", [file_path, file_path], workers=workers, merge=True)
+    assert merged.num_obs == 2 * dset.num_obs
+    assert np.all(merged.satellite[dset.num_obs :] == dset.satellite)
+
+
+def test_merge_datasets():
+    """Test that merging datasets keeps the observations in input order"""
+    dsets = list()
+    for start in range(0, 15, 3):
+        dset = dataset.Dataset(num_obs=3)
+        dset.add_float("idx", val=np.arange(start, start + 3))
+        dset.meta["last"] = start
+        dsets.append(dset)
+
+    merged = parsers._merge_datasets(dsets)
+    assert merged.num_obs == 15
+    assert np.all(merged.idx == np.arange(15))
+    assert merged.meta["last"] == 12
+
+
 @pytest.mark.skip(reason="Caching not yet implemented")
 def test_caching_parser():
     """Test that caching results from parser works"""
@@ -304,6 +369,47 @@ def test_parser_gravsoft_grid():
     assert 72.0 in parser["latitude"]
 
 
+def test_parser_gravsoft_grid_binary_cache(tmp_path):
+    """Test that gravsoft_grid writes and reads a memory mapped binary cache"""
+    file_path = tmp_path / "gravsoft_grid"
+    file_path.write_bytes((pathlib.Path(__file__).parent / "example_files" / "gravsoft_grid").read_bytes())
+
+    parsers.parse_file("gravsoft_grid", file_path)
+    assert not (tmp_path / "gravsoft_grid.mmap").exists()
+
+    text_data = parsers.parse_file("gravsoft_grid", file_path, use_binary_cache=True).as_dict()
+    assert (tmp_path / "gravsoft_grid.mmap").exists()
+
+    parser = parsers.parse_file("gravsoft_grid", file_path, use_binary_cache=True)
+    cached_data = parser.as_dict()
+    assert isinstance(cached_data["data"], np.memmap)
+    assert np.array_equal(text_data["data"], cached_data["data"])
+    assert np.array_equal(text_data["latitude"], cached_data["latitude"])
+
+    # Bilinear interpolation at and between grid points, unknown values and outside the grid gives NaN
+    assert parser.interpolate(72.0, 6.34) == pytest.approx(25.449)
+    assert np.allclose(
+        parser.interpolate([72.0, 72.0, 71.9975, 50.0], [6.34, 6.345, 6.34, 6.34]),
+        [25.449, 25.446, np.nan, np.nan],
+        equal_nan=True,
+    )
+
+
+def test_parser_gravsoft_grid_truncated_cache(tmp_path):
+    """Test that gravsoft_grid parses the grid file if the binary cache is truncated"""
+    file_path = tmp_path / "gravsoft_grid"
+    file_path.write_bytes((pathlib.Path(__file__).parent / "example_files" / "gravsoft_grid").read_bytes())
+    text_data = parsers.parse_file("gravsoft_grid", file_path).as_dict()
+    parsers.parse_file("gravsoft_grid", file_path, use_binary_cache=True)
+
+    cache_path = tmp_path / "gravsoft_grid.mmap"
+    truncated_path = tmp_path / "truncated.mmap"
+    truncated_path.write_bytes(cache_path.read_bytes()[:-8])
+    truncated_path.replace(cache_path)
+    cached_data = parsers.parse_file("gravsoft_grid", file_path, use_binary_cache=True).as_dict()
+    assert np.array_equal(text_data["data"], cached_data["data"], equal_nan=True)
+
+
 def test_parser_rinex2_nav():
     """Test that parsing rinex2_nav gives expected output"""
     parser = get_parser("rinex2_nav", pathlib.Path(__file__).parent / "example_files" / "rinex2_nav.19n").as_dict()
@@ -323,6 +429,55 @@ def test_parser_rinex2_obs():
     assert 24236245.742 in parser["obs"]["C1"]
 
 
+@pytest.mark.parametrize("sampling_rate", [None, 60])
+def test_parser_rinex2_obs_iter_epochs(sampling_rate):
+    """Test that reading rinex2_obs in chunks of epochs gives the same observations as reading the whole file"""
+    from midgard.parsers.rinex2_obs import Rinex2Parser
+
+    file_path = pathlib.Path(__file__).parent / "example_files" / "rinex2_obs"
+    dset = parsers.parse_file("rinex2_obs", file_path, sampling_rate=sampling_rate).as_dataset()
+    chunks = list(Rinex2Parser(file_path, sampling_rate=sampling_rate).iter_epochs(chunk_epochs=10))
+
+    assert len(chunks) > 1
+    assert all(len(np.unique(c.time.mjd)) <= 10 for c in chunks)
+    assert np.all(np.concatenate([c.satellite for c in chunks]) == dset.satellite)
+    assert np.allclose(np.concatenate([c.time.mjd for c in chunks]), dset.time.mjd)
+    assert np.allclose(np.concatenate([c.obs.C1 for c in chunks]), dset.obs.C1, equal_nan=True)
+
+
+@pytest.mark.parametrize("sampling_rate, num_epochs", [(None, 4), (600, 2)])
+def test_parser_rinex3_obs_iter_epochs(sampling_rate, num_epochs):
+    """Test that reading rinex3_obs in chunks of epochs gives the same observations as reading the whole file"""
+    from midgard.parsers.rinex3_obs import Rinex3Parser
+
+    file_path = pathlib.Path(__file__).parent / "example_files" / "rinex3_obs"
+    dset = parsers.parse_file("rinex3_obs", file_path, sampling_rate=sampling_rate).as_dataset()
+    chunks = list(Rinex3Parser(file_path, sampling_rate=sampling_rate).iter_epochs(chunk_epochs=1))
+
+    assert len(chunks) == num_epochs
+    assert all(len(np.unique(c.time.mjd)) == 1 for c in chunks)
+    assert np.all(np.concatenate([c.satellite for c in chunks]) == dset.satellite)
+    assert np.allclose(np.concatenate([c.time.mjd for c in chunks]), dset.time.mjd)
+    assert np.allclose(np.concatenate([c.obs.C1C for c in chunks]), dset.obs.C1C, equal_nan=True)
+
+
+@pytest.mark.parametrize("sampling_rate, num_epochs", [(None, 4), (600, 2)])
+def test_parser_rinex_iter_epochs(sampling_rate, num_epochs):
+    """Test that RinexParser.iter_epochs gives the same data as reading the whole file"""
+    from midgard.parsers.wip_rinex3_obs import Rinex3ObsParser
+
+    file_path = pathlib.Path(__file__).parent / "example_files" / "rinex3_obs"
+    data = parsers.parse_file("wip_rinex3_obs", file_path, sampling_rate=sampling_rate).data
+    chunks = list(Rinex3ObsParser(file_path, sampling_rate=sampling_rate).iter_epochs(chunk_epochs=1))
+
+    assert len(chunks) == num_epochs
+    for system, sys_data in data.items():
+        sys_chunks = [c[system] for c in chunks if system in c]
+        assert all(len(np.unique(c["epoch"])) == 1 for c in sys_chunks)
+        for field, values in sys_data.items():
+            np.testing.assert_array_equal(np.concatenate([c[field] for c in sys_chunks]), values)
+
+
 def test_parser_rinex3_nav():
     """Test that parsing rinex3_nav gives expected output"""
     parser = get_parser("rinex3_nav").as_dict()
@@ -332,6 +487,41 @@ def test_parser_rinex3_nav():
     assert "G" in parser["system"]
 
 
+def test_parser_rinex3_nav_time_system_correction():
+    """Test that BeiDou navigation epochs and weeks are referred to GPS time scale"""
+    data = get_parser("rinex3_nav").data
+    idx = np.array(data["system"]) == "C"
+
+    assert np.all(data["gnss_week"][idx] == 1986)
+    assert np.allclose(data["toe"].gps_ws.seconds[idx], [432014, 435614, 439214, 432014, 435614])
+    assert data["time"][idx][0].datetime == datetime(2018, 2, 2, 0, 0, 14)
+    assert np.all(data["time"].gps_ws.week == 1986)
+
+
+def test_parser_rinex3_obs_hatanaka():
+    """Test that parsing a compact RINEX file gives the same observations as the RINEX file"""
+    example_files = pathlib.Path(__file__).parent / "example_files"
+    dset = get_parser("rinex3_obs").as_dataset()
+    dset_crx = get_parser("rinex3_obs", example_files / "rinex3_obs.crx").as_dataset()
+
+    assert dset_crx.num_obs == dset.num_obs
+    assert np.all(dset_crx.satellite == dset.satellite)
+    assert np.allclose(dset_crx.obs.C1C, dset.obs.C1C, equal_nan=True)
+
+
+def test_parser_rinex2_obs_hatanaka():
+    """Test that parsing a compact RINEX 1.0 file gives the same observations as the RINEX 2 file"""
+    example_files = pathlib.Path(__file__).parent / "example_files"
+    dset = get_parser("rinex2_obs", example_files / "rinex2_obs_short").as_dataset()
+    dset_crx = get_parser("rinex2_obs", example_files / "rinex2_obs_short.18d").as_dataset()
+
+    assert dset_crx.num_obs == dset.num_obs
+    assert np.all(dset_crx.satellite == dset.satellite)
+    assert np.allclose(dset_crx.time.mjd, dset.time.mjd)
+    for obstype in ("C1", "P2", "L1", "L5", "D1", "S2"):
+        assert np.allclose(dset_crx.obs[obstype], dset.obs[obstype], equal_nan=True)
+
+
 @pytest.mark.skip(reason="New Rinex3 parser not yet implemented")
 def test_parser_wip_rinex3_obs():
     """Test that parsing rinex3_obs gives expected output"""
@@ -394,6 +584,38 @@ def test_parser_sp3():
     assert "system" in parser
     assert "G" in parser["system"][0]
     
+def test_parser_sp3_several_files():
+    """Test that parsing several sp3 files skips identical epochs and sorts epochs"""
+    example_dir = pathlib.Path(__file__).parent / "example_files"
+    parser_sp3c = get_parser("sp3", example_dir / "sp3c").as_dict()
+    parser_sp3d = get_parser("sp3", example_dir / "sp3d").as_dict()
+    parser = parsers.parse_file("sp3", [example_dir / "sp3d", example_dir / "sp3c", example_dir / "sp3d"]).as_dict()
+
+    assert len(parser["time"]) == len(parser_sp3c["time"]) + len(parser_sp3d["time"])
+    assert np.all(parser["time"][:-1] <= parser["time"][1:])
+    assert sorted(parser["satellite"][: len(parser_sp3c["time"])]) == sorted(parser_sp3c["satellite"])
+
+
+def test_parser_sp3_orbit_cube():
+    """Test that sp3 data can be returned as dense epoch x satellite arrays"""
+    parser = get_parser("sp3", pathlib.Path(__file__).parent / "example_files" / "sp3d")
+    data = parser.as_dict()
+    cube = parser.as_orbit_cube()
+
+    num_epochs, num_satellites = len(np.unique(data["time"])), len(np.unique(data["satellite"]))
+    assert cube["sat_pos"].shape == (num_epochs, num_satellites, 3)
+    assert cube["sat_clock_bias"].shape == (num_epochs, num_satellites)
+    assert len(cube["time"]) == num_epochs
+
+    idx_sat = cube["satellite_idx"][data["satellite"][0]]
+    assert np.allclose(cube["sat_pos"][0, idx_sat], data["sat_pos"][0])
+
+    # Satellites not given in the SP3 file give NaN columns
+    cube = parser.as_orbit_cube(satellites=["G99", data["satellite"][0]])
+    assert np.all(np.isnan(cube["sat_pos"][:, 0]))
+    assert np.allclose(cube["sat_pos"][0, 1], data["sat_pos"][0])
+
+
 def test_parser_sp3_with_velocity():
     """Test that parsing sp3 gives expected output"""
     parser = get_parser("sp3", pathlib.Path(__file__).parent / "example_files" / "sp3d_with_velocity").as_dict()
@@ -402,6 +624,26 @@ def test_parser_sp3_with_velocity():
     assert "sat_vel" in parser
     assert len(parser["sat_vel"]) == 1
 
+
+def test_parser_sp3_with_missing_velocity(tmp_path):
+    """Test that velocities are given for the same rows as positions, if velocity records are missing"""
+    lines = (pathlib.Path(__file__).parent / "example_files" / "sp3d_with_velocity").read_text().splitlines()
+    epoch_idx = next(idx for idx, line in enumerate(lines) if line.startswith("*"))
+    pos_l01, vel_l01 = lines[epoch_idx + 1 : epoch_idx + 3]
+    pos_l02, vel_l02 = (line[:1] + "L02" + line[4:] for line in (pos_l01, vel_l01))
+    lines[2] = lines[2].replace("+    1   L01  0", "+    2   L01L02")
+    epoch_2 = lines[epoch_idx].replace(" 0 18.00000000", " 1 18.00000000")
+    lines[epoch_idx:] = [lines[epoch_idx], pos_l01, vel_l01, pos_l02, epoch_2, pos_l01, pos_l02, vel_l02, "EOF"]
+    file_path = tmp_path / "sp3d_with_missing_velocity"
+    file_path.write_text("\n".join(lines) + "\n")
+
+    expected_vel = get_parser("sp3", pathlib.Path(__file__).parent / "example_files" / "sp3d_with_velocity").as_dict()
+    parser = parsers.parse_file("sp3", file_path).as_dict()
+    assert list(parser["satellite"]) == ["L01", "L02", "L01", "L02"]
+    assert parser["sat_vel"].shape == parser["sat_pos"].shape
+    assert np.all(np.isnan(parser["sat_vel"][[1, 2]]))
+    assert np.allclose(parser["sat_vel"][[0, 3]], expected_vel["sat_vel"][0])
+
 def test_parser_spring_csv():
     """Test that parsing spring_csv gives expected output"""
     parser = get_parser("spring_csv").as_dict()
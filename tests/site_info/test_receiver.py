@@ -6,6 +6,7 @@ Note: pytest can be started with commando:
 """
 
 import datetime
+import numpy as np
 import pytest
 
 from midgard.dev.exceptions import MissingDataError
@@ -104,6 +105,65 @@ def test_receiver_history_sinex_two_stations_error(sinex_data):
     with pytest.raises(MissingDataError):
         r = Receiver.get_history("snx", sinex_data, "zimm, xxxx", source_path="/path/to/sinex")
 
+@pytest.mark.usefixtures("sinex_data")
+def test_receiver_history_sinex_get_many(sinex_data):
+    r = Receiver.get_history("snx", sinex_data, "zimm", source_path="/path/to/sinex")["zimm"]
+    dates = [
+        datetime.datetime(1990, 1, 1),
+        datetime.datetime(1993, 5, 1),
+        datetime.datetime(1997, 8, 5, 23, 59),
+        datetime.datetime(1997, 8, 6),
+        datetime.datetime(2006, 2, 22, 10, 0),  # Gap in history
+        datetime.datetime(2020, 1, 1),
+    ]
+    infos = r.get_many(dates)
+    assert infos == [r.get(d) for d in dates]
+    assert [i.firmware if i else None for i in infos] == [None, "6.12", "6.12", "7.25", None, "5.37"]
+
+    infos = r.get_many(np.array(dates, dtype="datetime64[us]"))
+    assert [i.firmware if i else None for i in infos] == [None, "6.12", "6.12", "7.25", None, "5.37"]
+
+    # Overlapping intervals are scanned in order of the history
+    r.history[(datetime.datetime(1990, 1, 1), datetime.datetime(1993, 6, 1))] = r.get(datetime.datetime(2020, 1, 1))
+    assert [i.firmware if i else None for i in r.get_many(dates)] == ["5.37", "6.12", "6.12", "7.25", None, "5.37"]
+
+@pytest.mark.usefixtures("sinex_data")
+def test_receiver_history_sinex_get_many_empty(sinex_data):
+    r = Receiver.get_history("snx", sinex_data, "zimm", source_path="/path/to/sinex")["zimm"]
+    dates = np.array([datetime.datetime(2000, 1, 1), datetime.datetime(2020, 1, 1)], dtype="datetime64[us]")
+
+    # History with only empty intervals
+    r.history = {(datetime.datetime(2000, 1, 1), datetime.datetime(2000, 1, 1)): r.get("last")}
+    assert r.get_many(dates) == [None, None]
+
+    r.history = {}
+    assert r.get_many(dates) == [None, None]
+    assert r.get(datetime.datetime(2000, 1, 1)) is None
+
+@pytest.mark.usefixtures("sinex_data")
+def test_receiver_history_sinex_get_replaced_entry(sinex_data):
+    r = Receiver.get_history("snx", sinex_data, "zimm", source_path="/path/to/sinex")["zimm"]
+    assert r.get(datetime.datetime(1995, 1, 1)).firmware == "6.12"
+
+    # Replace an entry by an entry with other dates, keeping the number of entries
+    info = r.history.pop((datetime.datetime(1993, 5, 1), datetime.datetime(1997, 8, 6)))
+    r.history[(datetime.datetime(1994, 1, 1), datetime.datetime(1997, 8, 6))] = info
+    assert r.get(datetime.datetime(1993, 6, 1)) is None
+    assert r.get(datetime.datetime(1995, 1, 1)).firmware == "6.12"
+
+
+def test_receiver_history_sinex_get_changed_in_place(sinex_data):
+    r = Receiver.get_history("snx", sinex_data, "zimm", source_path="/path/to/sinex")["zimm"]
+    r.history = dict(r.history)  # History given as plain dictionary
+    assert r.get(datetime.datetime(1995, 1, 1)).firmware == "6.12"
+
+    key = (datetime.datetime(1993, 5, 1), datetime.datetime(1997, 8, 6))
+    info = r.history[key]
+    del r.history[key]
+    assert r.get(datetime.datetime(1995, 1, 1)) is None
+    r.history.update({key: info})
+    assert r.get(datetime.datetime(1995, 1, 1)).firmware == "6.12"
+
 # Tests: Receiver.get("ssc",...)
 
 @pytest.mark.usefixtures("ssc_data")
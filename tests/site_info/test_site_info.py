@@ -59,6 +59,29 @@ def test_site_info_sinex_last_entry(sinex_data):
     assert "zimm" in si
     assert si["zimm"]["antenna"].date_to == datetime.datetime(9999, 12, 31, 23, 59, 59, 999999)
 
+# Tests: SiteInfo.get_many("snx",...)
+
+@pytest.mark.usefixtures("sinex_data")
+def test_site_info_sinex_many(sinex_data):
+    dates = [datetime.datetime(2000, 1, 1), datetime.datetime(2020, 1, 1)]
+    si = site_info.SiteInfo.get_many("snx", sinex_data, "zimm,hrao", dates, source_path="path/to/sinex")
+    assert set(si) == {"zimm", "hrao"}
+
+    for sta in si:
+        for date_idx, date in enumerate(dates):
+            si_date = site_info.SiteInfo.get("snx", sinex_data, sta, date, source_path="path/to/sinex")[sta]
+            for module in ["antenna", "eccentricity", "receiver", "site_coord"]:
+                info, info_date = si[sta][module], si_date[module]
+                info = info[date_idx] if info is not None else None
+                assert repr(info) == repr(info_date)
+        assert si[sta]["identifier"].station == sta
+
+@pytest.mark.usefixtures("sinex_data")
+def test_site_info_sinex_many_error(sinex_data):
+    # station xxxx does not exist
+    with pytest.raises(MissingDataError):
+        si = site_info.SiteInfo.get_many("snx", sinex_data, "zimm, xxxx", [datetime.datetime(2020, 1, 1)])
+
 # Tests: SiteInfo.get_history("snx",...)
 
 @pytest.mark.usefixtures("sinex_data")
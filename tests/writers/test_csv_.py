@@ -0,0 +1,83 @@
+"""Tests for the writers.csv_-module
+
+Example:
+--------
+    python -m pytest test_csv_.py
+"""
+# Standard library imports
+import gzip
+
+# Third party imports
+import numpy as np
+import pytest
+
+# Midgard imports
+from midgard.data import dataset
+from midgard.writers import csv_
+
+
+#
+# TEST DATA
+#
+EXPECTED_LINES = [
+    "date,satellite,counter,amplitude,mjd",
+    "2023-01-01 06:00:00,C04,4,4.57,59945.250000",
+    "2023-01-01 23:59:59,E02,2,2.35,59946.000000",
+    "2023-01-02 00:00:00,G01,1,1.23,59946.000000",
+    "2023-01-02 00:00:00,R03,3,3.46,59946.000000",
+    "2023-01-02 00:00:00,G05,5,5.68,59946.000000",
+]
+
+
+@pytest.fixture
+def dset():
+    """Dataset with epochs close to midnight, not sorted by date and with the same date given for several epochs"""
+    dset = dataset.Dataset(num_obs=5)
+    jd2 = np.array([0.5, 0.4999999, 0.5 - 3e-12, -0.25, 0.5])  # Second and third epoch less than a second to midnight
+    dset.add_time("time", val=np.full(5, 2459946.0), val2=jd2, scale="utc", fmt="jd")
+    dset.add_text("satellite", val=["G01", "E02", "R03", "C04", "G05"])
+    dset.add_float("counter", val=np.array([1, 2, 3, 4, 5]))
+    dset.add_float("amplitude", val=np.array([1.234, 2.345, 3.456, 4.567, 5.678]))
+
+    return dset
+
+
+def fields():
+    """Fields written to CSV file, defined anew for each call as the writer updates the dictionary"""
+    return {"date": "s", "satellite": "s", "counter": "d", "amplitude": ".2f", "time.mjd": ".6f"}
+
+
+#
+# TESTS
+#
+def test_csv_(dset, tmp_path):
+    """Test that rows are sorted by date, keep input order for equal dates and are formatted by field formats"""
+    file_path = tmp_path / "test.csv"
+    csv_.csv_(dset, file_path, fields())
+
+    assert file_path.read_text().splitlines() == EXPECTED_LINES
+
+
+def test_csv_gzip(dset, tmp_path):
+    """Test that a CSV file with suffix .gz is gzipped"""
+    file_path = tmp_path / "test.csv.gz"
+    csv_.csv_(dset, file_path, fields())
+
+    with gzip.open(file_path, mode="rt") as fid:
+        assert fid.read().splitlines() == EXPECTED_LINES
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 5])
+def test_csv_chunks(dset, tmp_path, monkeypatch, chunk_size):
+    """Test that writing in chunks of rows gives the same file for datasets larger than the chunks"""
+    monkeypatch.setattr(csv_, "CHUNK_SIZE", chunk_size)
+    file_path = tmp_path / "test.csv"
+    csv_.csv_(dset, file_path, fields())
+
+    assert file_path.read_text().splitlines() == EXPECTED_LINES
+
+
+def test_format_dates(dset):
+    """Test that dates are rounded to microseconds before they are truncated to seconds, as for Time.datetime"""
+    expected = [d.strftime("%Y-%m-%d %H:%M:%S") for d in dset.time.datetime]
+    assert csv_._format_dates(dset.time).tolist() == expected
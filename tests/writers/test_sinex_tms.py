@@ -0,0 +1,63 @@
+"""Tests for the writers.sinex_tms-module
+
+Example:
+--------
+    python -m pytest test_sinex_tms.py
+"""
+# Standard library imports
+from datetime import datetime
+import pathlib
+
+# Third party imports
+import numpy as np
+import pytest
+
+# Midgard imports
+from midgard.data import dataset
+from midgard.writers import sinex_tms
+
+
+#
+# TEST DATA
+#
+EXPECTED_FILE = pathlib.Path(__file__).parent / "example_files" / "sinex_tms_abcd.tms"
+
+
+@pytest.fixture
+def dset():
+    """Dataset with timeseries of two stations, not sorted by time and with an epoch given twice for station ABCD"""
+    dset = dataset.Dataset(num_obs=7)
+    dset.add_text("station", val=np.array(["abcd"] * 4 + ["efgh"] * 3))
+    dset.add_time("time", val=58000 + np.array([2, 0, 1, 0, 1, 0, 2]), scale="utc", fmt="mjd")
+    ref_pos = np.array([[3172000.0, 604000.0, 5481000.0]] * 4 + [[2102000.0, 721000.0, 5958000.0]] * 3)
+    site_pos = ref_pos + np.arange(21).reshape(-1, 3) * 1e-3
+    dset.add_position("obs.site_pos", val=site_pos, system="trs", time=dset.time)
+    for idx, coord in enumerate("xyz"):
+        dset.add_float(f"obs.site_pos_{coord}_sigma", val=np.arange(7) * 1e-4 + idx * 1e-3, unit="meter")
+    dset.add_float("obs.code_obs_num", val=np.array([102, 100, 101, 103, 201, 200, 202], dtype=float))
+
+    periods = [("2017-09-04T00:00:00", "2017-09-05T00:00:00"), ("2017-09-05T00:00:00", "2017-09-06T00:00:00")]
+    dset.meta["vel"] = dict(
+        trend=dict(x=dict(zip(periods, [0.01, 0.02]))),
+        trend_sigma=dict(x=dict(zip(periods, [0.001, 0.002]))),
+        bias=dict(x=0.3),
+        offset=dict(x={"2017-09-05T00:00:00": 0.05}),
+        interval=[(datetime(2017, 9, 4), datetime(2017, 9, 6))],
+    )
+    return dset
+
+
+#
+# TESTS
+#
+def test_sinex_tms(dset, tmp_path):
+    """Test that writing a SINEX TMS file gives the expected file
+
+    The first line is not compared, because it contains the creation time of the file.
+    """
+    file_path = tmp_path / "abcd.tms"
+    sinex_tms.sinex_tms(dset, "abcd", file_path, "a@b.no", "NMA", "NMA", "input", "org", "output", "sw", "001")
+
+    lines = file_path.read_text().splitlines()
+    assert lines[0].startswith("%=TMS 1.00 NMA ")
+    assert lines[1:] == EXPECTED_FILE.read_text().splitlines()